@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Metadata index of the images under img/ and the other static assets.
+
+For every PNG the index records byte size, intrinsic width and height (read
+from the IHDR header, without decoding the image), a content hash and the
+mtime. It is cached in .asset_index.json and refreshed incrementally: only
+files whose mtime or size changed are re-read. Generators call get() instead
+of probing the filesystem per page, and img_attrs() for width/height.
+
+Byte-identical files share one canonical path, the first in sort order;
+canonical() maps any path to it so pages reference (and browsers cache) a
+single copy.
+
+Usage: python asset_index.py   (refresh and list the index)
+"""
+import hashlib, json, os, struct, sys
+
+from outputs import file_digest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(ROOT, '.asset_index.json')
+IMG_DIRS = ('img/components', 'img/screens')
+# Other assets the pages link to, indexed for their content hash (see fingerprint.py)
+STATIC_FILES = ('style.css', 'tiles.js', 'search.js', 'inventory.js')
+INDEX_VERSION = 1
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+_index = None
+_canonical = None
+
+
+def png_size(path):
+    """(width, height) from a PNG's IHDR chunk, or None if `path` is not a PNG."""
+    with open(path, 'rb') as f:
+        head = f.read(24)
+    if len(head) < 24 or head[:8] != PNG_SIGNATURE or head[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', head[16:24])
+
+
+def _digest(path):
+    return file_digest(path, hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def refresh(entries):
+    """Bring `entries` up to date with the files on disk. Returns (entries, changed)."""
+    current = {}
+    changed = False
+    paths = [f'{d}/{name}' for d in IMG_DIRS for name in sorted(os.listdir(os.path.join(ROOT, d)))
+             if name.endswith('.png')]
+    for rel in paths + [f for f in STATIC_FILES if os.path.exists(os.path.join(ROOT, f))]:
+        path = os.path.join(ROOT, rel)
+        st = os.stat(path)
+        entry = entries.get(rel)
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['bytes'] == st.st_size:
+            current[rel] = entry
+            continue
+        dims = png_size(path)
+        current[rel] = {'bytes': st.st_size, 'mtime_ns': st.st_mtime_ns, 'hash': _digest(path),
+                        'width': dims[0] if dims else None, 'height': dims[1] if dims else None}
+        changed = True
+    return current, changed or current.keys() != entries.keys()
+
+
+def _save(entries):
+    # Per-process temp name: pool workers may refresh the index concurrently
+    tmp = f'{INDEX_PATH}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(json.dumps({'version': INDEX_VERSION, 'assets': entries}, indent=1, sort_keys=True))
+    os.replace(tmp, INDEX_PATH)
+
+
+def index():
+    """The refreshed index, {path: {bytes, width, height, hash, mtime_ns}}. Loaded once per process."""
+    global _index
+    if _index is None:
+        try:
+            with open(INDEX_PATH) as f:
+                cached = json.load(f)
+            entries = cached['assets'] if cached.get('version') == INDEX_VERSION else {}
+        except (OSError, ValueError):
+            entries = {}
+        _index, changed = refresh(entries)
+        if changed:
+            _save(_index)
+    return _index
+
+
+def get(path):
+    """Index entry for `path` relative to the repo root (e.g. 'img/components/button.png'), or None."""
+    return index().get(path)
+
+
+def duplicates():
+    """{canonical path: [byte-identical paths]} for every asset shipped more than once."""
+    by_hash = {}
+    for path, e in sorted(index().items()):
+        if e['bytes']:
+            by_hash.setdefault(e['hash'], []).append(path)
+    return {paths[0]: paths[1:] for paths in by_hash.values() if len(paths) > 1}
+
+
+def canonical(path):
+    """The canonical copy of `path`: itself unless an identical file sorts before it."""
+    global _canonical
+    if _canonical is None:
+        _canonical = {dup: first for first, dups in duplicates().items() for dup in dups}
+    return _canonical.get(path, path)
+
+
+def dedup_report():
+    """One line per collapsed duplicate plus the bytes a visitor no longer downloads twice."""
+    entries = index()
+    lines, saved = [], 0
+    for first, dups in duplicates().items():
+        for dup in dups:
+            lines.append(f'  {dup} -> {first}')
+            saved += entries[dup]['bytes']
+    n = sum(map(len, duplicates().values()))
+    lines.append(f'{n} duplicate asset{"s" if n != 1 else ""}, {saved:,} bytes saved')
+    return '\n'.join(lines)
+
+
+def img_attrs(entry):
+    """Intrinsic-size <img> attributes for an index entry, with a leading space, so the page reserves its box."""
+    if not entry or not entry['width']:
+        return ' decoding="async"'
+    return f' width="{entry["width"]}" height="{entry["height"]}" decoding="async"'
+
+
+def main():
+    entries = index()
+    for path, e in entries.items():
+        dims = f'{e["width"]:>5} x {e["height"]:<6}' if e['width'] else ' ' * 14
+        print(f'  {path:<40} {dims} {e["bytes"]:>10,} bytes  {e["hash"][:12]}')
+    print(f'\n{len(entries)} assets, {sum(e["bytes"] for e in entries.values()) / 1e6:.1f} MB')
+    print(dedup_report())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""Benchmarks for the inventory and page build scripts.
+
+Usage: python bench.py <benchmark> [args...]
+Run without arguments to list the available benchmarks.
+"""
+import json, os, random, re, subprocess, sys, tempfile, time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Component names in the style of the Internal Only Canvas page
+SAMPLE_NAMES = [
+    'Button', 'Text Input', 'Select', 'Accordion', 'Chip', 'Badge', 'Link - Standalone',
+    'Checkbox', 'Tabs', 'Tooltip [v1.1]', 'Action Menu', 'Counter Badge', 'Button Group',
+    'Snackbar', 'Toggle', 'Progress Circle', 'Avatar', 'Consumer NavBar', 'Footer',
+    'Alert / inpage', 'Modal', 'Bottom Sheet', 'Card (Product)', 'Progress Bar',
+    '.↪️ Icon / Arrow', 'icon/system/close', 'Direction/Caret down', 'Alle Logo', '_Primary options',
+    'Latisse brand mark', 'Image placeholder', 'Video player', 'Container / XLarge',
+    'Section spacer', 'Training Center hero', 'Live Events list', 'Medal 🏅 stamp', 'Misc frame',
+]
+
+
+def synthetic_export(path, n_lines, seed=0, pages=1):
+    """Write a Figma metadata export with roughly `n_lines` lines of XML text per page.
+
+    The text is streamed straight to disk with ASCII escaping, so it exercises
+    \\n, \\uXXXX and surrogate-pair escapes without holding the document in memory.
+    Node ids are unique across pages.
+    """
+    rng = random.Random(seed)
+    enc = json.JSONEncoder(ensure_ascii=True)
+    next_id = 1
+    total = 0
+    with open(path, 'w') as f:
+        f.write('[')
+        for page in range(pages):
+            written = 0
+            f.write(',\n' if page else '')
+            f.write(f'{{"type": "text", "name": "Page {page}", "text": ')
+            f.write(enc.encode(f'<canvas id="0:{page + 2}" name="Internal Only Canvas {page}">')[:-1])
+            while written < n_lines:
+                kind = 'symbol' if rng.random() < 0.3 else 'frame'
+                name = rng.choice(SAMPLE_NAMES)
+                nid = f'{40000000 + next_id}:{next_id}'
+                next_id += 1
+                if kind == 'symbol' or rng.random() < 0.1:
+                    block = [f'  <{kind} id="{nid}" name="{name}" x="0" y="0" width="320" height="48" />']
+                else:
+                    block = [f'  <{kind} id="{nid}" name="{name}" x="0" y="0" width="1440" height="900">']
+                    for _ in range(rng.randint(1, 40)):
+                        child = rng.choice(('symbol', 'instance', 'frame', 'text', 'rectangle'))
+                        cid = f'{40000000 + next_id}:{next_id}'
+                        next_id += 1
+                        if child == 'frame':
+                            block.append(f'    <frame id="{cid}" name="Size=Small, State=Enable" x="0" y="0" width="96" height="48">')
+                            for _ in range(rng.randint(0, 4)):
+                                gid = f'{40000000 + next_id}:{next_id}'
+                                next_id += 1
+                                block.append(f'      <text id="{gid}" name="Label" x="16" y="12" width="64" height="24" />')
+                            block.append('    </frame>')
+                        else:
+                            block.append(f'    <{child} id="{cid}" name="Type=Primary, State=Hover" x="0" y="0" width="96" height="48" />')
+                    block.append(f'  </{kind}>')
+                f.write(enc.encode('\n' + '\n'.join(block))[1:-1])
+                written += len(block)
+            f.write(enc.encode('\n</canvas>')[1:])
+            f.write('}')
+            total += written + 2
+        f.write(']')
+    return total
+
+
+def peak_rss_kib(cmd):
+    """Run `cmd` in a child process and return its peak resident set size in KiB."""
+    code = ('import resource, subprocess, sys;'
+            'subprocess.run(sys.argv[1:], check=True, stdout=subprocess.DEVNULL);'
+            'print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)')
+    out = subprocess.run([sys.executable, '-c', code, *cmd], check=True,
+                         capture_output=True, text=True)
+    return int(out.stdout.strip())
+
+
+def bench_parse_rss(argv):
+    """Peak RSS of parse_inventory.py, in-memory vs --stream, against export size."""
+    sizes = [int(a) for a in argv] or [100_000, 500_000, 1_000_000, 2_000_000]
+    script = os.path.join(ROOT, 'parse_inventory.py')
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'inventory.json')
+        print(f"{'lines':>10} {'export MB':>10} {'load RSS MB':>12} {'stream RSS MB':>14} {'load s':>8} {'stream s':>9}")
+        for n in sizes:
+            export = os.path.join(tmp, f'export_{n}.json')
+            synthetic_export(export, n)
+            mb = os.path.getsize(export) / 1e6
+            row = []
+            for extra in ([], ['--stream']):
+                t0 = time.perf_counter()
+                rss = peak_rss_kib([sys.executable, script, export, '-q', '-o', out, *extra])
+                row += [rss / 1024, time.perf_counter() - t0]
+            with open(out) as f:
+                totals = json.load(f)['totals']
+            print(f'{n:>10,} {mb:>10.1f} {row[0]:>12.1f} {row[2]:>14.1f} {row[1]:>8.2f} {row[3]:>9.2f}'
+                  f'   ({sum(totals.values())} components)')
+            os.remove(export)
+
+
+def linear_categorize(name):
+    """The original keyword-scan categorize(), kept as the baseline and parity reference."""
+    n = name.lower()
+
+    # Icons first (most specific)
+    icon_kw = ['.↪️ icon', 'icon/', 'icon ', 'direction/', 'system/', 'action/', 'objects/', 'maps/',
+               'preference/', 'education/', 'like/', 'calendar/', 'syringe/', 'clock/', 'team/',
+               'location/', 'check /', 'remix-icons', 'arrow', 'caret', 'pencil', 'download',
+               'confetti', 'mappin', 'warningcircle', 'plus']
+    for kw in icon_kw:
+        if kw in n:
+            return 'Icons'
+
+    # Brand/Logos
+    brand_kw = ['logo', 'brand', 'product logo', 'alle ', '_primary options', '_secondary options',
+                '_seal options', '_logo options', '_logotype options', '_emblem options', '_monogram options',
+                '_brand options', '_indication options', '_default options', 'latisse']
+    for kw in brand_kw:
+        if kw in n:
+            return 'Brand / Logos'
+
+    # Navigation
+    nav_kw = ['nav', 'tab', 'link', 'menu', 'breadcrumb', 'pagination', 'header button', 'footer',
+              'sidebar', 'drawer', 'top bar', 'bottom sheet']
+    for kw in nav_kw:
+        if kw in n:
+            return 'Navigation'
+
+    # Feedback
+    fb_kw = ['alert', 'tooltip', 'snackbar', 'modal', 'dialog', 'toast', 'banner', 'annotation']
+    for kw in fb_kw:
+        if kw in n:
+            return 'Feedback'
+
+    # Form Controls
+    form_kw = ['button', 'input', 'select', 'checkbox', 'toggle', 'chip', 'accordion', 'dropdown',
+               'radio', 'counter badge', 'counter filter', 'search', 'filter', 'validate',
+               'text input', 'text button', 'header button', 'button group', 'cta']
+    for kw in form_kw:
+        if kw in n:
+            return 'Form Controls'
+
+    # Data Display
+    dd_kw = ['card', 'badge', 'tag', 'avatar', 'progress', 'medal', 'stamp', 'status',
+             'indicator', 'count', 'title']
+    for kw in dd_kw:
+        if kw in n:
+            return 'Data Display'
+
+    # Media
+    med_kw = ['image', 'video', 'placeholder', 'carousel']
+    for kw in med_kw:
+        if kw in n:
+            return 'Media'
+
+    # Layout
+    lay_kw = ['container', 'spacer', 'slot', 'view port', 'section', 'responsive', 'grid',
+              'xlarge', 'small', 'medium', 'large', 'marketing', 'isi', 'training center',
+              'training portal', 'live events']
+    for kw in lay_kw:
+        if kw in n:
+            return 'Layout'
+
+    return 'Other'
+
+
+def two_pass_scan(lines):
+    """The original parse_inventory.py traversal, kept as the baseline for parse-throughput."""
+    components = []
+    for line in lines:
+        stripped = line.lstrip()
+        indent = len(line) - len(stripped)
+        if indent == 2:
+            if stripped.startswith('<frame') or stripped.startswith('<symbol'):
+                name_match = re.search(r'name="([^"]+)"', stripped)
+                id_match = re.search(r'id="([^"]+)"', stripped)
+                type_match = re.search(r'^<(\w+)', stripped)
+                if name_match and id_match:
+                    components.append({
+                        'name': name_match.group(1),
+                        'id': id_match.group(1),
+                        'type': type_match.group(1),
+                        'self_closing': stripped.rstrip().endswith('/>')
+                    })
+
+    frame_children = {}
+    current_frame = None
+    count = 0
+    for line in lines:
+        stripped = line.lstrip()
+        indent = len(line) - len(stripped)
+        if indent == 2:
+            if current_frame:
+                frame_children[current_frame] = count
+            if stripped.startswith('<frame') and not stripped.rstrip().endswith('/>'):
+                id_m = re.search(r'id="([^"]+)"', stripped)
+                current_frame = id_m.group(1) if id_m else None
+                count = 0
+            else:
+                current_frame = None
+                count = 0
+        elif indent == 4 and current_frame:
+            if stripped.startswith('<symbol') or stripped.startswith('<instance') or stripped.startswith('<frame'):
+                count += 1
+    if current_frame:
+        frame_children[current_frame] = count
+
+    cats = {}
+    for c in components:
+        cat = linear_categorize(c['name'])
+        if cat not in cats:
+            cats[cat] = []
+        c['variants'] = frame_children.get(c['id'], 0)
+        cats[cat].append(c)
+    return cats
+
+
+def best_of(fn, repeat=3):
+    """Run `fn` `repeat` times and return (best wall time, last result)."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench_parse_throughput(argv):
+    """Lines/sec of the two-pass baseline vs parse_inventory.scan_page on a synthetic export."""
+    from parse_inventory import load_lines, scan_page
+
+    n = int(argv[0]) if argv else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        export = os.path.join(tmp, 'export.json')
+        synthetic_export(export, n)
+        lines = load_lines(export)
+    before, expected = best_of(lambda: two_pass_scan(lines))
+    after, got = best_of(lambda: scan_page(lines))
+    assert got == expected, 'scan_page output differs from the two-pass baseline'
+    print(f'{len(lines):,} lines, {sum(len(v) for v in got.values()):,} components')
+    print(f'  two-pass baseline  {before:7.3f}s  {len(lines) / before:>12,.0f} lines/s')
+    print(f'  scan_page          {after:7.3f}s  {len(lines) / after:>12,.0f} lines/s  ({before / after:.1f}x)')
+
+
+def synthetic_names(n, seed=0):
+    """`n` component names: sample names with random casing edits and numeric suffixes."""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(n):
+        name = rng.choice(SAMPLE_NAMES)
+        if rng.random() < 0.3:
+            name = name.upper()
+        names.append(f'{name} {rng.randrange(100_000)}' if rng.random() < 0.7 else name)
+    return names
+
+
+def bench_categorize(argv):
+    """Names/sec of the linear keyword scan vs the compiled categorizer, with a parity check."""
+    from parse_inventory import categorize
+
+    n = int(argv[0]) if argv else 1_000_000
+    names = synthetic_names(n)
+    before, expected = best_of(lambda: [linear_categorize(name) for name in names])
+    after, got = best_of(lambda: [categorize(name) for name in names])
+    batch, (batch_got, hits) = best_of(lambda: categorize.categorize_many(names))
+    assert got == expected == batch_got, 'compiled categorizer disagrees with the linear scan'
+    # Also compare on every rule keyword on its own and embedded in text
+    for cat, kw in categorize.rules:
+        for probe in (kw, f'x{kw.upper()}y', f'{kw} {kw[::-1]}'):
+            assert categorize(probe) == linear_categorize(probe), probe
+    print(f'{n:,} names, parity ok')
+    print(f'  linear scan       {before:7.3f}s  {n / before:>12,.0f} names/s')
+    print(f'  compiled          {after:7.3f}s  {n / after:>12,.0f} names/s  ({before / after:.1f}x)')
+    print(f'  categorize_many   {batch:7.3f}s  {n / batch:>12,.0f} names/s  ({before / batch:.1f}x)')
+    fired = sum(1 for v in hits.values() if v)
+    print(f'  {fired} of {len(hits)} rules fired')
+
+
+def bench_parse_pool(argv):
+    """Wall time of parse_inventory.scan_shards on a multi-page export as workers are added."""
+    from parse_inventory import page_shards, scan_shards
+
+    pages = int(argv[0]) if argv else 8
+    per_page = int(argv[1]) if len(argv) > 1 else 250_000
+    with tempfile.TemporaryDirectory() as tmp:
+        export = os.path.join(tmp, 'export.json')
+        synthetic_export(export, per_page, pages=pages)
+        shards = list(page_shards([export], all_pages=True))
+        print(f'{pages} pages x {per_page:,} lines ({os.path.getsize(export) / 1e6:.0f} MB), '
+              f'{os.cpu_count()} CPUs')
+        baseline = expected = None
+        jobs = 1
+        while jobs <= min(pages, os.cpu_count()):
+            elapsed, (cats, _, _) = best_of(lambda: scan_shards(shards, jobs), repeat=1)
+            if expected is None:
+                baseline, expected = elapsed, cats
+            assert cats == expected, f'--jobs {jobs} output differs from --jobs 1'
+            print(f'  jobs={jobs:<3} {elapsed:7.2f}s  {baseline / elapsed:4.1f}x')
+            jobs *= 2
+
+
+def bench_inventory_db(argv):
+    """Build time and query latency of inventory_db on a synthetic component inventory."""
+    import sqlite3
+    import inventory_db
+    from parse_inventory import categorize
+
+    n = int(argv[0]) if argv else 1_000_000
+    rng = random.Random(0)
+    cats = {}
+    for i, name in enumerate(synthetic_names(n)):
+        c = {'id': f'{40000000 + i}:{i}', 'name': name, 'type': rng.choice(('frame', 'symbol')),
+             'variants': rng.choice((0, 0, 0, 1, 2, 4, 8, 12, 36, 308))}
+        cats.setdefault(categorize(name), []).append(c)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, 'inventory.db')
+        t0 = time.perf_counter()
+        inventory_db.write(cats, db)
+        print(f'{n:,} components written in {time.perf_counter() - t0:.2f}s '
+              f'({os.path.getsize(db) / 1e6:.0f} MB)')
+        conn = sqlite3.connect(db)
+        probes = [
+            ('Form Controls with >10 variants', dict(category='Form Controls', min_variants=11)),
+            ('names like Tooltip', dict(name='Tooltip')),
+            ('symbols with 308 variants', dict(node_type='symbol', min_variants=308)),
+            ('node id lookup', dict(node_id=f'{40000000 + n // 2}:{n // 2}')),
+            ('all Form Controls with >10 variants, no limit', dict(category='Form Controls', min_variants=11, limit=0)),
+        ]
+        for label, kwargs in probes:
+            elapsed, rows = best_of(lambda: inventory_db.query(conn, **kwargs), repeat=5)
+            print(f'  {label:<48} {elapsed * 1000:8.2f} ms  {len(rows):>8,} rows')
+
+
+def bench_render_pool(argv):
+    """Pages/sec of pagegen.write_pages on copies of the detail pages as workers are added."""
+    import filecmp
+    import build_detail_pages
+    import pagegen
+
+    n = int(argv[0]) if argv else 5000
+    base = build_detail_pages.components
+    items = [dict(base[i % len(base)], slug=f'{base[i % len(base)]["slug"]}-{i}') for i in range(n)]
+    print(f'{n:,} pages, {os.cpu_count()} CPUs')
+    with tempfile.TemporaryDirectory() as tmp:
+        reference = None
+        jobs = 1
+        while jobs <= max(os.cpu_count(), 1):
+            out = os.path.join(tmp, f'jobs{jobs}')
+            _, elapsed = pagegen.write_pages(items, build_detail_pages.build_page, out, jobs)
+            if reference is None:
+                reference = out
+            else:
+                _, mismatch, errors = filecmp.cmpfiles(reference, out, os.listdir(reference), shallow=False)
+                assert not mismatch and not errors, f'--jobs {jobs} output differs from --jobs 1'
+            print(f'  {pagegen.rate(n, elapsed, jobs)}')
+            jobs *= 2
+
+
+def fstring_page(title, body):
+    """A detail page assembled the way the generators did before layout.py: one inline f-string."""
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title} — AMI Design System Audit</title>
+<link rel="stylesheet" href="../style.css">
+</head>
+<body>
+
+<nav class="site-nav">
+  <div class="nav-inner">
+    <a href="../index.html" class="nav-brand">AMI Design System</a>
+    <div class="nav-links">
+      <a href="../index.html">Overview</a>
+      <a href="../tokens.html">Tokens</a>
+      <a href="../components.html" class="active">Components</a>
+      <a href="../screens.html">Screens</a>
+      <a href="../assets.html">Assets</a>
+      <a href="../architecture.html">Architecture</a>
+      <a href="../patterns.html">Patterns</a>
+      <a href="../remediation.html">Remediation</a>
+    </div>
+  </div>
+</nav>
+
+{body}<footer class="site-footer">
+  AMI Design System Audit &mdash; Generated February 27, 2026 &mdash; <a href="https://github.com/d999ss/AMI-Design-System">GitHub</a>
+</footer>
+
+</body>
+</html>
+'''
+
+
+def bench_render_layout(argv):
+    """Pages/sec and peak allocation per page: layout.Layout.render vs the inline f-string chrome."""
+    import tracemalloc
+    import build_detail_pages
+    from layout import Layout
+
+    n = int(argv[0]) if argv else 20_000
+    layout = Layout('components.html', prefix='../')
+    body = '<div class="page">\n' + '  <p>Token table row</p>\n' * 200 + '</div>\n\n'
+    titles = [c['name'] for c in build_detail_pages.components]
+    assert layout.render(titles[0], body) == fstring_page(titles[0], body)
+
+    for label, render in (('f-string', fstring_page), ('layout', layout.render)):
+        elapsed, _ = best_of(lambda: [render(titles[i % len(titles)], body) for i in range(n)])
+        # Peak traced memory while rendering one page, relative to the page
+        # itself: 1.0x means the page string is built without temporary copies.
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        page = render(titles[0], body)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'  {label:<9} {n / elapsed:>10,.0f} pages/sec  '
+              f'peak {peak - base:,} bytes/page ({(peak - base) / sys.getsizeof(page):.2f}x the page)')
+
+    elapsed, _ = best_of(lambda: [build_detail_pages.build_page(c) for c in build_detail_pages.components])
+    print(f'  build_detail_pages.build_page: {len(titles) / elapsed:,.0f} full pages/sec')
+
+
+def synthetic_inventory(path, n, seed=0):
+    """Write an inventory JSON (parse_inventory.py format) with `n` components.
+
+    Categories skip Icons and Brand / Logos, which build_components.py collapses
+    by base name, so every component becomes one master-table row.
+    """
+    rng = random.Random(seed)
+    cats = ['Navigation', 'Form Controls', 'Data Display', 'Layout', 'Feedback', 'Other', 'Media']
+    categories = {cat: [] for cat in cats}
+    for i, name in enumerate(synthetic_names(n, seed)):
+        categories[cats[i % len(cats)]].append(
+            {'id': f'{40000000 + i}:{i}', 'name': name, 'type': rng.choice(('frame', 'symbol')),
+             'variants': rng.choice((0, 0, 0, 1, 2, 4, 8, 12, 36, 308))})
+    with open(path, 'w') as f:
+        json.dump({'totals': {cat: len(items) for cat, items in categories.items()},
+                   'categories': categories}, f)
+
+
+def bench_components_scale(argv):
+    """Peak RSS and time of build_components.py at 10k/100k/1M master-table rows."""
+    sizes = [int(a) for a in argv] or [10_000, 100_000, 1_000_000]
+    script = os.path.join(ROOT, 'build_components.py')
+    load_only = 'import json, sys; json.load(open(sys.argv[1]))'
+    with tempfile.TemporaryDirectory() as tmp:
+        inventory = os.path.join(tmp, 'inventory.json')
+        html = os.path.join(tmp, 'inventory.html')
+        # Input RSS is the inventory held by json.load; the rest is what rendering adds
+        print(f"{'rows':>10} {'page MB':>8} {'input RSS MB':>13} {'build RSS MB':>13} {'added MB':>9} {'build s':>8}")
+        for n in sizes:
+            synthetic_inventory(inventory, n)
+            floor = peak_rss_kib([sys.executable, '-c', load_only, inventory]) / 1024
+            t0 = time.perf_counter()
+            rss = peak_rss_kib([sys.executable, script, inventory, html]) / 1024
+            elapsed = time.perf_counter() - t0
+            print(f'{n:>10,} {os.path.getsize(html) / 1e6:>8.1f} {floor:>13.1f} {rss:>13.1f} '
+                  f'{rss - floor:>9.1f} {elapsed:>8.2f}')
+
+
+def synthetic_colors(n, seed=0):
+    """`n` hex token values. As in token_data.json most reuse an earlier value; some nudge one, some are new."""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(n):
+        roll = rng.random()
+        if values and roll < 0.7:
+            values.append(rng.choice(values))
+            continue
+        if values and roll < 0.8:
+            base = bytes.fromhex(rng.choice(values)[1:7])
+            rgb = bytes(max(0, min(255, c + rng.randint(-3, 3))) for c in base)
+        else:
+            rgb = rng.randbytes(3)
+        alpha = f'{rng.choice((0, 0x14, 0x4f, 0x80)):02x}' if rng.random() < 0.1 else ''
+        values.append('#' + rgb.hex() + alpha)
+    return values
+
+
+def bench_color_distance(argv):
+    """Time of color_audit's blocked CIEDE2000 clustering on synthetic tokens, checked against a full matrix."""
+    import numpy as np
+    import color_audit
+
+    sizes = [int(a) for a in argv] or [1_000, 10_000, 50_000]
+    for n in sizes:
+        tokens = synthetic_colors(n)
+        t0 = time.perf_counter()
+        values = list(dict.fromkeys(tokens))
+        pairs = color_audit.near_pairs(values)
+        groups = color_audit.clusters(values, pairs)
+        elapsed = time.perf_counter() - t0
+        line = (f'{n:>8,} tokens  {len(values):>8,} distinct  {elapsed * 1000:8.1f} ms  '
+                f'{len(pairs):>7,} close pairs  {len(groups):>6,} clusters')
+        if len(values) <= 5_000:
+            rgba = color_audit.to_rgba(values)
+            lab = color_audit.to_lab(rgba)
+            d = color_audit.ciede2000(lab[:, None, :], lab[None, :, :])
+            close = ((d < color_audit.THRESHOLD)
+                     & (np.abs(rgba[:, None, 3] - rgba[None, :, 3]) <= color_audit.ALPHA_TOLERANCE))
+            expected = {(i, j) for i, j in zip(*np.nonzero(np.triu(close, 1)))}
+            assert {(min(i, j), max(i, j)) for i, j, _ in pairs} == expected, 'blocked pairs differ from the full matrix'
+            line += '  (matches full matrix)'
+        print(line)
+
+
+BENCHMARKS = {
+    'parse-rss': bench_parse_rss,
+    'parse-throughput': bench_parse_throughput,
+    'categorize': bench_categorize,
+    'parse-pool': bench_parse_pool,
+    'inventory-db': bench_inventory_db,
+    'render-pool': bench_render_pool,
+    'render-layout': bench_render_layout,
+    'components-scale': bench_components_scale,
+    'color-distance': bench_color_distance,
+}
+
+
+def main(argv):
+    if not argv or argv[0] not in BENCHMARKS:
+        print(__doc__)
+        for name, fn in BENCHMARKS.items():
+            print(f'  {name:<16} {fn.__doc__}')
+        return 1
+    BENCHMARKS[argv[0]](argv[1:])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
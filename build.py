@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""Incremental build of the audit site.
+
+Each target names the generator that produces it, the files it reads (the
+generator itself, which holds the component/screen definitions, plus data and
+images) and the files it writes. A target is rebuilt only if an input's content
+hash changed since the last build, its command line changed, or an output is
+missing or was edited; otherwise its outputs are reused. Hashes are kept in
+.build_state.json. Every page is written once per change, in its final form
+(critical CSS included), by the one target that owns it; only remediation.html
+has two writers, color_audit.py and fingerprint.py, which write it alike.
+
+  python build.py                              # everything that is stale
+  python build.py --export figma.json          # also re-parse the Figma export
+  python build.py detail-pages --force         # one target (and what it needs), unconditionally
+  python build.py components --virtual         # master table as lazily loaded JSON shards
+  python build.py --force --trace trace.json   # where a full build spends its time
+"""
+import argparse, hashlib, importlib, importlib.util, json, os, shutil, subprocess, sys, tempfile, time
+from collections import namedtuple
+
+import buildtrace
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATE_PATH = os.path.join(ROOT, '.build_state.json')
+STATE_VERSION = 1
+
+Target = namedtuple('Target', 'name cmd inputs outputs')
+
+
+def _pages(module, attr, out_dir):
+    """Output paths of a page generator, from the slugs in its definitions list."""
+    items = getattr(importlib.import_module(module), attr)
+    return [os.path.join(ROOT, out_dir, f'{item["slug"]}.html') for item in items]
+
+
+def _script(name):
+    return os.path.join(ROOT, name)
+
+
+def _images(directory):
+    return [os.path.join(ROOT, 'img', directory, f) for f in sorted(os.listdir(os.path.join(ROOT, 'img', directory)))
+            if f.endswith('.png')]
+
+
+def targets(exports, inventory, jobs=1, virtual=False):
+    """The build graph, in dependency order, and [(name, why)] of the targets left out of it."""
+    import compress, fingerprint, search_index
+    python = sys.executable
+    page_flags = ['--jobs', str(jobs)] if jobs > 1 else []
+    # Modules every page generator imports
+    shared = [_script(m) for m in ('layout.py', 'pagegen.py', 'outputs.py', 'images.py', 'asset_index.py',
+                                   'fingerprint.py', 'critical_css.py')]
+    # Pages link these with a ?v=<content hash> (see fingerprint.py)
+    static = [_script('style.css'), _script('tiles.js'), _script('search.js'), _script('inventory.js')]
+    manifest = os.path.join(ROOT, 'img', 'responsive', 'manifest.json')
+    tile_manifest = os.path.join(ROOT, 'img', 'tiles', 'manifest.json')
+    graph, skipped = [], []
+    # Encoding needs Pillow; without it pages keep plain <img> tags and the target is left out
+    if not importlib.util.find_spec('PIL'):
+        skipped += [('images', 'needs Pillow: pip install Pillow'), ('tiles', 'needs Pillow: pip install Pillow')]
+    else:
+        graph.append(Target('images',
+                            [python, _script('images.py')],
+                            [_script('images.py'), *_images('components'), *_images('screens')],
+                            [manifest]))
+        graph.append(Target('tiles',
+                            [python, _script('tiles.py')],
+                            # A screenshot is cut from its canonical copy, which may be a component image
+                            [_script('tiles.py'), _script('asset_index.py'), *_images('components'), *_images('screens')],
+                            [tile_manifest]))
+    if exports:
+        graph.append(Target('inventory',
+                            [python, _script('parse_inventory.py'), *exports, '-q', '-o', inventory],
+                            [_script('parse_inventory.py'), *exports],
+                            [inventory]))
+    # The master inventory page needs a parsed Figma export; components.html is the hand-written gallery
+    if exports or os.path.exists(inventory):
+        graph.append(Target('components',
+                            [python, _script('build_components.py'), *(['--virtual'] if virtual else []), inventory],
+                            [_script('build_components.py'), *shared, *static, inventory],
+                            [os.path.join(ROOT, 'inventory.html')]))
+    else:
+        skipped.append(('components', f'no inventory at {inventory}; pass --export or --inventory'))
+    detail_pages = _pages('build_detail_pages', 'components', 'components')
+    graph.append(Target('detail-pages',
+                        [python, _script('build_detail_pages.py'), *page_flags],
+                        # A screenshot's presence changes the page, so each one is an input
+                        [_script('build_detail_pages.py'), _script('token_graph.py'), *shared, *static,
+                         os.path.join(ROOT, 'token_data.json'), manifest,
+                         *(os.path.join(ROOT, 'img', 'components', os.path.basename(p)[:-5] + '.png')
+                           for p in detail_pages)],
+                        detail_pages))
+    batch2_pages = _pages('build_detail_pages_batch2', 'components', 'components')
+    graph.append(Target('detail-pages-batch2',
+                        [python, _script('build_detail_pages_batch2.py'), *page_flags],
+                        [_script('build_detail_pages_batch2.py'), _script('token_graph.py'), *shared, *static,
+                         os.path.join(ROOT, 'token_data.json'), manifest,
+                         *(os.path.join(ROOT, 'img', 'components', os.path.basename(p)[:-5] + '.png')
+                           for p in batch2_pages)],
+                        batch2_pages))
+    screen_pages = _pages('build_screen_pages', 'screens', 'screens')
+    graph.append(Target('screen-pages',
+                        [python, _script('build_screen_pages.py'), *page_flags],
+                        [_script('build_screen_pages.py'), _script('tiles.py'), *shared, *static, manifest, tile_manifest,
+                         *(os.path.join(ROOT, 'img', 'screens', os.path.basename(p)[:-5] + '.png')
+                           for p in screen_pages)],
+                        screen_pages))
+    # Rewrites its own section of token_data.json; an edit to the file marks it stale as a modified output
+    graph.insert(0, Target('naming-audit',
+                           [python, _script('naming_audit.py')],
+                           [_script('naming_audit.py'), _script('token_graph.py'), _script('outputs.py')],
+                           [os.path.join(ROOT, 'token_data.json')]))
+    # The color analysis needs NumPy; without it remediation.html keeps its last report
+    if not importlib.util.find_spec('numpy'):
+        skipped.append(('color-audit', 'needs NumPy: pip install numpy'))
+    else:
+        graph.append(Target('color-audit',
+                            [python, _script('color_audit.py')],
+                            [_script('color_audit.py'), _script('token_graph.py'), _script('outputs.py'),
+                             _script('fingerprint.py'), _script('critical_css.py'),
+                             os.path.join(ROOT, 'token_data.json')],
+                            [_script('remediation.html')]))
+    graph.append(Target('fingerprint',
+                        [python, _script('fingerprint.py')],
+                        [_script('fingerprint.py'), _script('asset_index.py'), _script('critical_css.py'), *static,
+                         *_images('components'), *_images('screens')],
+                        [_script('vercel.json'), *(_script(p) for p in fingerprint.HAND_WRITTEN)]))
+    # Reads tokens.html after fingerprint.py has rewritten it
+    graph.append(Target('search-index',
+                        [python, _script('search_index.py'), '--inventory', inventory],
+                        [_script('search_index.py'), _script('token_graph.py'), _script('outputs.py'), _script('layout.py'),
+                         _script('build_detail_pages.py'), _script('build_detail_pages_batch2.py'),
+                         os.path.join(ROOT, 'token_data.json'), _script('tokens.html'), inventory],
+                        [os.path.join(ROOT, 'search', f'{kind}-{n}.json')
+                         for kind, shards in (('g', search_index.GRAM_SHARDS), ('d', search_index.DOC_SHARDS))
+                         for n in range(shards)] + [search_index.VERSION_PATH]))
+    # The deployed copy of the site in dist/, with compressed copies of every page and text asset;
+    # .br only with the brotli package. Outputs of targets that have not run yet (inventory.html on
+    # a first build) belong to it too.
+    built = [os.path.relpath(out, ROOT) for t in graph for out in t.outputs]
+    site = compress.site_files()
+    site += [p for p in built if p not in site and compress.served(p)]
+    compressed = compress.files()
+    compressed += [p for p in built if p.endswith('.html') and p not in compressed]
+    graph.append(Target('compress',
+                        [python, _script('compress.py'), '--jobs', str(jobs)],
+                        [_script('compress.py'), _script('critical_css.py'), _script('asset_index.py'),
+                         _script('outputs.py'), *(_script(p) for p in site)],
+                        [os.path.join(compress.OUT, p) for p in site]
+                        + [os.path.join(compress.OUT, p + ext) for p in compressed
+                           for ext in ('.gz', '.br') if ext == '.gz' or importlib.util.find_spec('brotli')]))
+    return graph, skipped
+
+
+def select(graph, names):
+    """The named targets plus every target that produces one of their inputs, in graph order."""
+    by_name = {t.name: t for t in graph}
+    producer = {out: t.name for t in graph for out in t.outputs}
+    wanted, stack = set(), list(names)
+    while stack:
+        name = stack.pop()
+        if name in wanted:
+            continue
+        if name not in by_name:
+            raise KeyError(name)
+        wanted.add(name)
+        stack.extend(producer[p] for p in by_name[name].inputs if p in producer)
+    return [t for t in graph if t.name in wanted]
+
+
+class FileHashes:
+    """Content hashes memoized on (size, mtime), so unchanged images are not re-read every build."""
+
+    def __init__(self, memo):
+        self.memo = memo
+
+    def __call__(self, path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        key = [st.st_size, st.st_mtime_ns]
+        cached = self.memo.get(path)
+        if cached and cached[:2] == key:
+            return cached[2]
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        self.memo[path] = key + [h.hexdigest()]
+        return h.hexdigest()
+
+
+def load_state():
+    try:
+        with open(STATE_PATH) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {'version': STATE_VERSION, 'files': {}, 'targets': {}}
+    if state.get('version') != STATE_VERSION:
+        return {'version': STATE_VERSION, 'files': {}, 'targets': {}}
+    return state
+
+
+def save_state(state):
+    tmp = f'{STATE_PATH}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(json.dumps(state, indent=1, sort_keys=True))
+    os.replace(tmp, STATE_PATH)
+
+
+def _rel(path):
+    rel = os.path.relpath(path, ROOT)
+    return path if rel.startswith('..') else rel
+
+
+def stale_reason(target, record, digest):
+    """Why `target` must be rebuilt, or None if its recorded outputs are still valid."""
+    if record is None:
+        return 'never built'
+    if record.get('cmd') != target.cmd:
+        return 'options changed'
+    inputs = {_rel(p): digest(p) for p in target.inputs}
+    changed = [p for p, h in inputs.items() if record['inputs'].get(p) != h]
+    if changed:
+        return 'changed: ' + ', '.join(changed[:3]) + (f' (+{len(changed) - 3})' if len(changed) > 3 else '')
+    for p in target.outputs:
+        h = digest(p)
+        if h is None:
+            return f'missing: {_rel(p)}'
+        if record['outputs'].get(_rel(p)) != h:
+            return f'modified: {_rel(p)}'
+    return None
+
+
+def build(graph, force=False, verbose=False):
+    """Run every stale target in order. Returns (rebuilt, reused, failed, blocked) lists of names.
+
+    A target that reads an output of a failed (or blocked) target is not run:
+    its inputs are whatever the failed run left behind.
+    """
+    state = load_state()
+    digest = FileHashes(state['files'])
+    rebuilt, reused, failed, blocked = [], [], [], []
+    broken = set()
+    for target in graph:
+        if broken.intersection(target.inputs):
+            blocked.append(target.name)
+            broken.update(target.outputs)
+            print(f'  skipped  {target.name} (upstream failed)')
+            continue
+        record = state['targets'].get(target.name)
+        reason = 'forced' if force else stale_reason(target, record, digest)
+        if reason is None:
+            reused.append(target.name)
+            print(f'  reused   {target.name}')
+            continue
+        # Hashed before the run, so an input edited while the generator runs
+        # still looks changed next time.
+        inputs = {_rel(p): digest(p) for p in target.inputs}
+        before = {_rel(p): digest(p) for p in target.outputs}
+        t0, cpu0 = time.perf_counter_ns(), os.times()
+        proc = subprocess.run(target.cmd, cwd=ROOT, capture_output=True, text=True)
+        t1, cpu1 = time.perf_counter_ns(), os.times()
+        elapsed = (t1 - t0) / 1e9
+        if proc.returncode != 0:
+            failed.append(target.name)
+            broken.update(target.outputs)
+            state['targets'].pop(target.name, None)
+            print(f'  FAILED   {target.name} ({reason})')
+            sys.stderr.write(proc.stderr)
+            continue
+        if verbose:
+            sys.stdout.write(proc.stdout)
+        rebuilt.append(target.name)
+        outputs = {_rel(p): digest(p) for p in target.outputs}
+        written = [p for p, h in outputs.items() if h is not None and h != before[p]]
+        cpu = (cpu1.children_user + cpu1.children_system) - (cpu0.children_user + cpu0.children_system)
+        buildtrace.record(target.name, t0, t1, int(cpu * 1e9), cat='target', items=len(written),
+                          bytes=sum(os.path.getsize(os.path.join(ROOT, p)) for p in written), reason=reason)
+        state['targets'][target.name] = {
+            'cmd': target.cmd,
+            'inputs': inputs,
+            'outputs': outputs,
+        }
+        # Another target that writes one of these files (remediation.html) would otherwise see it as edited
+        for name, other in state['targets'].items():
+            if name != target.name:
+                other['outputs'].update((p, h) for p, h in outputs.items() if p in other['outputs'])
+        print(f'  rebuilt  {target.name} ({reason}) in {elapsed:.2f}s')
+    save_state(state)
+    return rebuilt, reused, failed, blocked
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('targets', nargs='*', help='targets to build (default: all)')
+    parser.add_argument('--export', dest='exports', action='append', default=[],
+                        help='Figma metadata export to parse into the inventory (repeatable)')
+    parser.add_argument('--inventory', default='/tmp/ami_inventory.json',
+                        help='inventory JSON read by build_components.py (default: %(default)s)')
+    parser.add_argument('--virtual', action='store_true',
+                        help='write the master inventory table as per-category JSON shards (see build_components.py)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='worker processes for each page generator (default: %(default)s)')
+    parser.add_argument('-f', '--force', action='store_true', help='rebuild even if nothing changed')
+    parser.add_argument('-v', '--verbose', action='store_true', help="show each generator's output")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="write a Chrome trace of every target and generator stage to PATH (see buildtrace.py)")
+    parser.add_argument('--list', action='store_true', help='list targets and exit')
+    return parser, parser.parse_args(argv)
+
+
+def main(argv=None):
+    parser, args = parse_args(argv)
+    sys.path.insert(0, ROOT)
+    graph, skipped = targets([os.path.abspath(p) for p in args.exports], os.path.abspath(args.inventory),
+                             args.jobs, args.virtual)
+    if args.list:
+        for t in graph:
+            print(f'  {t.name:<20} {len(t.inputs)} inputs -> {len(t.outputs)} outputs')
+        for name, why in skipped:
+            print(f'  {name:<20} skipped ({why})')
+        return 0
+    if args.targets:
+        for name, why in skipped:
+            if name in args.targets:
+                parser.error(f'{name} is skipped: {why}')
+        try:
+            graph = select(graph, args.targets)
+        except KeyError as e:
+            parser.error(f'unknown target {e}; see --list')
+    else:
+        for name, why in skipped:
+            print(f'  skipped  {name} ({why})')
+
+    if args.trace:
+        # Generators inherit the variable and write their own spans next to build.py's
+        os.environ[buildtrace.ENV] = tempfile.mkdtemp(prefix='build-trace-')
+    rebuilt, reused, failed, blocked = build(graph, args.force, args.verbose)
+    print(f'\n{len(rebuilt)} rebuilt, {len(reused)} reused' + (f', {len(failed)} failed' if failed else '')
+          + (f', {len(blocked)} skipped' if blocked else ''))
+    if args.trace:
+        events = buildtrace.merge(os.environ[buildtrace.ENV], args.trace)
+        shutil.rmtree(os.environ.pop(buildtrace.ENV))
+        print(buildtrace.summary(events, 'target') + f' ({args.trace})')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
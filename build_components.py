@@ -1,9 +1,93 @@
 #!/usr/bin/env python3
-"""Generate components.html from inventory JSON."""
-import json
+"""Generate inventory.html, the master component inventory, from inventory JSON.
 
-with open('/tmp/ami_inventory.json') as f:
+Usage: python build_components.py [--virtual] [inventory.json [output.html]]
+(defaults: /tmp/ami_inventory.json, inventory.html next to this script)
+
+components.html, the component gallery, is maintained by hand and is not
+touched.
+
+With --virtual the master table is not inlined: each category's rows go to
+inventory/<category>.json and the page holds one collapsed section per
+category. inventory.js fetches a category's rows when its section is opened
+and keeps only the rows in view in the DOM, so the page's size no longer
+grows with the inventory. Each data-src carries a ?v= hash of its shard,
+as pages do for their assets (see fingerprint.py).
+
+The body is streamed to a temp file while the classes and tags it uses are
+collected; the head, with the critical CSS for those (see critical_css.py),
+is written in front of it at the end.
+"""
+import hashlib, json, os, shutil, sys
+
+import buildtrace, critical_css
+from fingerprint import HASH_LEN, url
+from layout import Layout, anchor
+from outputs import replace_if_changed, write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+VIRTUAL = '--virtual' in sys.argv[1:]
+ARGS = [a for a in sys.argv[1:] if a != '--virtual']
+INVENTORY = ARGS[0] if len(ARGS) > 0 else '/tmp/ami_inventory.json'
+OUTPUT = ARGS[1] if len(ARGS) > 1 else os.path.join(ROOT, 'inventory.html')
+SHARD_DIR = os.path.join(os.path.dirname(os.path.abspath(OUTPUT)), 'inventory')
+
+# Master table in --virtual mode: sections scroll on their own, rows are placed by inventory.js
+VIRTUAL_HEAD = f'<script src="{url("inventory.js")}" defer></script>\n' + '''<style>
+  .inv-category { margin-bottom:8px; }
+  .inv-category summary { cursor:pointer; background:#f7f6f5; font-weight:600; font-size:12px; text-transform:uppercase; letter-spacing:0.05em; color:#787676; padding:12px 16px; border:1px solid #ece9e5; border-radius:8px; }
+  .inv-category[open] summary { border-radius:8px 8px 0 0; }
+  .inv-viewport { max-height:70vh; overflow-y:auto; border:1px solid #ece9e5; border-top:none; }
+  .inv-viewport .data-table { border:none; border-radius:0; margin-bottom:0; overflow:visible; }
+  .inv-viewport thead th { position:sticky; top:0; z-index:1; }
+  .inv-viewport td { white-space:nowrap; }
+</style>
+'''
+
+LAYOUT = Layout('components.html', head=f'<script src="{url("search.js")}" defer></script>\n' + '''<style>
+  .tier-badge { display:inline-block; padding:2px 8px; border-radius:4px; font-size:11px; font-weight:600; }
+  .tier-1 { background:#f1e5e2; color:#9a6b5e; }
+  .tier-2 { background:#e3f2fd; color:#1565c0; }
+  .tier-3 { background:#f7f6f5; color:#b3b0ae; }
+  .cat-header td { background:#f7f6f5; font-weight:600; font-size:12px; text-transform:uppercase; letter-spacing:0.05em; color:#787676; padding:12px 16px !important; border-bottom:2px solid #ece9e5 !important; }
+  .bar-chart { display:flex; flex-direction:column; gap:8px; margin-top:16px; }
+  .bar-row { display:flex; align-items:center; gap:12px; }
+  .bar-label { width:120px; font-size:12px; font-weight:500; text-align:right; flex-shrink:0; }
+  .bar-track { flex:1; height:24px; background:#f7f6f5; border-radius:4px; overflow:hidden; }
+  .bar-fill { height:100%; background:#9a6b5e; border-radius:4px; display:flex; align-items:center; justify-content:flex-end; padding-right:8px; font-size:11px; color:#fff; font-weight:600; min-width:30px; }
+</style>
+''' + (VIRTUAL_HEAD if VIRTUAL else ''))
+
+
+class LineWriter:
+    """Streams pieces to a file with the same output as '\\n'.join(pieces), without holding the page.
+
+    `size` is the number of UTF-8 bytes written so far; `vocab` collects the
+    (tags, classes, ids) of every piece (see critical_css.vocabulary).
+    """
+
+    def __init__(self, f, vocab):
+        self.f = f
+        self.vocab = vocab
+        self.size = 0
+        self._sep = ''
+
+    def append(self, piece, scan=True):
+        self.f.write(self._sep)
+        self.f.write(piece)
+        self.size += len(self._sep) + len(piece.encode())
+        self._sep = '\n'
+        if scan:
+            for have, found in zip(self.vocab, critical_css.vocabulary(piece, ROOT)):
+                have |= found
+
+
+if not os.path.exists(INVENTORY):
+    sys.exit(f'{INVENTORY} not found; write it with parse_inventory.py <figma export>')
+
+with buildtrace.span('parse', bytes=os.path.getsize(INVENTORY)) as s, open(INVENTORY) as f:
     data = json.load(f)
+    s.add(items=sum(len(items) for items in data['categories'].values()))
 
 # Tier 1 component IDs (canonical versions)
 tier1 = {
@@ -60,47 +144,13 @@ def get_tier(item):
         return 2
     return 3
 
-# Build HTML
-lines = []
-lines.append('''<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Components — AMI Design System Audit</title>
-<link rel="stylesheet" href="style.css">
-<style>
-  .tier-badge { display:inline-block; padding:2px 8px; border-radius:4px; font-size:11px; font-weight:600; }
-  .tier-1 { background:#f1e5e2; color:#9a6b5e; }
-  .tier-2 { background:#e3f2fd; color:#1565c0; }
-  .tier-3 { background:#f7f6f5; color:#b3b0ae; }
-  .cat-header td { background:#f7f6f5; font-weight:600; font-size:12px; text-transform:uppercase; letter-spacing:0.05em; color:#787676; padding:12px 16px !important; border-bottom:2px solid #ece9e5 !important; }
-  .bar-chart { display:flex; flex-direction:column; gap:8px; margin-top:16px; }
-  .bar-row { display:flex; align-items:center; gap:12px; }
-  .bar-label { width:120px; font-size:12px; font-weight:500; text-align:right; flex-shrink:0; }
-  .bar-track { flex:1; height:24px; background:#f7f6f5; border-radius:4px; overflow:hidden; }
-  .bar-fill { height:100%; background:#9a6b5e; border-radius:4px; display:flex; align-items:center; justify-content:flex-end; padding-right:8px; font-size:11px; color:#fff; font-weight:600; min-width:30px; }
-</style>
-</head>
-<body>
-
-<nav class="site-nav">
-  <div class="nav-inner">
-    <a href="index.html" class="nav-brand">AMI Design System</a>
-    <div class="nav-links">
-      <a href="index.html">Overview</a>
-      <a href="tokens.html">Tokens</a>
-      <a href="components.html" class="active">Components</a>
-      <a href="screens.html">Screens</a>
-      <a href="assets.html">Assets</a>
-      <a href="architecture.html">Architecture</a>
-      <a href="patterns.html">Patterns</a>
-      <a href="remediation.html">Remediation</a>
-    </div>
-  </div>
-</nav>
-
-<div class="page">
+# Build HTML: the body is streamed through a buffered temp file, then the head
+# is put in front of it in the file that replaces OUTPUT once complete if it differs
+rendering = buildtrace.begin('render')
+head = LAYOUT.head('Component Inventory')
+out = open(f'{OUTPUT}.body.tmp', 'w', encoding='utf-8', buffering=1 << 16)
+lines = LineWriter(out, critical_css.vocabulary(head, ROOT))
+lines.append('''<div class="page">
   <div class="page-header">
     <h1>Component Inventory</h1>
     <p class="subtitle">Master inventory of all 774 elements from the Internal Only Canvas page. Components are categorized by function and tiered by documentation depth.</p>
@@ -108,6 +158,10 @@ lines.append('''<!DOCTYPE html>
       <strong>Source:</strong> Page 0:2 — Internal Only Canvas (component library)<br>
       <strong>Total:</strong> 774 elements (522 frames + 252 symbols) · <strong>Tier 1:</strong> ~25 fully documented · <strong>Tier 2:</strong> screenshot + summary · <strong>Tier 3:</strong> listed
     </div>
+    <div class="site-search">
+      <input type="search" placeholder="Search components, node IDs and token paths" aria-label="Search components, node IDs and token paths" autocomplete="off" spellcheck="false">
+      <div class="search-results" hidden></div>
+    </div>
   </div>
 ''')
 
@@ -272,14 +326,17 @@ lines.append('''
   <div class="section">
     <h2 class="section-title">Master Inventory Table</h2>
     <p class="section-desc">Complete list of all 774 elements from the Internal Only Canvas, grouped by category.</p>
-
+''' + ('' if VIRTUAL else '''
     <table class="data-table">
       <thead>
         <tr><th>Name</th><th>Type</th><th>Variants</th><th>Node ID</th><th>Tier</th></tr>
       </thead>
       <tbody>
-''')
+'''))
 
+shards, shard_text = {}, {}
+# Rows differ only in their text and tier, so the first row of each tier is enough for the critical CSS
+scanned = set()
 for cat in cat_order:
     items = data['categories'].get(cat, [])
     if not items:
@@ -296,29 +353,65 @@ for cat in cat_order:
     else:
         display_items = sorted(items, key=lambda x: (-x['variants'], x['name']))
 
-    lines.append(f'        <tr class="cat-header"><td colspan="5">{cat} ({len(items)} elements{", " + str(len(display_items)) + " unique shown" if len(display_items) < len(items) else ""})</td></tr>')
+    label = f'{cat} ({len(items)} elements{", " + str(len(display_items)) + " unique shown" if len(display_items) < len(items) else ""})'
+    # Search results link here (see search_index.py)
+    shard = anchor(cat)
+    if VIRTUAL:
+        # Same cells as the inline rows below; inventory.js builds the <tr>s
+        shards[shard] = [[item['name'], item['type'], str(item['variants']) if item['variants'] > 0 else '—', item['id'],
+                          get_tier(item)] for item in display_items]
+        shard_text[shard] = json.dumps(shards[shard], ensure_ascii=False, separators=(',', ':'))
+        version = hashlib.blake2b(shard_text[shard].encode(), digest_size=16).hexdigest()[:HASH_LEN]
+        lines.append(f'''    <details class="inv-category" id="{shard}" data-src="inventory/{shard}.json?v={version}" data-rows="{len(display_items)}">
+      <summary>{label}</summary>
+      <div class="inv-viewport"><table class="data-table"><thead><tr><th>Name</th><th>Type</th><th>Variants</th><th>Node ID</th><th>Tier</th></tr></thead><tbody></tbody></table></div>
+    </details>''')
+        continue
+
+    lines.append(f'        <tr class="cat-header" id="{shard}"><td colspan="5">{label}</td></tr>')
 
     for item in display_items:
         tier = get_tier(item)
         tier_class = f'tier-{tier}'
         v_display = str(item['variants']) if item['variants'] > 0 else '—'
-        lines.append(f'        <tr><td><strong>{item["name"]}</strong></td><td>{item["type"]}</td><td>{v_display}</td><td><span class="token-name">{item["id"]}</span></td><td><span class="tier-badge {tier_class}">T{tier}</span></td></tr>')
+        lines.append(f'        <tr><td><strong>{item["name"]}</strong></td><td>{item["type"]}</td><td>{v_display}</td><td><span class="token-name">{item["id"]}</span></td><td><span class="tier-badge {tier_class}">T{tier}</span></td></tr>',
+                     scan=tier not in scanned)
+        scanned.add(tier)
 
-lines.append('''      </tbody>
+lines.append(('' if VIRTUAL else '''      </tbody>
     </table>
-  </div>
+''') + '''  </div>
 </div>
 
-<footer class="site-footer">
-  AMI Design System Audit — Generated February 27, 2026 — <a href="https://github.com/d999ss/AMI-Design-System">GitHub</a>
-</footer>
+''' + LAYOUT.footer)
 
-</body>
-</html>
-''')
+out.close()
+head = critical_css.inline(head, critical_css.critical(critical_css.rules(), lines.vocab, set())).encode()
+size = len(head) + lines.size
+rendering.add(items=sum(len(rows) for rows in shards.values()) if VIRTUAL else 1, bytes=size)
+rendering.end()
+with buildtrace.span('write') as s:
+    with open(f'{OUTPUT}.tmp', 'wb') as f, open(f'{OUTPUT}.body.tmp', 'rb') as body:
+        f.write(head)
+        shutil.copyfileobj(body, f, 1 << 16)
+    os.remove(f'{OUTPUT}.body.tmp')
+    changed = replace_if_changed(f'{OUTPUT}.tmp', OUTPUT)
+    s.add(items=changed, bytes=size if changed else 0)
 
-html = '\n'.join(lines)
-with open('/Users/donnysmith/Projects/cloud/AMI-Design-System/components.html', 'w') as f:
-    f.write(html)
+print(f"Generated {os.path.basename(OUTPUT)} ({size} bytes{'' if changed else ', unchanged'})")
 
-print(f"Generated components.html ({len(html)} bytes)")
+if VIRTUAL:
+    os.makedirs(SHARD_DIR, exist_ok=True)
+    written = 0
+    for name, rows in shards.items():
+        with buildtrace.span('write shard', shard=name) as s:
+            text = shard_text[name]
+            if write_if_changed(os.path.join(SHARD_DIR, f'{name}.json'), text):
+                written += 1
+                s.add(items=len(rows), bytes=len(text.encode()))
+    # Shards of categories that are gone
+    for name in os.listdir(SHARD_DIR):
+        if name.endswith('.json') and name[:-5] not in shards:
+            os.remove(os.path.join(SHARD_DIR, name))
+    print(f'{len(shards)} category shards in {os.path.basename(SHARD_DIR)}/ '
+          f'({sum(map(len, shards.values()))} rows, {written} changed)')
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """Generate individual component detail pages for Tier 1 components using real Figma token data."""
-import json
 import os
 
-with open('/Users/donnysmith/Projects/cloud/AMI-Design-System/token_data.json') as f:
-    token_data = json.load(f)
+import asset_index
+import images
+import outputs
+import pagegen
+import token_graph
+from layout import Layout
 
-# Component definitions with real Figma data
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Component definitions with real Figma data. real_tokens are (property, token path)
+# pairs resolved from token_data.json by token_graph; a third item overrides the value shown.
 components = [
     {
         'name': 'Button',
@@ -30,25 +36,25 @@ components = [
         ],
         'sizes': ['Small (height: 48px)', 'Medium', 'Large'],
         'real_tokens': [
-            ('Container (Neutral)', 'Color/Container/Neutral/Interactive/Enable', '#090909'),
-            ('Container (Neutral Hover)', 'Color/Container/Neutral/Interactive/Hover', '#787676'),
-            ('Container (Brand)', 'Color/Container/Brand/Interactive/Enable', '#9a6b5e'),
-            ('Container (Brand Hover)', 'Color/Container/Brand/Interactive/Hover', '#7d574d'),
-            ('Container (Mute)', 'Color/Container/Neutral/Interactive/Mute enable', '#f7f6f5'),
-            ('Container (Destructive)', 'Color/Container/Status/Interactive/Enable negative', '#de3b2d'),
-            ('Container (Disabled)', 'Color/Container/Neutral/Disabled/Default', '#ece9e5'),
-            ('Text (Inverted)', 'Text/Neutral/Inverted', '#ffffff'),
-            ('Text (Default)', 'Text/Neutral/Default', '#090909'),
-            ('Text (Brand)', 'Color/Text/Brand/Default', '#9a6b5e'),
-            ('Text (Disabled)', 'Text/Neutral/Disabled/Default', '#b3b0ae'),
-            ('Border (Neutral)', 'Color/Border/Neutral/Default', '#090909'),
-            ('Border (Brand)', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
-            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default', '#c08676'),
-            ('Corner Radius', 'Corner/Small', '8px'),
-            ('Font', 'font family/graphik', 'Graphik'),
-            ('Font Size (S)', 'font size/04', '14px'),
-            ('Font Size (M)', 'font size/05', '16px'),
-            ('Font Size (L)', 'font size/06', '18px'),
+            ('Container (Neutral)', 'Color/Container/Neutral/Interactive/Enable'),
+            ('Container (Neutral Hover)', 'Color/Container/Neutral/Interactive/Hover'),
+            ('Container (Brand)', 'Color/Container/Brand/Interactive/Enable'),
+            ('Container (Brand Hover)', 'Color/Container/Brand/Interactive/Hover'),
+            ('Container (Mute)', 'Color/Container/Neutral/Interactive/Mute enable'),
+            ('Container (Destructive)', 'Color/Container/Status/Interactive/Enable negative'),
+            ('Container (Disabled)', 'Color/Container/Neutral/Disabled/Default'),
+            ('Text (Inverted)', 'Text/Neutral/Inverted'),
+            ('Text (Default)', 'Text/Neutral/Default'),
+            ('Text (Brand)', 'Color/Text/Brand/Default'),
+            ('Text (Disabled)', 'Text/Neutral/Disabled/Default'),
+            ('Border (Neutral)', 'Color/Border/Neutral/Default'),
+            ('Border (Brand)', 'Color/Border/Brand/Medium 3'),
+            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default'),
+            ('Corner Radius', 'Corner/Small'),
+            ('Font', 'font family/graphik'),
+            ('Font Size (S)', 'font size/04'),
+            ('Font Size (M)', 'font size/05'),
+            ('Font Size (L)', 'font size/06'),
         ],
         'legacy_note': 'IMPORTANT: Button also contains legacy <code>color/surface/interactive/</code> tokens that map to the same values. These should be removed during migration.',
     },
@@ -72,23 +78,23 @@ components = [
         ],
         'sizes': ['Medium (Body/Small)', 'Large (Body/Medium)'],
         'real_tokens': [
-            ('Background', 'Color/Container/Neutral/Base', '#ffffff'),
-            ('Background (Filled)', 'Color/Container/Neutral/Mute 1', '#fafafa'),
-            ('Border (Default)', 'Color/Border/Neutral/Text field/Enable', '#b3b0ae'),
-            ('Border (Hover)', 'Color/Border/Neutral/Text field/Hover', '#090909'),
-            ('Border (Error)', 'Color/Border/Status/Error medium 3', '#dc3426'),
-            ('Border (Disabled)', 'Color/Border/Neutral/Disabled/Default', '#b3b0ae'),
-            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default', '#c08676'),
-            ('Label Text', 'Text/Neutral/Default', '#090909'),
-            ('Placeholder', 'Text/Neutral/Placeholder', '#787676'),
-            ('Helper Text', 'Text/Neutral/Support', '#787676'),
-            ('Error Text', 'Text/Status/Error medium 3', '#dc3426'),
-            ('Disabled Text', 'Text/Neutral/Disabled/Default', '#b3b0ae'),
-            ('Corner Radius', 'Corner/Small', '8px'),
-            ('Corner (Grouped)', 'Corner/Medium small', '12px'),
-            ('Border Width', 'Stroke width/Extra light', '1px'),
-            ('Focus Border', 'Stroke width/Bold', '4px'),
-            ('Font', 'Font/Families/Graphik', 'Graphik'),
+            ('Background', 'Color/Container/Neutral/Base'),
+            ('Background (Filled)', 'Color/Container/Neutral/Mute 1'),
+            ('Border (Default)', 'Color/Border/Neutral/Text field/Enable'),
+            ('Border (Hover)', 'Color/Border/Neutral/Text field/Hover'),
+            ('Border (Error)', 'Color/Border/Status/Error medium 3'),
+            ('Border (Disabled)', 'Color/Border/Neutral/Disabled/Default'),
+            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default'),
+            ('Label Text', 'Text/Neutral/Default'),
+            ('Placeholder', 'Text/Neutral/Placeholder'),
+            ('Helper Text', 'Text/Neutral/Support'),
+            ('Error Text', 'Text/Status/Error medium 3'),
+            ('Disabled Text', 'Text/Neutral/Disabled/Default'),
+            ('Corner Radius', 'Corner/Small'),
+            ('Corner (Grouped)', 'Corner/Medium small'),
+            ('Border Width', 'Stroke width/Extra light'),
+            ('Focus Border', 'Stroke width/Bold'),
+            ('Font', 'Font/Families/Graphik'),
             ('Padding', 'Space/4, Space/8, Space/12, Space/16', '4-16px scale'),
         ],
         'legacy_note': 'Error color is #dc3426 here vs #de3b2d in Button/Select — inconsistency to resolve.',
@@ -112,21 +118,21 @@ components = [
         ],
         'sizes': ['Medium', 'Large'],
         'real_tokens': [
-            ('Background', 'Color/Container/Neutral/Base', '#ffffff'),
-            ('Dropdown Bg', 'Color/Container/Neutral/Mute 1', '#fafafa'),
-            ('Border (Default)', 'Color/Border/Neutral/Text field/Enable', '#b3b0ae'),
-            ('Border (Hover)', 'Color/Border/Neutral/Text field/Hover', '#090909'),
-            ('Border (Divider)', 'Color/Border/Neutral/Subtle 2', '#dedad7'),
-            ('Border (Error)', 'Color/Border/Status/Error medium 3', '#de3b2d'),
-            ('Selected Accent', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
-            ('Text', 'Text/Neutral/Default', '#090909'),
-            ('Placeholder', 'Text/Neutral/Placeholder', '#787676'),
-            ('Support', 'Text/Neutral/Support', '#787676'),
-            ('Error', 'Text/Status/Error medium 3', '#de3b2d'),
+            ('Background', 'Color/Container/Neutral/Base'),
+            ('Dropdown Bg', 'Color/Container/Neutral/Mute 1'),
+            ('Border (Default)', 'Color/Border/Neutral/Text field/Enable'),
+            ('Border (Hover)', 'Color/Border/Neutral/Text field/Hover'),
+            ('Border (Divider)', 'Color/Border/Neutral/Subtle 2'),
+            ('Border (Error)', 'Color/Border/Status/Error medium 3'),
+            ('Selected Accent', 'Color/Border/Brand/Medium 3'),
+            ('Text', 'Text/Neutral/Default'),
+            ('Placeholder', 'Text/Neutral/Placeholder'),
+            ('Support', 'Text/Neutral/Support'),
+            ('Error', 'Text/Status/Error medium 3'),
             ('Elevation', 'Elevation 2/Cast down', '4-layer shadow'),
-            ('Corner', 'Corner/Small', '8px'),
-            ('Pill Corner', 'Corner/Circle', '999px'),
-            ('Font', 'font family/graphik', 'Graphik'),
+            ('Corner', 'Corner/Small'),
+            ('Pill Corner', 'Corner/Circle'),
+            ('Font', 'font family/graphik'),
         ],
         'legacy_note': 'Error color is #de3b2d here vs #dc3426 in Text Input — inconsistency in the same system.',
     },
@@ -148,18 +154,18 @@ components = [
         ],
         'sizes': [],
         'real_tokens': [
-            ('Background', 'Color/Container/Neutral/Base', '#ffffff'),
-            ('Divider', 'Color/Border/Neutral/Subtle 2', '#dedad7'),
-            ('Active Border', 'Color/Border/Brand/Medium 2', '#c08676'),
-            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default', '#c08676'),
-            ('Icon (Default)', 'Color/Icon/Neutral/Interactive/Enable support', '#787676'),
-            ('Icon (Active)', 'Color/Icon/Neutral/Interactive/Active support', '#090909'),
-            ('Title (Default)', 'Text/Neutral/Interactive/Enable support', '#787676'),
-            ('Title (Active)', 'Text/Neutral/Interactive/Active support', '#090909'),
+            ('Background', 'Color/Container/Neutral/Base'),
+            ('Divider', 'Color/Border/Neutral/Subtle 2'),
+            ('Active Border', 'Color/Border/Brand/Medium 2'),
+            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default'),
+            ('Icon (Default)', 'Color/Icon/Neutral/Interactive/Enable support'),
+            ('Icon (Active)', 'Color/Icon/Neutral/Interactive/Active support'),
+            ('Title (Default)', 'Text/Neutral/Interactive/Enable support'),
+            ('Title (Active)', 'Text/Neutral/Interactive/Active support'),
             ('Headline Font', 'Font/Families/Petersburg', 'Petersburg (serif)'),
             ('Body Font', 'font family/graphik', 'Graphik (sans)'),
-            ('Headline Size', 'Font/Font size/8', '24px'),
-            ('Body Size', 'font size/05', '16px'),
+            ('Headline Size', 'Font/Font size/8'),
+            ('Body Size', 'font size/05'),
             ('Spacing', 'spacing/04 through spacing/24', '4-24px scale'),
         ],
         'legacy_note': 'Mixes PascalCase (Font/Families/Petersburg, Font/Font size/8) and lowercase (font size/05, spacing/08) token naming.',
@@ -182,21 +188,21 @@ components = [
         ],
         'sizes': ['Small', 'Medium'],
         'real_tokens': [
-            ('Bg (Neutral)', 'Color/Container/Neutral/Mute 2', '#f7f6f5'),
-            ('Bg (Success)', 'Color/Container/Status/Success subtle 1', '#d9eddd'),
-            ('Bg (Error)', 'Color/Container/Status/Error subtle 1', '#fee1de'),
-            ('Bg (Warning)', 'Color/Container/Status/Warning subtle 1', '#ffe5aa'),
-            ('Bg (Brand)', 'Color/Container/Brand/Subtle 1', '#f1e5e2'),
-            ('Border (Success)', 'Color/Border/Status/Positive medium 3', '#0b8923'),
-            ('Border (Warning)', 'Color/Border/Status/Warning medium 3', '#ef8f00'),
-            ('Border (Error)', 'Color/Border/Status/Error medium 3', '#de3b2d'),
-            ('Border (Brand)', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
-            ('Text (Neutral)', 'Text/Neutral/Default', '#090909'),
-            ('Text (Success)', 'Text/Status/Success bold 1', '#065a18'),
-            ('Text (Error)', 'Text/Status/Error medium 3', '#961307'),
-            ('Text (Warning)', 'Text/Status/Warning bold 2', '#863300'),
-            ('Text (Brand)', 'Color/Text/Brand/Bold 1', '#7d574d'),
-            ('Corner', 'Corner/Small', '8px'),
+            ('Bg (Neutral)', 'Color/Container/Neutral/Mute 2'),
+            ('Bg (Success)', 'Color/Container/Status/Success subtle 1'),
+            ('Bg (Error)', 'Color/Container/Status/Error subtle 1'),
+            ('Bg (Warning)', 'Color/Container/Status/Warning subtle 1'),
+            ('Bg (Brand)', 'Color/Container/Brand/Subtle 1'),
+            ('Border (Success)', 'Color/Border/Status/Positive medium 3'),
+            ('Border (Warning)', 'Color/Border/Status/Warning medium 3'),
+            ('Border (Error)', 'Color/Border/Status/Error medium 3'),
+            ('Border (Brand)', 'Color/Border/Brand/Medium 3'),
+            ('Text (Neutral)', 'Text/Neutral/Default'),
+            ('Text (Success)', 'Text/Status/Success bold 1'),
+            ('Text (Error)', 'Text/Status/Error medium 3'),
+            ('Text (Warning)', 'Text/Status/Warning bold 2'),
+            ('Text (Brand)', 'Color/Text/Brand/Bold 1'),
+            ('Corner', 'Corner/Small'),
             ('Font', 'font family/graphik', 'Graphik 12px'),
         ],
         'legacy_note': 'Badge error text uses #961307 vs #de3b2d (border) vs #dc3426 (Text Input) — three different "error reds".',
@@ -222,15 +228,15 @@ components = [
         ],
         'sizes': ['Footnote (12px)', 'Body Small (14px)', 'Body Medium (16px)'],
         'real_tokens': [
-            ('Text (Brand Enable)', 'Text/Brand/Interactive/Enable', '#9a6b5e'),
-            ('Text (Brand Hover)', 'Text/Brand/Interactive/Hover', '#60433b'),
-            ('Text (Brand Pressed)', 'Text/Brand/Interactive/Pressed', '#30211e'),
-            ('Text (Neutral Enable)', 'Text/Neutral/Interactive/Enable', '#090909'),
-            ('Text (Neutral Hover)', 'Text/Neutral/Interactive/Hover', '#787676'),
-            ('Text (Inverted Enable)', 'Color/Text/Neutral/Interactive/Inverted enable', '#ffffff'),
-            ('Text (Inverted Hover)', 'Color/Text/Neutral/Interactive/Inverted hover', '#ece9e5'),
-            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default', '#c08676'),
-            ('Font', 'font family/graphik', 'Graphik'),
+            ('Text (Brand Enable)', 'Text/Brand/Interactive/Enable'),
+            ('Text (Brand Hover)', 'Text/Brand/Interactive/Hover'),
+            ('Text (Brand Pressed)', 'Text/Brand/Interactive/Pressed'),
+            ('Text (Neutral Enable)', 'Text/Neutral/Interactive/Enable'),
+            ('Text (Neutral Hover)', 'Text/Neutral/Interactive/Hover'),
+            ('Text (Inverted Enable)', 'Color/Text/Neutral/Interactive/Inverted enable'),
+            ('Text (Inverted Hover)', 'Color/Text/Neutral/Interactive/Inverted hover'),
+            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default'),
+            ('Font', 'font family/graphik'),
         ],
         'legacy_note': None,
     },
@@ -252,13 +258,13 @@ components = [
         ],
         'sizes': [],
         'real_tokens': [
-            ('Checkmark', 'Color/Icon/Neutral/Black', '#090909'),
-            ('Icon (alt)', 'Icon/Neutral/Black', '#090909'),
-            ('Icon Default', 'Color/Icon/Neutral/Default', '#090909'),
-            ('Icon Disabled', 'Color/Icon/Neutral/Disabled/Default', '#b3b0ae'),
-            ('Icon Error', 'Color/Icon/Status/Error medium 3', '#dc3426'),
-            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default', '#c08676'),
-            ('Spacing', 'Space/8', '8px'),
+            ('Checkmark', 'Color/Icon/Neutral/Black'),
+            ('Icon (alt)', 'Icon/Neutral/Black'),
+            ('Icon Default', 'Color/Icon/Neutral/Default'),
+            ('Icon Disabled', 'Color/Icon/Neutral/Disabled/Default'),
+            ('Icon Error', 'Color/Icon/Status/Error medium 3'),
+            ('Focus Ring', 'Color/Border/Brand/Focus ring/Default'),
+            ('Spacing', 'Space/8'),
         ],
         'legacy_note': 'Uses same error red (#dc3426) as Text Input, different from Button/Select (#de3b2d).',
     },
@@ -281,14 +287,14 @@ components = [
         ],
         'sizes': ['Standard (font size 16px)', 'Large (font size 20px)'],
         'real_tokens': [
-            ('Background', 'Color/Container/Transparent/Clear', 'transparent'),
-            ('Divider', 'Color/Border/Neutral/Subtle 2', '#dedad7'),
-            ('Active Indicator', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
-            ('Icon (Default)', 'Color/Icon/Neutral/Interactive/Enable support', '#787676'),
-            ('Icon (Active)', 'Color/Icon/Neutral/Interactive/Active support', '#090909'),
-            ('Text (Default)', 'Text/Neutral/Interactive/Enable support', '#787676'),
-            ('Text (Active)', 'Text/Neutral/Interactive/Active support', '#090909'),
-            ('Font', 'font family/graphik', 'Graphik'),
+            ('Background', 'Color/Container/Transparent/Clear'),
+            ('Divider', 'Color/Border/Neutral/Subtle 2'),
+            ('Active Indicator', 'Color/Border/Brand/Medium 3'),
+            ('Icon (Default)', 'Color/Icon/Neutral/Interactive/Enable support'),
+            ('Icon (Active)', 'Color/Icon/Neutral/Interactive/Active support'),
+            ('Text (Default)', 'Text/Neutral/Interactive/Enable support'),
+            ('Text (Active)', 'Text/Neutral/Interactive/Active support'),
+            ('Font', 'font family/graphik'),
             ('Font Size', 'font size/05 / font size/07', '16px / 20px'),
             ('Spacing', 'spacing/04 through spacing/24', '4-24px'),
         ],
@@ -310,12 +316,12 @@ components = [
         ],
         'sizes': [],
         'real_tokens': [
-            ('Background', 'Color/Container/Neutral/Strong 1', '#272625'),
-            ('Text', 'Text/Neutral/Inverted', '#ffffff'),
-            ('Icon', 'Color/Icon/Neutral/Default', '#090909'),
-            ('Trigger Border', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
+            ('Background', 'Color/Container/Neutral/Strong 1'),
+            ('Text', 'Text/Neutral/Inverted'),
+            ('Icon', 'Color/Icon/Neutral/Default'),
+            ('Trigger Border', 'Color/Border/Brand/Medium 3'),
             ('Shadow', 'Elevation 2/Cast down', '4-layer drop shadow'),
-            ('Corner Radius', 'corner/extra_small', '4px'),
+            ('Corner Radius', 'corner/extra_small'),
             ('Spacing', 'spacing/02, spacing/08', '2px, 8px'),
             ('Font', 'font family/graphik', 'Graphik 14px'),
         ],
@@ -339,17 +345,17 @@ components = [
         ],
         'sizes': [],
         'real_tokens': [
-            ('Text (Brand)', 'Text/Brand/Default', '#9a6b5e'),
-            ('Text (Default)', 'Text/Neutral/Default', '#090909'),
-            ('Text (Disabled)', 'Text/Neutral/Disabled/Default', '#b3b0ae'),
-            ('Text (Error)', 'Text/Status/Error medium 3', '#de3b2d'),
-            ('Icon (Brand)', 'Color/Icon/Brand/Default', '#9a6b5e'),
-            ('Container (Brand)', 'Color/Container/Brand/Transparent interactive/Enable', 'transparent'),
-            ('Container (Brand Hover)', 'Color/Container/Brand/Transparent interactive/Hover', '#c0867633'),
-            ('Container (Mute)', 'Color/Container/Neutral/Transparent interactive/Mute enable', 'transparent'),
-            ('Border (Brand)', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
-            ('Border (Neutral)', 'Color/Border/Neutral/Black/Alpha 100', '#090909'),
-            ('Border (Error)', 'Color/Border/Status/Error medium 3', '#de3b2d'),
+            ('Text (Brand)', 'Text/Brand/Default'),
+            ('Text (Default)', 'Text/Neutral/Default'),
+            ('Text (Disabled)', 'Text/Neutral/Disabled/Default'),
+            ('Text (Error)', 'Text/Status/Error medium 3'),
+            ('Icon (Brand)', 'Color/Icon/Brand/Default'),
+            ('Container (Brand)', 'Color/Container/Brand/Transparent interactive/Enable'),
+            ('Container (Brand Hover)', 'Color/Container/Brand/Transparent interactive/Hover'),
+            ('Container (Mute)', 'Color/Container/Neutral/Transparent interactive/Mute enable'),
+            ('Border (Brand)', 'Color/Border/Brand/Medium 3'),
+            ('Border (Neutral)', 'Color/Border/Neutral/Black/Alpha 100'),
+            ('Border (Error)', 'Color/Border/Status/Error medium 3'),
             ('Corner', 'Corner/Circle', '999px (pill)'),
             ('Font', 'font family/graphik', 'Graphik 12px'),
         ],
@@ -389,7 +395,7 @@ components = [
         ],
         'sizes': [],
         'real_tokens': [
-            ('Background', '/Primary / 000000', '#000000'),
+            ('Background', '/Primary / 000000'),
             ('Font', 'Desktop/P2', 'Roboto 16px Regular'),
         ],
         'legacy_note': 'LEGACY SYSTEM: Uses /Primary color naming and Roboto font. Only 2 token bindings total. Must migrate to semantic tokens and Graphik font.',
@@ -410,11 +416,11 @@ components = [
         ],
         'sizes': ['32px (size/32)'],
         'real_tokens': [
-            ('Size', 'size/32', '32px'),
-            ('Shape', 'Corner/Circle', '999px'),
-            ('Background', 'Color/Container/Transparent/Clear', 'transparent'),
-            ('Border (Neutral)', 'Color/Border/Neutral/Medium 2', '#9b9997'),
-            ('Border (Brand)', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
+            ('Size', 'size/32'),
+            ('Shape', 'Corner/Circle'),
+            ('Background', 'Color/Container/Transparent/Clear'),
+            ('Border (Neutral)', 'Color/Border/Neutral/Medium 2'),
+            ('Border (Brand)', 'Color/Border/Brand/Medium 3'),
         ],
         'legacy_note': None,
     },
@@ -434,13 +440,13 @@ components = [
         ],
         'sizes': [],
         'real_tokens': [
-            ('Text', 'Text & Icons/Default', '#090909'),
-            ('Background (Base)', 'Color/White/100', '#ffffff'),
-            ('Warning Color', 'Color/Utility/Yellow', '#ffc32a'),
-            ('Error Color', 'Color/Utility/Red', '#ff0000'),
-            ('Success Color', 'Color/Utility/Green', '#74cc4f'),
-            ('Spacing', 'Spacing/8', '8px'),
-            ('Spacing (Large)', 'Spacing/16', '16px'),
+            ('Text', 'Text & Icons/Default'),
+            ('Background (Base)', 'Color/White/100'),
+            ('Warning Color', 'Color/Utility/Yellow'),
+            ('Error Color', 'Color/Utility/Red'),
+            ('Success Color', 'Color/Utility/Green'),
+            ('Spacing', 'Spacing/8'),
+            ('Spacing (Large)', 'Spacing/16'),
         ],
         'legacy_note': 'LEGACY SYSTEM: Uses "Text & Icons" naming, Color/Utility colors (raw hex like #ff0000), and a third spacing convention (Spacing/8). Three separate systems to migrate.',
     },
@@ -461,11 +467,11 @@ components = [
         ],
         'sizes': [],
         'real_tokens': [
-            ('Background', 'Color/Container/Neutral/Base', '#ffffff'),
-            ('Brand Accent', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
+            ('Background', 'Color/Container/Neutral/Base'),
+            ('Brand Accent', 'Color/Border/Brand/Medium 3'),
             ('Shadow', 'Elevation 2/Cast down', '4-layer drop shadow'),
-            ('Corner', 'Corner/Extra small', '4px'),
-            ('Spacing', 'Space/8', '8px'),
+            ('Corner', 'Corner/Extra small'),
+            ('Spacing', 'Space/8'),
         ],
         'legacy_note': None,
     },
@@ -519,16 +525,21 @@ components = [
     },
 ]
 
-OUT_DIR = '/Users/donnysmith/Projects/cloud/AMI-Design-System/components'
+OUT_DIR = os.path.join(ROOT, 'components')
+LAYOUT = Layout('components.html', prefix='../')
+# Rendered width of the screenshot card: .page is at most 1440px with 64px side padding
+SCREENSHOT_SIZES = '(max-width: 1440px) 100vw, 1312px'
 
 def build_page(comp):
-    has_screenshot = os.path.exists(f'/Users/donnysmith/Projects/cloud/AMI-Design-System/img/components/{comp["slug"]}.png')
+    screenshot = asset_index.get(f'img/components/{comp["slug"]}.png')
 
     screenshot_html = ''
-    if has_screenshot:
+    if screenshot:
         screenshot_html = f'''
-      <div class="card" style="padding:24px;text-align:center;margin-bottom:24px">
-        <img src="../img/components/{comp['slug']}.png" alt="{comp['name']} component variants" style="max-width:100%;border-radius:4px" loading="lazy">
+      <div class="card" style="padding:0;overflow:hidden;border-radius:8px;margin-bottom:24px">
+        {images.picture(f'img/components/{comp["slug"]}.png', f'{comp["name"]} — Figma screenshot', SCREENSHOT_SIZES,
+                        prefix='../', attrs=' loading="lazy" style="width:100%;height:auto;display:block"'
+                        + asset_index.img_attrs(screenshot))}
       </div>'''
     else:
         screenshot_html = f'''
@@ -585,7 +596,7 @@ def build_page(comp):
 
     # Token table (real Figma data)
     token_rows = ''
-    for prop, token, value in comp.get('real_tokens', []):
+    for prop, token, value in token_graph.graph().rows(comp['slug'], comp.get('real_tokens', [])):
         is_color = value.startswith('#') and len(value) <= 9
         swatch = f'<span style="display:inline-block;width:14px;height:14px;border-radius:3px;background:{value};border:1px solid #ddd;vertical-align:middle;margin-right:6px"></span>' if is_color else ''
         token_rows += f'          <tr><td>{prop}</td><td><span class="token-name">{token}</span></td><td>{swatch}{value}</td></tr>\n'
@@ -620,33 +631,7 @@ def build_page(comp):
       <p>{comp['legacy_note']}</p>
     </div>'''
 
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{comp['name']} — AMI Design System Audit</title>
-<link rel="stylesheet" href="../style.css">
-</head>
-<body>
-
-<nav class="site-nav">
-  <div class="nav-inner">
-    <a href="../index.html" class="nav-brand">AMI Design System</a>
-    <div class="nav-links">
-      <a href="../index.html">Overview</a>
-      <a href="../tokens.html">Tokens</a>
-      <a href="../components.html" class="active">Components</a>
-      <a href="../screens.html">Screens</a>
-      <a href="../assets.html">Assets</a>
-      <a href="../architecture.html">Architecture</a>
-      <a href="../patterns.html">Patterns</a>
-      <a href="../remediation.html">Remediation</a>
-    </div>
-  </div>
-</nav>
-
-<div class="page">
+    body = f'''<div class="page">
   <div class="breadcrumb">
     <a href="../components.html">Components</a> &rsaquo; {comp['name']}
   </div>
@@ -700,20 +685,21 @@ def build_page(comp):
   </div>
 </div>
 
-<footer class="site-footer">
-  AMI Design System Audit &mdash; Generated February 27, 2026 &mdash; <a href="https://github.com/d999ss/AMI-Design-System">GitHub</a>
-</footer>
-
-</body>
-</html>
 '''
+    return LAYOUT.render(comp['name'], body)
+
+
+def main(argv=None):
+    """Write every page in `components` to OUT_DIR."""
+    args = pagegen.parse_args(__doc__, argv)
+    results, elapsed = pagegen.write_pages(components, build_page, OUT_DIR, args.jobs)
+    for comp, (size, changed) in zip(components, results):
+        print(f'  {comp["slug"]}.html ({size:,} bytes{"" if changed else ", unchanged"}) — {comp["token_system"]}')
+
+    print(f'\nRegenerated {len(components)} component detail pages with real Figma token data')
+    print(pagegen.rate(len(components), elapsed, args.jobs))
+    print(outputs.summary([changed for _, changed in results]))
 
-# Generate all pages
-for comp in components:
-    html = build_page(comp)
-    path = os.path.join(OUT_DIR, f'{comp["slug"]}.html')
-    with open(path, 'w') as f:
-        f.write(html)
-    print(f'  {comp["slug"]}.html ({len(html):,} bytes) — {comp["token_system"]}')
 
-print(f'\nRegenerated {len(components)} component detail pages with real Figma token data')
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 """Generate Tier 1 Batch 2 component detail pages using real Figma token data."""
-import json
 import os
 
-with open('/Users/donnysmith/Projects/cloud/AMI-Design-System/token_data.json') as f:
-    token_data = json.load(f)
+import asset_index
+import images
+import outputs
+import pagegen
+import token_graph
+from layout import Layout
 
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# real_tokens as in build_detail_pages.py: (property, token path[, shown value])
 components = [
     {
         'name': 'Modal',
@@ -26,21 +32,21 @@ components = [
         ],
         'sizes': ['Small (480px)', 'Medium (640px)', 'Large (800px)'],
         'real_tokens': [
-            ('Text (Default)', 'Text/Neutral/Default', '#090909'),
-            ('Close Icon', 'Color/Icon/Neutral/Default', '#090909'),
+            ('Text (Default)', 'Text/Neutral/Default'),
+            ('Close Icon', 'Color/Icon/Neutral/Default'),
             ('Container (Transparent)', 'Color/Container/Neutral/Transparent interactive/Enable', '#ffffff00'),
             ('Background (Clear)', 'Color/Container/Transparent/Clear', '#ffffff00'),
-            ('Backdrop Overlay', 'Color/Container/Neutral/Tinted interactive/Enable', '#0909091f'),
-            ('Corner Radius', 'Corner/Extra small', '4px'),
-            ('Corner (Pill)', 'Corner/Circle', '999px'),
-            ('Padding (Space/6)', 'Space/6', '6px'),
-            ('Padding (Space/8)', 'Space/8', '8px'),
-            ('Gap (spacing/08)', 'spacing/08', '8px'),
-            ('Padding (spacing/16)', 'spacing/16', '16px'),
-            ('Padding (spacing/24)', 'spacing/24', '24px'),
-            ('Title Font', 'font family/graphik', 'Graphik'),
-            ('Title Size', 'font size/07', '20px'),
-            ('Title Style', 'Headline/Extra small/Primary medium', 'Graphik Medium 20/24'),
+            ('Backdrop Overlay', 'Color/Container/Neutral/Tinted interactive/Enable'),
+            ('Corner Radius', 'Corner/Extra small'),
+            ('Corner (Pill)', 'Corner/Circle'),
+            ('Padding (Space/6)', 'Space/6'),
+            ('Padding (Space/8)', 'Space/8'),
+            ('Gap (spacing/08)', 'spacing/08'),
+            ('Padding (spacing/16)', 'spacing/16'),
+            ('Padding (spacing/24)', 'spacing/24'),
+            ('Title Font', 'font family/graphik'),
+            ('Title Size', 'font size/07'),
+            ('Title Style', 'Headline/Extra small/Primary medium'),
         ],
         'legacy_note': 'Modal uses BOTH Space/ and spacing/ naming for the same type of property (padding). These should be unified to one system during migration.',
     },
@@ -62,26 +68,26 @@ components = [
         ],
         'sizes': ['Responsive (viewport width)'],
         'real_tokens': [
-            ('Container', 'Color/Container/Neutral/Base', '#ffffff'),
+            ('Container', 'Color/Container/Neutral/Base'),
             ('Container (Transparent)', 'Color/Container/Neutral/Transparent interactive/Enable', '#ffffff00'),
             ('Container (Mute)', 'Color/Container/Neutral/Transparent interactive/Mute enable', '#ffffff00'),
-            ('Container (Action)', 'Color/Container/Neutral/Interactive/Enable', '#090909'),
-            ('Border', 'Color/Border/Neutral/Subtle 2', '#dedad7'),
-            ('Icon', 'Color/Icon/Neutral/Default', '#090909'),
-            ('Text', 'Text/Neutral/Default', '#090909'),
-            ('Text (Inverted)', 'Text/Neutral/Inverted', '#ffffff'),
+            ('Container (Action)', 'Color/Container/Neutral/Interactive/Enable'),
+            ('Border', 'Color/Border/Neutral/Subtle 2'),
+            ('Icon', 'Color/Icon/Neutral/Default'),
+            ('Text', 'Text/Neutral/Default'),
+            ('Text (Inverted)', 'Text/Neutral/Inverted'),
             ('Shadow', 'Elevation 2/Cast up', 'upward multi-shadow'),
-            ('Title Style', 'Body/Large/Medium', 'Graphik Medium 18/26'),
-            ('Body Style', 'Body/Small/Regular', 'Graphik Regular 14/20'),
-            ('Corner Radius', 'Corner/Extra small', '4px'),
-            ('Handle (Pill)', 'Corner/Circle', '999px'),
-            ('Padding (Space/6)', 'Space/6', '6px'),
-            ('Spacing', 'spacing/08', '8px'),
-            ('Gap', 'spacing/12', '12px'),
-            ('Padding', 'spacing/16', '16px'),
-            ('Padding (Large)', 'spacing/24', '24px'),
-            ('Viewport', 'viewport/common', '1440px'),
-            ('LEGACY Margin', 'Components (LEGACY)/Bottom Sheet (LEGACY)/24-Margin', '24px'),
+            ('Title Style', 'Body/Large/Medium'),
+            ('Body Style', 'Body/Small/Regular'),
+            ('Corner Radius', 'Corner/Extra small'),
+            ('Handle (Pill)', 'Corner/Circle'),
+            ('Padding (Space/6)', 'Space/6'),
+            ('Spacing', 'spacing/08'),
+            ('Gap', 'spacing/12'),
+            ('Padding', 'spacing/16'),
+            ('Padding (Large)', 'spacing/24'),
+            ('Viewport', 'viewport/common'),
+            ('LEGACY Margin', 'Components (LEGACY)/Bottom Sheet (LEGACY)/24-Margin'),
         ],
         'legacy_note': 'Contains legacy reference <code>Components (LEGACY)/Bottom Sheet (LEGACY)/24-Margin</code>. This should be migrated to <code>spacing/24</code> which already exists on this component with the same value.',
     },
@@ -103,24 +109,24 @@ components = [
         ],
         'sizes': ['XLarge (1440px)', 'Large (1280px)', 'Medium (768px)', 'Small (375px)'],
         'real_tokens': [
-            ('Icon', 'Color/Icon/Neutral/Default', '#090909'),
-            ('Icon (Interactive)', 'Color/Icon/Neutral/Interactive/Enable', '#090909'),
-            ('Link Text', 'Text/Neutral/Interactive/Enable', '#090909'),
-            ('Text', 'Text/Neutral/Default', '#090909'),
-            ('Text (Inverted)', 'Text/Neutral/Inverted', '#ffffff'),
+            ('Icon', 'Color/Icon/Neutral/Default'),
+            ('Icon (Interactive)', 'Color/Icon/Neutral/Interactive/Enable'),
+            ('Link Text', 'Text/Neutral/Interactive/Enable'),
+            ('Text', 'Text/Neutral/Default'),
+            ('Text (Inverted)', 'Text/Neutral/Inverted'),
             ('Container (Transparent)', 'Color/Container/Neutral/Transparent interactive/Enable', '#ffffff00'),
-            ('Button Fill', 'Color/Container/Neutral/Interactive/Enable', '#090909'),
-            ('Background', 'Section bg/Neutral/Base', '#ffffff'),
-            ('Brand Accent', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
-            ('Nav Font', 'Body/Small/Regular', 'Graphik Regular 14/20'),
+            ('Button Fill', 'Color/Container/Neutral/Interactive/Enable'),
+            ('Background', 'Section bg/Neutral/Base'),
+            ('Brand Accent', 'Color/Border/Brand/Medium 3'),
+            ('Nav Font', 'Body/Small/Regular'),
             ('Viewport Min', 'viewport/min', '1280'),
             ('Viewport Max', 'viewport/max', '2560'),
             ('Viewport Common', 'viewport/common', '1440'),
-            ('Device Logic', 'device logic/show desktop', 'true'),
-            ('Gap', 'spacing/04', '4px'),
-            ('Spacing', 'spacing/08', '8px'),
-            ('Padding', 'spacing/16', '16px'),
-            ('Section Gap', 'spacing/24', '24px'),
+            ('Device Logic', 'device logic/show desktop'),
+            ('Gap', 'spacing/04'),
+            ('Spacing', 'spacing/08'),
+            ('Padding', 'spacing/16'),
+            ('Section Gap', 'spacing/24'),
         ],
         'legacy_note': None,
     },
@@ -142,20 +148,20 @@ components = [
         ],
         'sizes': ['Default (280px width)'],
         'real_tokens': [
-            ('Link Text', 'Text/Neutral/Interactive/Enable', '#090909'),
-            ('Text', 'Text/Neutral/Default', '#090909'),
-            ('Text (Inverted)', 'Text/Neutral/Inverted', '#ffffff'),
+            ('Link Text', 'Text/Neutral/Interactive/Enable'),
+            ('Text', 'Text/Neutral/Default'),
+            ('Text (Inverted)', 'Text/Neutral/Inverted'),
             ('Nav Link (Brand)', 'Color/Container/Brand/Navlink/Enable', '#ffffff00'),
             ('Container (Transparent)', 'Color/Container/Neutral/Transparent interactive/Enable', '#ffffff00'),
-            ('Active Fill', 'Color/Container/Neutral/Interactive/Enable', '#090909'),
-            ('Background', 'Section bg/Neutral/Base', '#ffffff'),
-            ('Corner Radius', 'Corner/Extra small', '4px'),
-            ('Spacing', 'spacing/08', '8px'),
-            ('Gap', 'spacing/12', '12px'),
-            ('Padding', 'spacing/16', '16px'),
-            ('Font', 'font family/graphik', 'Graphik'),
-            ('Font Size', 'font size/04', '14px'),
-            ('LEGACY Link Height', 'Components (LEGACY)/NavBar (LEGACY)/NavBar/Consumer/Link', '20px'),
+            ('Active Fill', 'Color/Container/Neutral/Interactive/Enable'),
+            ('Background', 'Section bg/Neutral/Base'),
+            ('Corner Radius', 'Corner/Extra small'),
+            ('Spacing', 'spacing/08'),
+            ('Gap', 'spacing/12'),
+            ('Padding', 'spacing/16'),
+            ('Font', 'font family/graphik'),
+            ('Font Size', 'font size/04'),
+            ('LEGACY Link Height', 'Components (LEGACY)/NavBar (LEGACY)/NavBar/Consumer/Link'),
         ],
         'legacy_note': 'Contains legacy reference <code>Components (LEGACY)/NavBar (LEGACY)/NavBar/Consumer/Link: 20</code>. This hardcoded link dimension should be migrated to a semantic spacing token.',
     },
@@ -176,8 +182,8 @@ components = [
         ],
         'sizes': ['Full-width (responsive)'],
         'real_tokens': [
-            ('Fill', 'Fill / White', '#FFFFFF'),
-            ('Icon Color', 'Icon/Neutral/White', '#FFFFFF'),
+            ('Fill', 'Fill / White'),
+            ('Icon Color', 'Icon/Neutral/White'),
         ],
         'legacy_note': '<strong>CRITICAL:</strong> Footer has only 2 token bindings — among the least tokenized components. The older 4.0 Footer uses <strong>Roboto</strong> (not Graphik) and <code>/Primary / 000000</code> legacy tokens. Footer needs comprehensive tokenization for background, text, link, and spacing properties.',
     },
@@ -200,29 +206,29 @@ components = [
         'sizes': ['Fixed width (320px est.)'],
         'real_tokens': [
             ('Container (Transparent)', 'Color/Container/Neutral/Transparent interactive/Enable', '#ffffff00'),
-            ('User Section Bg', 'Color/Container/Brand/Mute 2', '#f9f3f1'),
-            ('Brand Fill', 'Color/Container/Brand/Medium 3', '#9a6b5e'),
-            ('Static Black', 'Color/Container/Neutral/Static/Black', '#090909'),
-            ('Border', 'Color/Border/Neutral/Subtle 2', '#dedad7'),
-            ('Border (Alpha)', 'Color/Border/Neutral/Default 08', '#09090914'),
-            ('Brand Border', 'Color/Border/Brand/Medium 3', '#9a6b5e'),
-            ('Text', 'Text/Neutral/Default', '#090909'),
-            ('Text (Support)', 'Text/Neutral/Support', '#787676'),
-            ('Text (Brand)', 'Text/Brand/Default', '#9a6b5e'),
-            ('Background', 'Section bg/Neutral/Base', '#ffffff'),
-            ('Section Bg (Brand)', 'Section bg/Brand/Subtle 1', '#f1e5e2'),
-            ('Shadow', 'Elevation 2/Cast down', 'multi-shadow'),
-            ('Avatar Radius', 'Corner/Circle', '999px'),
-            ('Container Radius', 'Corner/Medium', '16px'),
-            ('Spacing (Space/6)', 'Space/6', '6px'),
-            ('Gap', 'spacing/04', '4px'),
-            ('Spacing', 'spacing/08', '8px'),
-            ('Padding', 'spacing/16', '16px'),
-            ('Section Gap', 'spacing/24', '24px'),
-            ('Title', 'Body/Medium/Medium', 'Graphik Medium 16/24'),
-            ('Body', 'Body/Medium/Regular', 'Graphik Regular 16/24'),
-            ('Small Text', 'Body/Small/Regular', 'Graphik Regular 14/20'),
-            ('Footnote', 'Footnote/Regular', 'Graphik Regular 12/18'),
+            ('User Section Bg', 'Color/Container/Brand/Mute 2'),
+            ('Brand Fill', 'Color/Container/Brand/Medium 3'),
+            ('Static Black', 'Color/Container/Neutral/Static/Black'),
+            ('Border', 'Color/Border/Neutral/Subtle 2'),
+            ('Border (Alpha)', 'Color/Border/Neutral/Default 08'),
+            ('Brand Border', 'Color/Border/Brand/Medium 3'),
+            ('Text', 'Text/Neutral/Default'),
+            ('Text (Support)', 'Text/Neutral/Support'),
+            ('Text (Brand)', 'Text/Brand/Default'),
+            ('Background', 'Section bg/Neutral/Base'),
+            ('Section Bg (Brand)', 'Section bg/Brand/Subtle 1'),
+            ('Shadow', 'Elevation 2/Cast down'),
+            ('Avatar Radius', 'Corner/Circle'),
+            ('Container Radius', 'Corner/Medium'),
+            ('Spacing (Space/6)', 'Space/6'),
+            ('Gap', 'spacing/04'),
+            ('Spacing', 'spacing/08'),
+            ('Padding', 'spacing/16'),
+            ('Section Gap', 'spacing/24'),
+            ('Title', 'Body/Medium/Medium'),
+            ('Body', 'Body/Medium/Regular'),
+            ('Small Text', 'Body/Small/Regular'),
+            ('Footnote', 'Footnote/Regular'),
         ],
         'legacy_note': 'Uses BOTH <code>Space/6</code> (PascalCase) and <code>spacing/04</code> (lowercase) within the same component. These should be unified during migration.',
     },
@@ -263,18 +269,18 @@ components = [
         ],
         'sizes': ['XL (logged in)', 'L (1280px)', 'M (768px)', 'S (375px)'],
         'real_tokens': [
-            ('Text', 'Text & Icons/Default', '#090909'),
-            ('Text (Neutral)', 'Text & Icons/Neutral', '#323131'),
-            ('Text (White)', 'Text & Icons/White', '#ffffff'),
-            ('Text (Light)', 'Text & Icons/Light', '#e5e5e5'),
-            ('Background', 'Color/White/100', '#ffffff'),
-            ('Container Bg', 'Color/Neutral Grey/40', '#f7f5f1'),
-            ('Headline', 'Headline/Medium', 'Graphik Regular 24/1.2'),
-            ('Body', 'Body/Small', 'Graphik Regular 13/20'),
-            ('Spacing (32)', 'Spacing/32', '32px'),
-            ('Spacing (48)', 'Spacing/48', '48px'),
-            ('Spacing (80)', 'Spacing/80', '80px'),
-            ('Spacing (124)', 'Spacing/124', '124px'),
+            ('Text', 'Text & Icons/Default'),
+            ('Text (Neutral)', 'Text & Icons/Neutral'),
+            ('Text (White)', 'Text & Icons/White'),
+            ('Text (Light)', 'Text & Icons/Light'),
+            ('Background', 'Color/White/100'),
+            ('Container Bg', 'Color/Neutral Grey/40'),
+            ('Headline', 'Headline/Medium'),
+            ('Body', 'Body/Small'),
+            ('Spacing (32)', 'Spacing/32'),
+            ('Spacing (48)', 'Spacing/48'),
+            ('Spacing (80)', 'Spacing/80'),
+            ('Spacing (124)', 'Spacing/124'),
         ],
         'legacy_note': '<strong>FULLY LEGACY:</strong> Every token uses old naming (<code>Text & Icons/</code>, <code>Color/White/100</code>, <code>Spacing/</code>). Spacing values 80px and 124px are unique to ISI — may need new tokens in the semantic system. Migration map: <code>Text & Icons/Default</code> → <code>Text/Neutral/Default</code>, <code>Color/Neutral Grey/40</code> → <code>Color/Container/Neutral/Mute 1</code>.',
     },
@@ -294,10 +300,10 @@ components = [
         ],
         'sizes': ['Responsive (container-width)'],
         'real_tokens': [
-            ('Spacing', 'Spacing/16', '16px'),
-            ('Gap', 'Spacing/8', '8px'),
-            ('Border (Light)', 'Color/Black/20', '#e5e5e5'),
-            ('Text (Dark)', 'Color/Black/50', '#323131'),
+            ('Spacing', 'Spacing/16'),
+            ('Gap', 'Spacing/8'),
+            ('Border (Light)', 'Color/Black/20'),
+            ('Text (Dark)', 'Color/Black/50'),
         ],
         'legacy_note': '<strong>CRITICAL:</strong> Only 4 tokens, all legacy naming (<code>Spacing/</code>, <code>Color/Black/</code>). Brand-specific colors appear hardcoded. Consider creating a brand token collection: <code>Color/Brand/Botox/*</code>, <code>Color/Brand/Juvederm/*</code>, etc. Migration: <code>Spacing/16</code> → <code>spacing/16</code>, <code>Color/Black/20</code> → <code>Color/Border/Neutral/Subtle 2</code>.',
     },
@@ -320,23 +326,23 @@ components = [
         ],
         'sizes': ['XL (1440px)', 'L (1280px)', 'M (768px)', 'S (375px)'],
         'real_tokens': [
-            ('Text', 'Text & Icons/Default', '#090909'),
-            ('Text (White)', 'Text & Icons/White', '#ffffff'),
-            ('Text (Neutral)', 'Text & Icons/Neutral', '#323131'),
-            ('Text (Subdued)', 'Text & Icons/Subdued', '#818386'),
-            ('Brand Accent', 'Color/Dusty Rose/100', '#c08676'),
-            ('Background', 'Color/White/100', '#ffffff'),
-            ('Border/Divider', 'Color/Neutral Grey/80', '#e9e5de'),
-            ('Dark Fill', 'Color/Black/50', '#323131'),
-            ('Meta Font', 'Desktop/P3', 'Graphik Regular 13/24'),
-            ('Title', 'Headline/Small (Medium)', 'Graphik Medium 22/1.2'),
-            ('Body', 'Body/Small', 'Graphik Regular 13/20'),
-            ('Button', 'Button/Regular', 'Graphik Regular 16/1.5'),
-            ('Spacing (0)', 'Spacing/0', '0px'),
-            ('Spacing (8)', 'Spacing/8', '8px'),
-            ('Spacing (12)', 'Spacing/12', '12px'),
-            ('Spacing (16)', 'Spacing/16', '16px'),
-            ('Spacing (24)', 'Spacing/24', '24px'),
+            ('Text', 'Text & Icons/Default'),
+            ('Text (White)', 'Text & Icons/White'),
+            ('Text (Neutral)', 'Text & Icons/Neutral'),
+            ('Text (Subdued)', 'Text & Icons/Subdued'),
+            ('Brand Accent', 'Color/Dusty Rose/100'),
+            ('Background', 'Color/White/100'),
+            ('Border/Divider', 'Color/Neutral Grey/80'),
+            ('Dark Fill', 'Color/Black/50'),
+            ('Meta Font', 'Desktop/P3'),
+            ('Title', 'Headline/Small (Medium)'),
+            ('Body', 'Body/Small'),
+            ('Button', 'Button/Regular'),
+            ('Spacing (0)', 'Spacing/0'),
+            ('Spacing (8)', 'Spacing/8'),
+            ('Spacing (12)', 'Spacing/12'),
+            ('Spacing (16)', 'Spacing/16'),
+            ('Spacing (24)', 'Spacing/24'),
         ],
         'legacy_note': '<strong>HIGH PRIORITY MIGRATION:</strong> Cards appear on every major screen (Home Dashboard, Course Catalog, Live Events). All 17 tokens use legacy naming. Migration map: <code>Text & Icons/Default</code> → <code>Text/Neutral/Default</code>, <code>Color/Dusty Rose/100</code> → <code>Color/Border/Brand/Medium 3</code> or new brand token, <code>Desktop/P3</code> → <code>Body/Small/Regular</code>, <code>Headline/Small (Medium)</code> → needs new semantic headline token.',
     },
@@ -358,17 +364,20 @@ components = [
         ],
         'sizes': ['Default (container-width)'],
         'real_tokens': [
-            ('Track Color (Light)', 'Color/Dusty Rose/60', '#e7cdc0'),
-            ('Fill Color', 'Color/Dusty Rose/100', '#c08676'),
-            ('Text (Black)', 'AMIO/Primary/Black', '#000000'),
-            ('Fill Alt', 'AMIO/Primary/Dusty Rose', '#c08676'),
+            ('Track Color (Light)', 'Color/Dusty Rose/60'),
+            ('Fill Color', 'Color/Dusty Rose/100'),
+            ('Text (Black)', 'AMIO/Primary/Black'),
+            ('Fill Alt', 'AMIO/Primary/Dusty Rose'),
             ('Label Font', 'Caption/Regular', 'Graphik Regular 13/24 (3px tracking)'),
         ],
         'legacy_note': '<strong>OLDEST TOKEN SYSTEM:</strong> Uses <code>AMIO/Primary/</code> prefix — the earliest naming convention found, pre-dating even <code>Text & Icons/</code>. Migration map: <code>AMIO/Primary/Black</code> → <code>Text/Neutral/Default</code>, <code>AMIO/Primary/Dusty Rose</code> → <code>Color/Container/Brand/Interactive/Enable</code> or brand token, <code>Color/Dusty Rose/60</code> → needs new semantic track token, <code>Caption/Regular</code> → <code>Body/Small/Regular</code>.',
     },
 ]
 
-OUT_DIR = '/Users/donnysmith/Projects/cloud/AMI-Design-System/components'
+OUT_DIR = os.path.join(ROOT, 'components')
+LAYOUT = Layout('components.html', prefix='../')
+# Rendered width of the screenshot card inside the 960px container
+SCREENSHOT_SIZES = '(max-width: 960px) 100vw, 960px'
 
 def build_page(comp):
     # Token system badge
@@ -422,7 +431,7 @@ def build_page(comp):
 
     # Token table (real Figma data)
     token_rows = ''
-    for prop, token, value in comp.get('real_tokens', []):
+    for prop, token, value in token_graph.graph().rows(comp['slug'], comp.get('real_tokens', [])):
         is_color = value.startswith('#') and len(value) <= 9
         swatch = f'<span style="display:inline-block;width:14px;height:14px;border-radius:3px;background:{value};border:1px solid #ddd;vertical-align:middle;margin-right:6px"></span>' if is_color else ''
         token_rows += f'          <tr><td>{prop}</td><td><span class="token-name">{token}</span></td><td>{swatch}{value}</td></tr>\n'
@@ -448,6 +457,21 @@ def build_page(comp):
       </div>
     </div>'''
 
+    screenshot_html = ''
+    src = f'img/components/{comp["slug"]}.png'
+    screenshot = asset_index.get(src)
+    if screenshot:
+        screenshot_html = f'''
+  <div class="section">
+    <h2 class="section-title">Visual Reference</h2>
+    <div class="card" style="padding:0;overflow:hidden;border-radius:8px;margin-bottom:24px">
+      {images.picture(src, f'{comp["name"]} — Figma screenshot', SCREENSHOT_SIZES, prefix='../',
+                      attrs=' loading="lazy" style="width:100%;height:auto;display:block"'
+                      + asset_index.img_attrs(screenshot))}
+    </div>
+  </div>
+'''
+
     # Legacy note
     legacy_html = ''
     if comp.get('legacy_note'):
@@ -457,33 +481,7 @@ def build_page(comp):
       <p>{comp['legacy_note']}</p>
     </div>'''
 
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{comp['name']} — AMI Design System Audit</title>
-<link rel="stylesheet" href="../style.css">
-</head>
-<body>
-
-<nav class="site-nav">
-  <div class="nav-inner">
-    <a href="../index.html" class="nav-brand">AMI Design System</a>
-    <div class="nav-links">
-      <a href="../index.html">Overview</a>
-      <a href="../tokens.html">Tokens</a>
-      <a href="../components.html" class="active">Components</a>
-      <a href="../screens.html">Screens</a>
-      <a href="../assets.html">Assets</a>
-      <a href="../architecture.html">Architecture</a>
-      <a href="../patterns.html">Patterns</a>
-      <a href="../remediation.html">Remediation</a>
-    </div>
-  </div>
-</nav>
-
-<div class="container" style="max-width:960px">
+    body = f'''<div class="container" style="max-width:960px">
   <div style="margin-bottom:8px">
     <a href="../components.html" style="color:var(--brand);text-decoration:none;font-size:13px">&larr; All Components</a>
   </div>
@@ -499,7 +497,7 @@ def build_page(comp):
   <div class="card" style="padding:20px;margin:16px 0">
     <p style="margin:0;line-height:1.6">{comp['description']}</p>
   </div>
-
+{screenshot_html}
   <div class="section">
 {anatomy_html}
 {states_html}
@@ -523,19 +521,21 @@ def build_page(comp):
   </div>
 </div>
 
-<footer class="site-footer">
-  AMI Design System Audit &mdash; Generated February 27, 2026 &mdash; <a href="https://github.com/d999ss/AMI-Design-System">GitHub</a>
-</footer>
+'''
+    return LAYOUT.render(comp['name'], body)
+
+
+def main(argv=None):
+    """Write every page in `components` to OUT_DIR."""
+    args = pagegen.parse_args(__doc__, argv)
+    results, elapsed = pagegen.write_pages(components, build_page, OUT_DIR, args.jobs)
+    for comp, (size, changed) in zip(components, results):
+        print(f'  {comp["slug"]}.html ({size:,} bytes{"" if changed else ", unchanged"}) — {comp["token_system"]}')
 
-</body>
-</html>'''
+    print(f'\nGenerated {len(components)} Batch 2 component detail pages')
+    print(pagegen.rate(len(components), elapsed, args.jobs))
+    print(outputs.summary([changed for _, changed in results]))
 
-# Generate all pages
-for comp in components:
-    html = build_page(comp)
-    path = os.path.join(OUT_DIR, f'{comp["slug"]}.html')
-    with open(path, 'w') as f:
-        f.write(html)
-    print(f'  {comp["slug"]}.html ({len(html):,} bytes) — {comp["token_system"]}')
 
-print(f'\nGenerated {len(components)} Batch 2 component detail pages')
+if __name__ == '__main__':
+    main()
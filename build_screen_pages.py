@@ -2,8 +2,19 @@
 """Generate screen detail pages with component usage maps for BTS engineering handoff."""
 import os
 
-OUT_DIR = '/Users/donnysmith/Projects/cloud/AMI-Design-System/screens'
-os.makedirs(OUT_DIR, exist_ok=True)
+import asset_index
+import images
+import outputs
+import pagegen
+import tiles
+from fingerprint import url
+from layout import Layout
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(ROOT, 'screens')
+LAYOUT = Layout('screens.html', prefix='../', generated='February 2026')
+# Screen pages use a 960px container
+SCREENSHOT_SIZES = '(max-width: 960px) 100vw, 960px'
 
 # Screen definitions with component usage maps
 screens = [
@@ -270,33 +281,23 @@ def build_screen_page(screen):
     # Key interactions
     int_items = ''.join(f'<li>{i}</li>' for i in screen.get('key_interactions', []))
 
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{screen['name']} — AMI Design System Audit</title>
-<link rel="stylesheet" href="../style.css">
-</head>
-<body>
-
-<nav class="site-nav">
-  <div class="nav-inner">
-    <a href="../index.html" class="nav-brand">AMI Design System</a>
-    <div class="nav-links">
-      <a href="../index.html">Overview</a>
-      <a href="../tokens.html">Tokens</a>
-      <a href="../components.html">Components</a>
-      <a href="../screens.html" class="active">Screens</a>
-      <a href="../assets.html">Assets</a>
-      <a href="../architecture.html">Architecture</a>
-      <a href="../patterns.html">Patterns</a>
-      <a href="../remediation.html">Remediation</a>
-    </div>
+    screenshot_html = ''
+    src = f'img/screens/{screen["slug"]}.png'
+    screenshot = asset_index.get(src)
+    if screenshot:
+        alt = f'{screen["name"]} — Figma screenshot'
+        image = images.picture(src, alt, SCREENSHOT_SIZES, prefix='../',
+                               attrs=' loading="lazy" style="width:100%;height:auto;display:block"'
+                               + asset_index.img_attrs(screenshot))
+        # Tall mockups get the deep-zoom viewer when a tile pyramid exists
+        viewer = tiles.viewer(src, alt, prefix='../', fallback=image)
+        script = f'  <script src="{url("tiles.js", "../")}" defer></script>\n' if viewer else ''
+        screenshot_html = f'''  <div class="card" style="padding:0;margin:16px 0;overflow:hidden;border-radius:8px">
+    {viewer or image}
   </div>
-</nav>
+{script}'''
 
-<div class="container" style="max-width:960px">
+    body = f'''<div class="container" style="max-width:960px">
   <div style="margin-bottom:8px">
     <a href="../screens.html" style="color:var(--brand);text-decoration:none;font-size:13px">&larr; All Screens</a>
   </div>
@@ -312,7 +313,7 @@ def build_screen_page(screen):
   <div class="card" style="padding:20px;margin:16px 0">
     <p style="margin:0;line-height:1.6">{screen['description']}</p>
   </div>
-
+{screenshot_html}
   <div class="section">
     <div class="subsection">
       <h3 class="subsection-title">Figma Sections</h3>
@@ -367,20 +368,21 @@ def build_screen_page(screen):
   </div>
 </div>
 
-<footer class="site-footer">
-  AMI Design System Audit &mdash; Generated February 2026 &mdash; <a href="https://github.com/d999ss/AMI-Design-System">GitHub</a>
-</footer>
+'''
+    return LAYOUT.render(screen['name'], body)
+
 
-</body>
-</html>'''
+def main(argv=None):
+    """Write every page in `screens` to OUT_DIR."""
+    args = pagegen.parse_args(__doc__, argv)
+    results, elapsed = pagegen.write_pages(screens, build_screen_page, OUT_DIR, args.jobs)
+    for screen, (size, changed) in zip(screens, results):
+        print(f'  {screen["slug"]}.html ({size:,} bytes{"" if changed else ", unchanged"}) — {screen["area"]} ({len(screen["components"])} components)')
 
+    print(f'\nGenerated {len(screens)} screen detail pages')
+    print(pagegen.rate(len(screens), elapsed, args.jobs))
+    print(outputs.summary([changed for _, changed in results]))
 
-# Generate all screen pages
-for screen in screens:
-    html = build_screen_page(screen)
-    path = os.path.join(OUT_DIR, f'{screen["slug"]}.html')
-    with open(path, 'w') as f:
-        f.write(html)
-    print(f'  {screen["slug"]}.html ({len(html):,} bytes) — {screen["area"]} ({len(screen["components"])} components)')
 
-print(f'\nGenerated {len(screens)} screen detail pages')
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Build tracing in the Chrome trace event format.
+
+Generators wrap their stages in span(), or begin() and end() where a stage
+does not fit a with-block:
+
+    with buildtrace.span('render', items=len(pages)) as s:
+        ...
+        s.add(bytes=len(html))
+
+Each span records wall time, CPU time of its process, and the bytes written
+and items processed that the stage reports. Tracing is off unless the
+BUILD_TRACE environment variable names a directory; build.py --trace sets it
+for itself and every generator it runs. Each process, pool workers included,
+appends its finished spans to <dir>/<pid>.jsonl as it goes, so nothing is
+lost when a worker exits without cleanup. merge() collects them into one
+trace JSON for chrome://tracing or ui.perfetto.dev.
+
+Timestamps come from the monotonic clock behind time.perf_counter(), which
+processes on one machine share, so spans from different generators line up.
+"""
+import contextlib, glob, json, os, sys, threading, time
+
+ENV = 'BUILD_TRACE'
+
+_file = None
+_pid = None
+
+
+class Span:
+    """One stage being timed; add() bytes written and items processed to it while it runs."""
+
+    __slots__ = ('name', 'cat', 'args', 'items', 'bytes', '_wall', '_cpu')
+
+    def __init__(self, name, cat, items, bytes, args):
+        self.name, self.cat, self.args = name, cat, args
+        self.items = items
+        self.bytes = bytes
+        self._wall = time.perf_counter_ns() if enabled() else None
+        self._cpu = time.process_time_ns()
+
+    def add(self, items=0, bytes=0):
+        self.items += items
+        self.bytes += bytes
+
+    def end(self):
+        """Record the span (once); a no-op when tracing is off."""
+        if self._wall is None:
+            return
+        record(self.name, self._wall, time.perf_counter_ns(), time.process_time_ns() - self._cpu, self.cat,
+               self.items, self.bytes, **self.args)
+        self._wall = None
+
+
+def enabled():
+    return bool(os.environ.get(ENV))
+
+
+def _emit(event):
+    global _file, _pid
+    if _pid != os.getpid():
+        # First span in this process (or a forked worker inheriting the parent's handle)
+        _pid = os.getpid()
+        _file = open(os.path.join(os.environ[ENV], f'{_pid}.jsonl'), 'a', buffering=1)
+        name = os.path.basename(sys.argv[0]) or 'python'
+        _file.write(json.dumps({'name': 'process_name', 'ph': 'M', 'pid': _pid, 'args': {'name': name}}) + '\n')
+    _file.write(json.dumps(event) + '\n')
+
+
+def begin(name, cat='stage', items=0, bytes=0, **args):
+    """Start timing a stage that does not fit a with-block; call end() on the result."""
+    return Span(name, cat, items, bytes, args)
+
+
+@contextlib.contextmanager
+def span(name, cat='stage', items=0, bytes=0, **args):
+    """Time the enclosed block as one trace event; yields the Span to report bytes and items to."""
+    s = Span(name, cat, items, bytes, args)
+    try:
+        yield s
+    finally:
+        s.end()
+
+
+def record(name, start_ns, end_ns, cpu_ns, cat='stage', items=0, bytes=0, **args):
+    """Add a span measured elsewhere, e.g. a subprocess timed by its parent."""
+    if enabled():
+        _emit({'name': name, 'cat': cat, 'ph': 'X', 'ts': start_ns // 1000, 'dur': (end_ns - start_ns) // 1000,
+               'pid': os.getpid(), 'tid': threading.get_ident(),
+               'args': {'cpu_ms': round(cpu_ns / 1e6, 3), 'bytes': bytes, 'items': items, **args}})
+
+
+def merge(directory, path):
+    """Combine every process's events under `directory` into the trace file `path`. Returns the events."""
+    if _file and _pid == os.getpid():
+        _file.flush()
+    events = []
+    for part in sorted(glob.glob(os.path.join(directory, '*.jsonl'))):
+        with open(part) as f:
+            events.extend(json.loads(line) for line in f if line.strip())
+    events.sort(key=lambda e: (e.get('ts', 0), -e.get('dur', 0)))
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    return events
+
+
+def summary(events, cat):
+    """One line over the spans of category `cat`: wall, CPU, bytes, items and the slowest span."""
+    spans = [e for e in events if e.get('ph') == 'X' and e['cat'] == cat]
+    if not spans:
+        return 'trace: no spans'
+    wall = sum(e['dur'] for e in spans) / 1e6
+    cpu = sum(e['args']['cpu_ms'] for e in spans) / 1e3
+    written = sum(e['args']['bytes'] for e in spans)
+    items = sum(e['args']['items'] for e in spans)
+    slowest = max(spans, key=lambda e: e['dur'])
+    stages = sum(1 for e in events if e.get('ph') == 'X') - len(spans)
+    return (f'trace: {len(spans)} {cat}s, {stages} stages, {wall:.2f}s wall, {cpu:.2f}s CPU, '
+            f'{written / 1e6:.2f} MB written, {items:,} items; slowest {slowest["name"]} ({slowest["dur"] / 1e6:.2f}s)')
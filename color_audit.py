@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Near-duplicate color tokens, by perceptual distance.
+
+Every hex value bound to a component in token_data.json (8-digit values
+included) is converted to CIELAB and compared pairwise with CIEDE2000. Values
+closer than the threshold are clustered (single linkage, so the report gives
+each cluster's actual spread), and #de3b2d / #dc3426 style drift shows up
+without anyone hunting for it. A translucent value is compared as it renders
+over the white page, and only with values of about the same alpha. Values
+below MIN_ALPHA are left out: over white they all render as white, which says
+nothing about their color.
+
+The threshold is a just-noticeable difference, not a tolerance for the
+palette. #ff0000, listed by hand with #de3b2d and #dc3426 under error_red,
+is about 6.6 from both: a visibly different red, so a naming decision rather
+than drift, and a threshold wide enough to reach it chains most of the
+near-whites into one cluster.
+
+Pairs are compared in blocks of NumPy arrays, sorted by lightness. Two cheap
+bounds discard most pairs before the full formula runs: CIEDE2000 is never
+less than |dL| / 1.75, so a block only meets values within threshold * 1.75 of
+its lightness range; and because the rotation term is bounded, a pair within
+threshold t is also within 2.74 * t * (1 + 0.0675 * mean chroma) in the a*b*
+plane (see near_pairs).
+
+The clusters are written to the marked section of remediation.html.
+The analysis needs NumPy; the generators do not.
+
+Usage: python color_audit.py [--threshold 2] [--alpha-tolerance 0.05] [--min-alpha 0.02] [--check]
+"""
+import argparse, html, os, re, sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import critical_css, fingerprint, token_graph
+from outputs import write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+REPORT_PAGE = os.path.join(ROOT, 'remediation.html')
+# CIEDE2000 of about 1-2 is the smallest difference most viewers notice
+THRESHOLD = 2.0
+ALPHA_TOLERANCE = 0.05
+# About 5/255: fully and nearly transparent values
+MIN_ALPHA = 0.02
+BLOCK = 128
+# Largest CIEDE2000 lightness weight S_L, reached at L = 0 and L = 100
+S_L_MAX = 1 + 0.015 * 2500 / (20 + 2500) ** 0.5
+# |R_T| < 2 sin(60deg), so the chroma/hue terms add at least (1 - sin(60deg)) of their squares
+AB_REACH = 1 / (1 - 3 ** 0.5 / 2) ** 0.5 * 1.001
+
+_HEX = re.compile(r'#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{8})')
+_SECTION = re.compile(r'(<!-- color_audit.py: start -->\n).*?([ \t]*<!-- color_audit.py: end -->)', re.S)
+
+
+def color_tokens(graph):
+    """{normalized hex: [(component, path), ...]} for every hex token value."""
+    colors = {}
+    for component, tokens in sorted(graph.components.items()):
+        for path, value in tokens.items():
+            if _HEX.fullmatch(value.strip()):
+                colors.setdefault(token_graph.normalize(value), []).append((component, path))
+    return colors
+
+
+def to_rgba(values):
+    """(n, 4) float array of RGBA in 0..1 from '#rrggbb' / '#rrggbbaa' strings."""
+    padded = [v[1:] if len(v) == 9 else v[1:] + 'ff' for v in values]
+    raw = np.frombuffer(bytes.fromhex(''.join(padded)), dtype=np.uint8).reshape(-1, 4)
+    return raw / 255.0
+
+
+def visible(values, min_alpha=MIN_ALPHA):
+    """The `values` at least `min_alpha` opaque."""
+    return [v for v, a in zip(values, to_rgba(values)[:, 3]) if a >= min_alpha] if values else []
+
+
+def to_lab(rgba, background=1.0):
+    """CIELAB (D65) of sRGB colors composited over a gray `background` (1.0 = white)."""
+    rgb = rgba[:, :3] * rgba[:, 3:] + background * (1 - rgba[:, 3:])
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ np.array([[0.4124564, 0.2126729, 0.0193339],
+                             [0.3575761, 0.7151522, 0.1191920],
+                             [0.1804375, 0.0721750, 0.9503041]])
+    xyz /= np.array([0.95047, 1.0, 1.08883])
+    f = np.where(xyz > 216 / 24389, np.cbrt(xyz), (24389 / 27 * xyz + 16) / 116)
+    return np.stack([116 * f[:, 1] - 16, 500 * (f[:, 0] - f[:, 1]), 200 * (f[:, 1] - f[:, 2])], axis=-1)
+
+
+def ciede2000(lab1, lab2):
+    """CIEDE2000 distance between broadcastable (..., 3) Lab arrays (kL = kC = kH = 1)."""
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+    c_bar7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25.0 ** 7)))
+    a1p, a2p = a1 * (1 + g), a2 * (1 + g)
+    c1p, c2p = np.hypot(a1p, b1), np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+    chroma = c1p * c2p
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180, dhp - 360, np.where(dhp < -180, dhp + 360, dhp))
+    dhp = np.where(chroma == 0, 0, dhp)
+    dL = L2 - L1
+    dC = c2p - c1p
+    dH = 2 * np.sqrt(chroma) * np.sin(np.radians(dhp) / 2)
+
+    l_bar = (L1 + L2) / 2
+    c_bar = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    h_bar = np.where(np.abs(h1p - h2p) <= 180, h_sum / 2,
+                     np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2))
+    h_bar = np.where(chroma == 0, h_sum, h_bar)
+    t = (1 - 0.17 * np.cos(np.radians(h_bar - 30)) + 0.24 * np.cos(np.radians(2 * h_bar))
+         + 0.32 * np.cos(np.radians(3 * h_bar + 6)) - 0.20 * np.cos(np.radians(4 * h_bar - 63)))
+    d_theta = 30 * np.exp(-(((h_bar - 275) / 25) ** 2))
+    c_bar7 = c_bar ** 7
+    r_t = -2 * np.sqrt(c_bar7 / (c_bar7 + 25.0 ** 7)) * np.sin(np.radians(2 * d_theta))
+    s_l = 1 + 0.015 * (l_bar - 50) ** 2 / np.sqrt(20 + (l_bar - 50) ** 2)
+    s_c = 1 + 0.045 * c_bar
+    s_h = 1 + 0.015 * c_bar * t
+    t_l, t_c, t_h = dL / s_l, dC / s_c, dH / s_h
+    return np.sqrt(np.maximum(t_l * t_l + t_c * t_c + t_h * t_h + r_t * t_c * t_h, 0))
+
+
+def near_pairs(values, threshold=THRESHOLD, alpha_tolerance=ALPHA_TOLERANCE):
+    """(i, j, distance) for every pair of `values` within `threshold` and of similar alpha, i < j.
+
+    Candidates must pass two necessary conditions before CIEDE2000 runs:
+    |dL| < threshold * S_L_MAX, and |d(a, b)| < AB_REACH * threshold * S_C,
+    where S_C = 1 + 0.045 * C' <= 1 + 0.0675 * C (a' stretches a* by at most 1.5).
+    """
+    rgba = to_rgba(values)
+    lab = to_lab(rgba)
+    order = np.argsort(lab[:, 0], kind='stable')
+    lab, alpha = lab[order], rgba[order, 3]
+    lightness, chroma = lab[:, 0], np.hypot(lab[:, 1], lab[:, 2])
+    reach = threshold * S_L_MAX
+    pairs = []
+    for start in range(0, len(values), BLOCK):
+        stop = min(start + BLOCK, len(values))
+        # Everything beyond `end` is too much lighter than the block to be within threshold
+        end = int(np.searchsorted(lightness, lightness[stop - 1] + reach, side='right'))
+        rows, cols = slice(start, stop), slice(start, end)
+        da = lab[rows, None, 1] - lab[None, cols, 1]
+        db = lab[rows, None, 2] - lab[None, cols, 2]
+        ab_reach = AB_REACH * threshold * (1 + 0.0675 * (chroma[rows, None] + chroma[None, cols]) / 2)
+        candidate = ((np.arange(start, stop)[:, None] < np.arange(start, end)[None, :])
+                     & (np.abs(lightness[rows, None] - lightness[None, cols]) < reach)
+                     & (da * da + db * db < ab_reach * ab_reach)
+                     & (np.abs(alpha[rows, None] - alpha[None, cols]) <= alpha_tolerance))
+        r, c = np.nonzero(candidate)
+        r += start
+        c += start
+        d = ciede2000(lab[r], lab[c])
+        close = d < threshold
+        pairs.extend(zip(order[r[close]].tolist(), order[c[close]].tolist(), d[close].tolist()))
+    return pairs
+
+
+def clusters(values, pairs):
+    """Groups of value indexes connected by `pairs` (single linkage), largest first, singletons left out."""
+    parent = list(range(len(values)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j, _ in pairs:
+        parent[find(i)] = find(j)
+    groups = {}
+    for i in range(len(values)):
+        groups.setdefault(find(i), []).append(i)
+    return sorted((sorted(g, key=values.__getitem__) for g in groups.values() if len(g) > 1),
+                  key=lambda g: (-len(g), values[g[0]]))
+
+
+def _swatch(value):
+    return (f'<span style="display:inline-block;width:14px;height:14px;border-radius:3px;background:{value};'
+            f'border:1px solid #ddd;vertical-align:middle;margin-right:6px"></span>')
+
+
+def spread(values, group):
+    """Largest CIEDE2000 distance between two members of `group` (indexes into `values`)."""
+    lab = to_lab(to_rgba([values[i] for i in group]))
+    return float(ciede2000(lab[:, None, :], lab[None, :, :]).max())
+
+
+def _bindings(bindings, limit=3):
+    """Distinct token paths of one value with the components using each, the first `limit` of them."""
+    by_path = {}
+    for component, path in bindings:
+        by_path.setdefault(path, []).append(component)
+    items = [f'<span class="token-name">{html.escape(path)}</span> ({", ".join(comps)})'
+             for path, comps in sorted(by_path.items(), key=lambda item: -len(item[1]))]
+    more = f' +{len(items) - limit} more' if len(items) > limit else ''
+    return ', '.join(items[:limit]) + more
+
+
+def report_html(colors, values, groups, threshold, min_alpha):
+    """The generated remediation.html section: one table row per cluster of `values` (keys of `colors`)."""
+    rows = []
+    for g in groups:
+        cells = ''.join(f'<div>{_swatch(values[i])}<code>{values[i]}</code> &times;{len(colors[values[i]])}</div>'
+                        for i in g)
+        bindings = ''.join(f'<div>{_bindings(colors[values[i]])}</div>' for i in g)
+        rows.append(f'        <tr><td>{cells}</td><td>{spread(values, g):.2f}</td><td>{bindings}</td></tr>')
+    body = '\n'.join(rows) or '        <tr><td colspan="3">No near-duplicate colors.</td></tr>'
+    return f'''  <div class="section">
+    <h2 class="section-title">Near-Duplicate Colors <span class="status-badge status-drift">{len(groups)} Clusters</span></h2>
+    <p class="section-desc">Distinct hex values, across {sum(map(len, colors.values()))} color token bindings, that are within CIEDE2000 &Delta;E {threshold:g} of another value (about the smallest difference most viewers notice). Translucent values are compared as rendered over white; values under {min_alpha:.0%} opacity are left out. Each cluster is a candidate for one canonical token. Generated by <code>color_audit.py</code> from <code>token_data.json</code>.</p>
+
+    <table class="data-table">
+      <thead><tr><th>Values (bindings)</th><th>Spread &Delta;E</th><th>Token Paths (components)</th></tr></thead>
+      <tbody>
+{body}
+      </tbody>
+    </table>
+  </div>'''
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='largest CIEDE2000 distance treated as a near duplicate (default: %(default)s)')
+    parser.add_argument('--alpha-tolerance', type=float, default=ALPHA_TOLERANCE,
+                        help='largest alpha difference (0-1) between compared values (default: %(default)s)')
+    parser.add_argument('--min-alpha', type=float, default=MIN_ALPHA,
+                        help='skip values less opaque than this (0-1) (default: %(default)s)')
+    parser.add_argument('--check', action='store_true', help='report a stale remediation.html without writing it')
+    args = parser.parse_args(argv)
+    if np is None:
+        sys.exit('color_audit.py needs NumPy: pip install numpy')
+
+    colors = color_tokens(token_graph.graph())
+    values = visible(list(colors), args.min_alpha)
+    pairs = near_pairs(values, args.threshold, args.alpha_tolerance)
+    groups = clusters(values, pairs)
+    for g in groups:
+        print('  ' + ', '.join(values[i] for i in g))
+    print(f'{len(colors)} distinct colors ({len(colors) - len(values)} near-transparent skipped), '
+          f'{len(pairs)} close pairs, {len(groups)} clusters')
+
+    with open(REPORT_PAGE) as f:
+        page = f.read()
+    if not _SECTION.search(page):
+        sys.exit(f'{os.path.basename(REPORT_PAGE)} has no color_audit.py section markers')
+    section = report_html(colors, values, groups, args.threshold, args.min_alpha)
+    updated = _SECTION.sub(lambda m: f'{m[1]}{section}\n{m[2]}', page)
+    # In the form fingerprint.py leaves the page, which then has nothing left to change
+    updated = critical_css.apply(fingerprint.rewrite_refs(updated))
+    if args.check:
+        stale = updated != page
+        print(f'{os.path.basename(REPORT_PAGE)} is {"stale" if stale else "up to date"}')
+        return 1 if stale else 0
+    write_if_changed(REPORT_PAGE, updated)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
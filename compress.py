@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""The deployed copy of the site in dist/: pages minified, text precompressed.
+
+Every served file (everything but the Python, dotfiles and this repo's
+working files) is copied to dist/. Pages are minified on the way: comments
+dropped, whitespace runs collapsed, whitespace next to table and
+document-level tags removed, and inline style attributes and <style>
+blocks tightened. The contents of <pre>, <code>, <textarea> and <script>
+are left exactly as written. The .html files in the repo stay readable,
+since the hand-written pages are the sources and the generated ones are
+reviewed as diffs. Pages, style.css, the scripts and the search shards
+also get <file>.gz and <file>.br next to their dist/ copy.
+
+vercel.json runs this script as the deploy's build command and serves
+dist/, so what reaches the CDN is the minified site. It runs with
+--no-precompress: Vercel's CDN compresses responses itself and never serves
+a .gz or .br file in place of the original, so there the copies would only
+be uploaded as extra files. They are for hosts that do negotiate
+precompressed files (e.g. nginx with gzip_static and brotli_static) serving
+dist/. dist/ is not committed.
+
+gzip runs at level 9 and Brotli at quality 11, across a process pool.
+Output is deterministic (no gzip timestamp) and only rewritten when it
+changes; files no longer in the site are removed from dist/. Brotli needs
+the brotli package; without it only .gz files are written and stale .br
+files are removed.
+
+Usage: python compress.py [--jobs N] [--no-precompress]
+"""
+import argparse, fnmatch, functools, glob, gzip, multiprocessing, os, re, sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+import asset_index, buildtrace, critical_css
+from outputs import write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUT = os.path.join(ROOT, 'dist')
+
+# Build scripts and working files, never served
+SOURCE_ONLY = ('*.py', '*.pyc', '*.tmp', '*.gz', '*.br', '*.patch', '*.jsonl', '*.md', 'vercel.json')
+
+# Whitespace next to these tags never renders, whatever the stylesheet does
+# (unlike <div> or <li>, which may be inline-block with gaps between them)
+BLOCK_TAGS = 'html|head|body|meta|link|title|style|script|noscript|table|thead|tbody|tfoot|tr|td|th|br'
+_VERBATIM = re.compile(r'(<(pre|code|textarea|script)\b.*?</\2>)', re.S | re.I)
+_STYLE_BLOCK = re.compile(r'(<style\b[^>]*>)(.*?)(</style>)', re.S | re.I)
+_STYLE_ATTR = re.compile(r'\bstyle="([^"]*)"')
+_COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.S)
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_BEFORE_BLOCK = re.compile(rf'\s+(?=</?(?:{BLOCK_TAGS})\b)', re.I)
+_AFTER_BLOCK = re.compile(rf'(<(?:/?(?:{BLOCK_TAGS}))\b[^>]*>)\s+', re.I)
+
+
+def files():
+    """Paths (relative to the repo root) of everything that gets compressed copies."""
+    paths = critical_css.pages() + [p for p in asset_index.STATIC_FILES if os.path.exists(os.path.join(ROOT, p))]
+    for pattern in ('search/*.json', 'inventory/*.json'):
+        paths += sorted(os.path.relpath(p, ROOT) for p in glob.glob(os.path.join(ROOT, pattern)))
+    return paths
+
+
+def served(path):
+    """Whether `path` (relative to the repo root) is part of the deployed site."""
+    parts = path.split(os.sep)
+    return (not any(d.startswith('.') or d == '__pycache__' for d in parts) and parts[0] != os.path.basename(OUT)
+            and not any(fnmatch.fnmatch(parts[-1], p) for p in SOURCE_ONLY))
+
+
+def site_files():
+    """Paths (relative to the repo root) of every file that is deployed."""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(ROOT):
+        dirnames.sort()
+        rel = os.path.relpath(dirpath, ROOT)
+        paths += [p for p in (os.path.normpath(os.path.join(rel, f)) for f in sorted(filenames)) if served(p)]
+    return paths
+
+
+def minify_css(css):
+    """A stylesheet on one line, without comments or optional whitespace."""
+    return re.sub(r'\s*([{};,])\s*', r'\1', ' '.join(_CSS_COMMENT.sub('', css).split())).replace(';}', '}')
+
+
+def _minify_markup(html):
+    html = _COMMENT.sub('', html)
+    html = _STYLE_BLOCK.sub(lambda m: m[1] + minify_css(m[2]) + m[3], html)
+    html = _STYLE_ATTR.sub(lambda m: f'style="{critical_css.minify(m[1])}"', html)
+    html = re.sub(r'\s+', lambda m: '\n' if '\n' in m[0] else ' ', html)
+    html = _AFTER_BLOCK.sub(r'\1', html)
+    return _BEFORE_BLOCK.sub('', html)
+
+
+def minify(html):
+    """`html` without the whitespace and comments a browser ignores; verbatim elements are left alone."""
+    parts = _VERBATIM.split(html)
+    # split() yields text, (element, tag name), text, ...
+    out = []
+    for i in range(0, len(parts), 3):
+        out.append(_minify_markup(parts[i]))
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    return ''.join(out).strip() + '\n'
+
+
+def copy(path):
+    """Copy `path` to dist/ as it is. Returns True if the copy was written."""
+    with open(os.path.join(ROOT, path), 'rb') as f:
+        data = f.read()
+    os.makedirs(os.path.dirname(os.path.join(OUT, path)), exist_ok=True)
+    return write_if_changed(os.path.join(OUT, path), data)
+
+
+def compress(path, precompress=True):
+    """Write the dist/ copy of `path`, with .gz (and .br) next to it if `precompress`.
+
+    Returns (path, source bytes, payload bytes, gz bytes, br bytes); sizes not written are None."""
+    with open(os.path.join(ROOT, path), 'rb') as f:
+        data = f.read()
+    with buildtrace.span('minify', items=1, path=path):
+        payload = minify(data.decode()).encode() if path.endswith('.html') else data
+    full = os.path.join(OUT, path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    write_if_changed(full, payload)
+    gz = br = None
+    with buildtrace.span('compress', items=1, path=path) as s:
+        if precompress:
+            gz = gzip.compress(payload, 9, mtime=0)
+            s.add(bytes=len(gz) if write_if_changed(full + '.gz', gz) else 0)
+        if precompress and brotli:
+            br = brotli.compress(payload, mode=brotli.MODE_TEXT, quality=11)
+            s.add(bytes=len(br) if write_if_changed(full + '.br', br) else 0)
+    for ext, written in (('.gz', gz), ('.br', br)):
+        if written is None and os.path.exists(full + ext):
+            os.remove(full + ext)
+    return path, len(data), len(payload), *(len(c) if c is not None else None for c in (gz, br))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (default: %(default)s)')
+    parser.add_argument('--no-precompress', dest='precompress', action='store_false',
+                        help='write the minified site only, without .gz/.br copies (for a CDN that compresses itself)')
+    args = parser.parse_args(argv)
+    if args.precompress and brotli is None:
+        print('warning: the brotli module is not installed, so no .br files are written '
+              '(pip install brotli); writing .gz only', file=sys.stderr)
+
+    paths = files()
+    site = site_files()
+    copied = sum(copy(p) for p in site if p not in paths)
+    kept = set(site) | {p + ext for p in paths for ext in ('.gz', '.br')
+                        if args.precompress and (ext == '.gz' or brotli)}
+    for dirpath, _, filenames in os.walk(OUT):
+        for f in filenames:
+            if os.path.relpath(os.path.join(dirpath, f), OUT) not in kept:
+                os.remove(os.path.join(dirpath, f))
+    if args.jobs > 1:
+        with multiprocessing.Pool(min(args.jobs, len(paths))) as pool:
+            results = pool.map(functools.partial(compress, precompress=args.precompress), paths, chunksize=1)
+    else:
+        results = [compress(p, args.precompress) for p in paths]
+
+    totals = [0, 0, 0, 0]
+    for path, size, payload, gz, br in results:
+        best = br or gz or payload
+        print(f'  {path}: {size:,} B' + (f' -> {payload:,} minified' if payload != size else '')
+              + (f' -> {gz:,} gz' if gz is not None else '') + (f' / {br:,} br' if br is not None else '')
+              + f' ({size / best:.1f}x)')
+        for i, n in enumerate((size, payload, gz or 0, br or 0)):
+            totals[i] += n
+    size, payload, gz, br = totals
+    if not args.precompress:
+        compressed = ', not precompressed'
+    else:
+        compressed = f', {gz / 1e3:,.0f} KB gzip' + (f', {br / 1e3:,.0f} KB brotli' if brotli else ', no brotli')
+    print(f'{len(results)} files: {size / 1e3:,.0f} KB, {payload / 1e3:,.0f} KB minified{compressed} '
+          f'({size / (br or gz or payload):.1f}x)')
+    print(f'{len(site) - len(paths)} other files copied to {os.path.relpath(OUT, ROOT)}/ ({copied} changed)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
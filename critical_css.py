@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Per-page critical CSS for the site's pages, and a report of unused selectors.
+
+For each page, the style.css rules whose selectors can match it are inlined
+into <head>. "Can match" is judged from the tags, classes and ids in its
+markup, plus the string literals of the scripts it loads, which create
+elements and classes at run time. The full stylesheet is then loaded
+without blocking render, as a preload that turns into a stylesheet when it
+arrives, with a <noscript> link as fallback. The webfont @import stays in
+style.css, so first paint uses the fallback font (the import already asks
+for display=swap).
+
+Pages get the block as they are written: pagegen.py and build_components.py
+call apply() on generated pages, fingerprint.py and color_audit.py on the
+hand-written ones, so each page is written once, in its final form. A page
+already processed has its block replaced, so apply() is idempotent.
+
+Run on its own, the script lists the selectors that match no page and
+brings any page that is out of date in line (or, with --check, lists it).
+
+Usage: python critical_css.py [--check] [page.html ...]   (default: every page)
+"""
+import argparse, glob, os, re, sys
+
+import buildtrace
+from outputs import write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STYLESHEET = os.path.join(ROOT, 'style.css')
+
+_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_LINK = re.compile(r'<link rel="stylesheet" href="((?:\.\./)*style\.css(?:\?v=[0-9a-f]+)?)">')
+_INLINED = re.compile(r'<style id="critical-css">.*?</style>\n<link rel="preload" href="([^"]+)" as="style" '
+                      r'onload="[^"]*">\n<noscript><link rel="stylesheet" href="[^"]+"></noscript>', re.S)
+_SCRIPT = re.compile(r'<script src="(?:\.\./)*([\w-]+\.js)[?"]')
+_JS_STRING = re.compile(r"'([^'\\\n]*)'")
+# @import and the like; a url() or string may hold ';'
+_AT_STATEMENT = re.compile(r'@[\w-]+(?:[^;{\'"(]|\([^)]*\)|\'[^\']*\'|"[^"]*")*;')
+_PSEUDO = re.compile(r'::?[\w-]+(?:\([^)]*\))?|\[[^\]]*\]')
+
+
+_rules = None
+
+
+def pages():
+    """Every page of the site, relative to the repo root."""
+    from fingerprint import HAND_WRITTEN
+
+    found = [p for p in (*HAND_WRITTEN, 'inventory.html') if os.path.exists(os.path.join(ROOT, p))]
+    for d in ('components', 'screens'):
+        found += sorted(os.path.relpath(p, ROOT) for p in glob.glob(os.path.join(ROOT, d, '*.html')))
+    return found
+
+
+def parse(css):
+    """Top-level items of a stylesheet: ('rule', [selectors], body), ('block', prelude, items) or ('at', text)."""
+    items, pos = [], 0
+    while True:
+        while pos < len(css) and css[pos].isspace():
+            pos += 1
+        if pos >= len(css):
+            return items
+        m = _AT_STATEMENT.match(css, pos)
+        if m:
+            items.append(('at', m[0]))
+            pos = m.end()
+            continue
+        brace = css.find('{', pos)
+        if css.startswith('@', pos):
+            depth, end = 1, brace + 1
+            while depth:
+                depth += {'{': 1, '}': -1}.get(css[end], 0)
+                end += 1
+            items.append(('block', ' '.join(css[pos:brace].split()), parse(css[brace + 1:end - 1])))
+            pos = end
+            continue
+        end = css.index('}', brace)
+        selectors = [' '.join(s.split()) for s in css[pos:brace].split(',')]
+        items.append(('rule', selectors, css[brace + 1:end]))
+        pos = end + 1
+
+
+def minify(body):
+    """A declaration block on one line, without optional whitespace or the last ';'."""
+    return re.sub(r'\s*([:;,])\s*', r'\1', ' '.join(body.split())).strip(';')
+
+
+def requirements(selector):
+    """(tags, classes, ids) a page needs for `selector` to match anything in it."""
+    bare = _PSEUDO.sub('', selector)
+    return (set(re.findall(r'(?:^|[\s>+~])([a-z][a-z0-9]*)', bare)),
+            set(re.findall(r'\.([\w-]+)', bare)),
+            set(re.findall(r'#([\w-]+)', bare)))
+
+
+def vocabulary(html, root):
+    """(tags, classes, ids) present in `html`, counting words in the string literals of its scripts."""
+    tags = set(re.findall(r'<([a-z][a-z0-9]*)', html))
+    classes = {c for attr in re.findall(r'class="([^"]*)"', html) for c in attr.split()}
+    ids = set(re.findall(r'id="([^"]+)"', html))
+    for script in set(_SCRIPT.findall(html)):
+        try:
+            with open(os.path.join(root, script)) as f:
+                words = {w for s in _JS_STRING.findall(f.read()) for w in s.split()}
+        except FileNotFoundError:
+            continue
+        tags |= words
+        classes |= words
+    return tags, classes, ids
+
+
+def matches(selector, vocab):
+    return all(need <= have for need, have in zip(requirements(selector), vocab))
+
+
+def critical(items, vocab, used):
+    """Minified CSS of the rules in `items` that can match `vocab`; matched selectors are added to `used`."""
+    out = []
+    for item in items:
+        if item[0] == 'rule':
+            selectors = [s for s in item[1] if matches(s, vocab)]
+            used.update(selectors)
+            if selectors:
+                out.append(f'{",".join(selectors)}{{{minify(item[2])}}}')
+        elif item[0] == 'block':
+            inner = critical(item[2], vocab, used)
+            if inner:
+                out.append(f'{item[1]}{{{inner}}}')
+    return ''.join(out)
+
+
+def restore(html):
+    """`html` with a previously inlined block turned back into the plain stylesheet link."""
+    return _INLINED.sub(lambda m: f'<link rel="stylesheet" href="{m[1]}">', html)
+
+
+def inline(html, css):
+    """`html` with `css` inlined in place of its style.css link, and the full stylesheet loaded asynchronously."""
+    def block(m):
+        return (f'<style id="critical-css">{css}</style>\n'
+                f'<link rel="preload" href="{m[1]}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                f'<noscript><link rel="stylesheet" href="{m[1]}"></noscript>')
+    return _LINK.sub(block, html, count=1)
+
+
+def rules():
+    """Top-level items of style.css (see parse), read once per process."""
+    global _rules
+    if _rules is None:
+        with open(STYLESHEET) as f:
+            _rules = parse(_COMMENT.sub('', f.read()))
+    return _rules
+
+
+def apply(html, root=ROOT):
+    """`html` in its final form: the rules of style.css it can use inlined. Pages without the stylesheet link are returned as they are."""
+    html = restore(html)
+    if not _LINK.search(html):
+        return html
+    return inline(html, critical(rules(), vocabulary(html, root), set()))
+
+
+def selectors(items):
+    for item in items:
+        if item[0] == 'rule':
+            yield from item[1]
+        elif item[0] == 'block':
+            yield from selectors(item[2])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('pages', nargs='*', help='pages to process, relative to the repo root (default: all)')
+    parser.add_argument('--check', action='store_true', help='report stale pages without writing them')
+    args = parser.parse_args(argv)
+
+    with buildtrace.span('parse', bytes=os.path.getsize(STYLESHEET)) as s, open(STYLESHEET) as f:
+        full = f.read()
+        items = rules()
+        s.add(items=len(items))
+    used, stale = set(), []
+    for page in args.pages or pages():
+        path = os.path.join(ROOT, page)
+        with open(path) as f:
+            text = f.read()
+        html = restore(text)
+        if not _LINK.search(html):
+            print(f'  {page}: no style.css link, skipped')
+            continue
+        with buildtrace.span('inline', items=1, page=page) as s:
+            css = critical(items, vocabulary(html, ROOT), used)
+            updated = inline(html, css)
+            if updated != text:
+                stale.append(page)
+                if not args.check:
+                    write_if_changed(path, updated)
+                    s.add(bytes=len(updated.encode()))
+        print(f'  {page}: {len(css.encode()):,} of {len(full.encode()):,} bytes inlined')
+
+    unused = sorted(set(selectors(items)) - used)
+    print(f'{len(unused)} selectors match no page' + (':' if unused else ''))
+    for s in unused:
+        print(f'  {s}')
+    print(f'{len(stale)} pages {"stale" if args.check else "updated"}')
+    return 1 if args.check and stale else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Content-hash fingerprinting of static assets and the matching cache policy.
+
+Pages reference assets as `style.css?v=<hash>`, where the hash comes from the
+asset index, so a URL changes exactly when its file does. That lets vercel.json
+mark versioned requests immutable while HTML and unversioned assets keep a
+short TTL. A query string rather than a renamed file keeps the site working
+when opened straight from disk and avoids shipping a second copy of img/.
+
+The generators call url() while rendering. This script rewrites the asset
+references in the hand-written pages, and their critical CSS with them (see
+critical_css.py), and regenerates the "headers" section of vercel.json, along
+with redirects from duplicate images to their canonical copy.
+
+Usage: python fingerprint.py [--check]
+"""
+import argparse, json, os, re, sys
+
+import asset_index, critical_css
+from outputs import write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+VERCEL_JSON = os.path.join(ROOT, 'vercel.json')
+HASH_LEN = 10
+
+# Pages maintained by hand; the generated ones get fingerprints from url() directly
+HAND_WRITTEN = ('index.html', 'tokens.html', 'components.html', 'screens.html', 'assets.html',
+                'architecture.html', 'patterns.html', 'remediation.html')
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'public, max-age=0, must-revalidate'
+HTML_TTL = 'public, max-age=300, s-maxage=300, stale-while-revalidate=86400'
+ASSET_EXTS = 'css|js|json|png|webp|avif'
+
+# href/src of a local asset, optionally already carrying a ?v= fingerprint
+_ASSET_REF = re.compile(r'\b(href|src)="((?:\.\./)*)((?:style\.css|tiles\.js|search\.js|inventory\.js|img/[^"?#]+))(?:\?v=[0-9a-f]+)?"')
+
+
+def url(path, prefix=''):
+    """URL of `path` (relative to the site root) with a content-hash query, if it is an indexed asset.
+
+    Duplicates resolve to their canonical copy (see asset_index.canonical).
+    """
+    path = asset_index.canonical(path)
+    entry = asset_index.get(path)
+    if not entry:
+        return prefix + path
+    return f'{prefix}{path}?v={entry["hash"][:HASH_LEN]}'
+
+
+def rewrite_refs(html):
+    """Point every local asset reference in `html` at its current fingerprint."""
+    return _ASSET_REF.sub(lambda m: f'{m[1]}="{url(m[3], m[2])}"', html)
+
+
+def cache_headers():
+    """The vercel.json "headers" rules. Later rules override earlier ones for the same header."""
+    def rule(source, value, **cond):
+        return {'source': source, **cond, 'headers': [{'key': 'Cache-Control', 'value': value}]}
+    return [
+        rule('/(.*)', HTML_TTL),
+        rule(f'/(.*)\\.({ASSET_EXTS})', REVALIDATE, missing=[{'type': 'query', 'key': 'v'}]),
+        rule(f'/(.*)\\.({ASSET_EXTS})', IMMUTABLE, has=[{'type': 'query', 'key': 'v'}]),
+        # File names there already carry the source hash and encoder settings
+        rule('/img/(responsive|tiles)/(.*)', IMMUTABLE),
+    ]
+
+
+def _inline(value):
+    """JSON on one line, spaced like the rules already in vercel.json."""
+    if isinstance(value, dict):
+        return '{ ' + ', '.join(f'{json.dumps(k)}: {_inline(v)}' for k, v in value.items()) + ' }'
+    if isinstance(value, list):
+        return '[' + ', '.join(_inline(v) for v in value) + ']'
+    return json.dumps(value)
+
+
+def vercel_config():
+    """vercel.json text with regenerated "headers" and "redirects", one rule per line as in the rest of the file."""
+    with open(VERCEL_JSON) as f:
+        config = json.load(f)
+    config['headers'] = cache_headers()
+    config.pop('redirects', None)
+    redirects = [{'source': f'/{dup}', 'destination': f'/{first}', 'permanent': True}
+                 for first, dups in asset_index.duplicates().items() for dup in dups]
+    if redirects:
+        config['redirects'] = redirects
+    fields = []
+    for key, value in config.items():
+        if isinstance(value, list):
+            rows = ',\n'.join(f'    {_inline(v)}' for v in value)
+            fields.append(f'  {json.dumps(key)}: [\n{rows}\n  ]')
+        else:
+            fields.append(f'  {json.dumps(key)}: {json.dumps(value)}')
+    return '{\n' + ',\n'.join(fields) + '\n}\n'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help='report stale files without writing them')
+    args = parser.parse_args(argv)
+
+    outputs = [(VERCEL_JSON, vercel_config())]
+    for name in HAND_WRITTEN:
+        path = os.path.join(ROOT, name)
+        with open(path) as f:
+            outputs.append((path, critical_css.apply(rewrite_refs(f.read()))))
+    stale = []
+    for path, text in outputs:
+        if args.check:
+            with open(path) as f:
+                changed = f.read() != text
+        else:
+            changed = write_if_changed(path, text)
+        if changed:
+            stale.append(os.path.relpath(path, ROOT))
+    verb = 'stale' if args.check else 'updated'
+    print(f'{len(stale)} {verb}, {len(outputs) - len(stale)} unchanged' + (f': {", ".join(stale)}' if stale else ''))
+    print(asset_index.dedup_report())
+    return 1 if args.check and stale else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
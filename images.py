@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Responsive variants of the screenshots under img/.
+
+Every PNG in img/components and img/screens is resized to a few widths in
+AVIF and WebP (byte-identical sources once, see asset_index.canonical).
+Variant file names carry the source's content hash and the encoder quality,
+so an unchanged screenshot is never re-encoded.
+img/responsive/manifest.json records what exists, and picture() turns it into
+<picture>/srcset markup for the generators; an image missing from the
+manifest falls back to the plain PNG.
+
+Encoding needs Pillow (AVIF needs Pillow 11.3+); the generators do not.
+The variants and the manifest are committed along with the pages that use
+them, since the deploy (vercel.json) runs compress.py only: after adding or
+changing a screenshot, run build.py with Pillow installed and commit
+img/responsive/ with the regenerated pages.
+
+Usage: python images.py [--widths 480 960 1440] [--quality 60]
+"""
+import argparse, hashlib, json, os, sys
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = features = None
+
+import asset_index, buildtrace
+from fingerprint import url
+from outputs import file_digest, write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIRS = ('img/components', 'img/screens')
+OUT_DIR = 'img/responsive'
+MANIFEST = os.path.join(ROOT, OUT_DIR, 'manifest.json')
+WIDTHS = (480, 960, 1440)
+# Preferred first: browsers take the first <source> they support
+FORMATS = (('avif', 'image/avif'), ('webp', 'image/webp'))
+
+_manifest = None
+
+
+def source_files():
+    """Paths (relative to the repo root) of every source PNG, sorted, skipping duplicates of another."""
+    for d in SOURCE_DIRS:
+        for name in sorted(os.listdir(os.path.join(ROOT, d))):
+            if name.endswith('.png') and asset_index.canonical(f'{d}/{name}') == f'{d}/{name}':
+                yield f'{d}/{name}'
+
+
+def _digest(path):
+    return file_digest(path, hashlib.blake2b(digest_size=8)).hexdigest()
+
+
+def manifest():
+    """The variant manifest, {source: {hash, quality, width, height, variants: {format: [[width, path, bytes], ...]}}}."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST) as f:
+                _manifest = json.load(f)
+        except FileNotFoundError:
+            _manifest = {}
+    return _manifest
+
+
+def picture(src, alt, sizes, prefix='', attrs=''):
+    """<img> markup for `src` (e.g. 'img/screens/faqs.png'), wrapped in <picture> when variants exist.
+
+    `prefix` is the path from the page back to the site root, `attrs` any
+    extra <img> attributes (with a leading space).
+    """
+    img = f'<img src="{url(src, prefix)}" alt="{alt}"{attrs}>'
+    entry = manifest().get(asset_index.canonical(src))
+    if not entry:
+        return img
+    sources = ''.join(
+        f'<source type="{mime}" sizes="{sizes}" srcset="'
+        + ', '.join(f'{prefix}{path} {w}w' for w, path, _ in entry['variants'][fmt]) + '">'
+        for fmt, mime in FORMATS if fmt in entry['variants'])
+    return f'<picture>{sources}{img}</picture>'
+
+
+def _encode(im, path, fmt, quality):
+    if fmt == 'webp':
+        im.save(path, 'WEBP', quality=quality, method=6)
+    else:
+        im.save(path, 'AVIF', quality=quality)
+    return os.path.getsize(path)
+
+
+def build(widths=WIDTHS, quality=60):
+    """Encode variants for new or changed sources and rewrite the manifest. Returns (encoded, reused)."""
+    if Image is None:
+        sys.exit('images.py needs Pillow to encode variants: pip install Pillow')
+    formats = [fmt for fmt, _ in FORMATS if features.check(fmt)]
+    if not formats:
+        sys.exit('this Pillow build supports neither AVIF nor WebP')
+    os.makedirs(os.path.join(ROOT, OUT_DIR), exist_ok=True)
+    old, new = manifest(), {}
+    encoded = reused = 0
+    for src in source_files():
+        digest = _digest(os.path.join(ROOT, src))
+        entry = old.get(src)
+        if (entry and entry['hash'] == digest and entry.get('quality') == quality
+                and sorted(entry['variants']) == sorted(formats)
+                and all(os.path.exists(os.path.join(ROOT, p)) for v in entry['variants'].values() for _, p, _ in v)
+                and {w for w, _, _ in entry['variants'][formats[0]]} == {min(w, entry['width']) for w in widths}):
+            new[src] = entry
+            reused += 1
+            continue
+        stem = os.path.splitext(os.path.basename(src))[0]
+        with buildtrace.span('encode', source=src) as s, Image.open(os.path.join(ROOT, src)) as im:
+            im.load()
+            w0, h0 = im.size
+            variants = {fmt: [] for fmt in formats}
+            for w in sorted({min(w, w0) for w in widths}):
+                scaled = im if w == w0 else im.resize((w, max(1, round(h0 * w / w0))), Image.LANCZOS)
+                for fmt in formats:
+                    # Source hash and quality in the name: a URL never changes content (see fingerprint.py)
+                    path = f'{OUT_DIR}/{stem}-{digest}-q{quality}-{w}.{fmt}'
+                    variants[fmt].append([w, path, _encode(scaled, os.path.join(ROOT, path), fmt, quality)])
+                    s.add(items=1, bytes=variants[fmt][-1][2])
+        new[src] = {'hash': digest, 'quality': quality, 'width': w0, 'height': h0, 'variants': variants}
+        encoded += 1
+        print(f'  {src} ({w0}x{h0})')
+
+    # Variants of sources that changed or were removed
+    keep = {p for e in new.values() for v in e['variants'].values() for _, p, _ in v}
+    for name in os.listdir(os.path.join(ROOT, OUT_DIR)):
+        path = f'{OUT_DIR}/{name}'
+        if path not in keep and name != os.path.basename(MANIFEST):
+            os.remove(os.path.join(ROOT, path))
+    write_if_changed(MANIFEST, json.dumps(new, indent=1, sort_keys=True) + '\n')
+    global _manifest
+    _manifest = new
+    return encoded, reused
+
+
+def weight_report(entries):
+    """Source PNG bytes vs. the smallest preferred variant (a phone) and the largest (a desktop)."""
+    png = sum(os.path.getsize(os.path.join(ROOT, src)) for src in entries)
+    small = large = 0
+    for e in entries.values():
+        fmt = next(f for f, _ in FORMATS if f in e['variants'])
+        small += e['variants'][fmt][0][2]
+        large += e['variants'][fmt][-1][2]
+    return (f'{len(entries)} images: {png / 1e6:.1f} MB as PNG, {small / 1e6:.2f} MB at the narrowest width '
+            f'({png / max(small, 1):.0f}x smaller), {large / 1e6:.2f} MB at the widest')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--widths', type=int, nargs='+', default=list(WIDTHS),
+                        help='target widths in px; never upscaled (default: %(default)s)')
+    parser.add_argument('--quality', type=int, default=60, help='encoder quality 0-100 (default: %(default)s)')
+    args = parser.parse_args(argv)
+    encoded, reused = build(sorted(args.widths), args.quality)
+    print(f'{encoded} encoded, {reused} reused')
+    print(weight_report(manifest()))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+/* Virtual scrolling for the master inventory table (build_components.py --virtual).
+ *
+ * Each .inv-category section fetches its rows from data-src the first time it
+ * is opened. Only the rows that intersect its scroll box (plus a few either
+ * side) are in the DOM; two spacer rows stand in for the rest, so a category
+ * of tens of thousands of elements costs the same to lay out as one screenful.
+ * A link to a section's id (as search results use) opens it.
+ */
+(function () {
+  'use strict';
+
+  var OVERSCAN = 8;
+
+  function Category(el) {
+    this.el = el;
+    this.viewport = el.querySelector('.inv-viewport');
+    this.tbody = el.querySelector('tbody');
+    this.rows = null;
+    this.rowHeight = 0;
+    this.range = null;
+    this.pending = false;
+
+    var self = this;
+    el.addEventListener('toggle', function () {
+      if (el.open && !self.rows) self.load();
+      else if (el.open) self.render();
+    });
+    this.viewport.addEventListener('scroll', function () { self.schedule(); }, { passive: true });
+    window.addEventListener('resize', function () { self.schedule(); });
+  }
+
+  Category.prototype.load = function () {
+    var self = this;
+    this.rows = [];
+    fetch(this.el.dataset.src).then(function (r) {
+      if (!r.ok) throw new Error(self.el.dataset.src + ': ' + r.status);
+      return r.json();
+    }).then(function (rows) {
+      self.rows = rows;
+      self.render();
+    }, function () {
+      self.rows = null;
+    });
+  };
+
+  // Same markup as the inline rows of the static table
+  Category.prototype.row = function (cells) {
+    var tr = document.createElement('tr'), td, el;
+    td = tr.appendChild(document.createElement('td'));
+    td.appendChild(document.createElement('strong')).textContent = cells[0];
+    tr.appendChild(document.createElement('td')).textContent = cells[1];
+    tr.appendChild(document.createElement('td')).textContent = cells[2];
+    el = tr.appendChild(document.createElement('td')).appendChild(document.createElement('span'));
+    el.className = 'token-name';
+    el.textContent = cells[3];
+    el = tr.appendChild(document.createElement('td')).appendChild(document.createElement('span'));
+    el.className = 'tier-badge tier-' + cells[4];
+    el.textContent = 'T' + cells[4];
+    return tr;
+  };
+
+  Category.prototype.spacer = function (height) {
+    var tr = document.createElement('tr'), td = tr.appendChild(document.createElement('td'));
+    td.colSpan = 5;
+    td.style.cssText = 'padding:0;border:none;height:' + height + 'px';
+    return tr;
+  };
+
+  Category.prototype.schedule = function () {
+    if (this.pending || !this.el.open) return;
+    this.pending = true;
+    var self = this;
+    requestAnimationFrame(function () { self.pending = false; self.render(); });
+  };
+
+  Category.prototype.render = function () {
+    var rows = this.rows, vp = this.viewport;
+    if (!rows || !rows.length) return;
+    if (!this.rowHeight) {
+      // Rows are one line each (white-space: nowrap), so the first one sets the pitch
+      var probe = this.tbody.appendChild(this.row(rows[0]));
+      this.rowHeight = probe.getBoundingClientRect().height || 41;
+      this.tbody.removeChild(probe);
+    }
+    var h = this.rowHeight, head = this.el.querySelector('thead').getBoundingClientRect().height;
+    var top = Math.max(0, vp.scrollTop - head);
+    var first = Math.min(Math.floor(top / h), rows.length - 1);
+    var start = Math.max(0, first - OVERSCAN);
+    var end = Math.min(rows.length, first + Math.ceil(vp.clientHeight / h) + OVERSCAN + 1);
+    if (this.range && this.range[0] === start && this.range[1] === end) return;
+    this.range = [start, end];
+
+    var frag = document.createDocumentFragment();
+    if (start) frag.appendChild(this.spacer(start * h));
+    for (var i = start; i < end; i++) frag.appendChild(this.row(rows[i]));
+    if (end < rows.length) frag.appendChild(this.spacer((rows.length - end) * h));
+    this.tbody.textContent = '';
+    this.tbody.appendChild(frag);
+  };
+
+  // Search results link to a category by id (see search_index.py)
+  function openTarget() {
+    var el = location.hash && document.getElementById(decodeURIComponent(location.hash.slice(1)));
+    if (el && el.classList.contains('inv-category')) {
+      el.open = true;
+      el.scrollIntoView();
+    }
+  }
+
+  function init() {
+    var els = document.querySelectorAll('.inv-category');
+    for (var i = 0; i < els.length; i++) new Category(els[i]);
+    openTarget();
+    window.addEventListener('hashchange', openTarget);
+  }
+
+  if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', init);
+  else init();
+})();
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Indexed SQLite store for the component inventory, plus a query CLI.
+
+parse_inventory.py --db PATH writes the store. Examples:
+
+  python inventory_db.py inventory.db --category "Form Controls" --min-variants 10
+  python inventory_db.py inventory.db --name Tooltip
+  python inventory_db.py inventory.db --id 40006598:72259
+"""
+import argparse, os, sqlite3, sys, time
+
+SCHEMA = '''
+CREATE TABLE components (
+    ord INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    variants INTEGER NOT NULL,
+    nested_variants INTEGER
+);
+'''
+
+# Built after the bulk insert, which is much faster than maintaining them row by row.
+# Descending variant keys (ties fall back to rowid order) match query()'s
+# ORDER BY, so filtered queries walk an index and stop at LIMIT without sorting.
+INDEXES = '''
+CREATE INDEX components_id ON components (id);
+CREATE INDEX components_category_variants ON components (category, variants DESC);
+CREATE INDEX components_type_variants ON components (type, variants DESC);
+CREATE INDEX components_variants ON components (variants DESC);
+CREATE VIRTUAL TABLE components_fts USING fts5 (name, content='components', content_rowid='ord', tokenize='trigram');
+INSERT INTO components_fts (rowid, name) SELECT ord, name FROM components;
+'''
+
+
+def write(cats, path):
+    """Write categorized components (see parse_inventory.scan_page) to a fresh store at `path`.
+
+    The store is built in a temporary file and moved into place, so readers
+    never see a half-written database.
+    """
+    tmp = f'{path}.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.executescript(SCHEMA)
+        rows = ((c['id'], c['name'], c['type'], cat, c['variants'], c.get('nested_variants'))
+                for cat, items in cats.items() for c in items)
+        with conn:
+            conn.executemany('INSERT INTO components (id, name, type, category, variants, nested_variants) '
+                             'VALUES (?, ?, ?, ?, ?, ?)', rows)
+        conn.executescript(INDEXES)
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+
+
+def query(conn, category=None, node_type=None, min_variants=None, max_variants=None,
+          name=None, node_id=None, limit=50):
+    """Return matching (id, name, type, category, variants, nested_variants) rows, most variants first."""
+    where, params = [], []
+    if name:
+        if len(name) >= 3:
+            # Trigram FTS: any substring of 3+ characters, case-insensitive
+            where.append('ord IN (SELECT rowid FROM components_fts WHERE components_fts MATCH ?)')
+            params.append('"' + name.replace('"', '""') + '"')
+        else:
+            where.append('name LIKE ?')
+            params.append(f'%{name}%')
+    for column, value in (('id', node_id), ('category', category), ('type', node_type)):
+        if value is not None:
+            where.append(f'{column} = ?')
+            params.append(value)
+    if min_variants is not None:
+        where.append('variants >= ?')
+        params.append(min_variants)
+    if max_variants is not None:
+        where.append('variants <= ?')
+        params.append(max_variants)
+    sql = 'SELECT id, name, type, category, variants, nested_variants FROM components'
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    sql += ' ORDER BY variants DESC, ord'
+    if limit:
+        sql += f' LIMIT {int(limit)}'
+    return conn.execute(sql, params).fetchall()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('db', help='store written by parse_inventory.py --db')
+    parser.add_argument('--category', help='exact category, e.g. "Form Controls"')
+    parser.add_argument('--type', dest='node_type', help='node type: frame or symbol')
+    parser.add_argument('--min-variants', type=int)
+    parser.add_argument('--max-variants', type=int)
+    parser.add_argument('--name', help='substring of the component name (case-insensitive)')
+    parser.add_argument('--id', dest='node_id', help='exact Figma node id')
+    parser.add_argument('--limit', type=int, default=50, help='0 for no limit (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.error(f'{args.db} does not exist; build it with parse_inventory.py --db')
+    conn = sqlite3.connect(f'file:{args.db}?mode=ro', uri=True)
+    t0 = time.perf_counter()
+    rows = query(conn, args.category, args.node_type, args.min_variants, args.max_variants,
+                 args.name, args.node_id, args.limit)
+    elapsed = (time.perf_counter() - t0) * 1000
+    for nid, name, type_, cat, variants, nested in rows:
+        v = f" [{variants}v]" if variants > 0 else ""
+        n = f" [{nested} nested]" if nested else ""
+        print(f"  {nid:>20}  {name}{v}{n}  ({cat}, {type_})")
+    print(f"\n{len(rows)} rows in {elapsed:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
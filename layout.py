@@ -0,0 +1,81 @@
+"""Shared page chrome (head, site nav, footer) for the generators.
+
+A Layout is built once per section and holds the chrome as prebuilt string
+fragments, so rendering a page is a single join of constants around the
+title and body.
+"""
+import re
+
+from fingerprint import url
+
+SITE_TITLE = 'AMI Design System Audit'
+GENERATED = 'February 27, 2026'
+REPO_URL = 'https://github.com/d999ss/AMI-Design-System'
+
+NAV_LINKS = [
+    ('index.html', 'Overview'),
+    ('tokens.html', 'Tokens'),
+    ('components.html', 'Components'),
+    ('screens.html', 'Screens'),
+    ('assets.html', 'Assets'),
+    ('architecture.html', 'Architecture'),
+    ('patterns.html', 'Patterns'),
+    ('remediation.html', 'Remediation'),
+]
+
+ACTIVE = ' class="active"'
+
+
+def anchor(text):
+    """`text` as an element id or file name: 'Brand / Logos' -> 'brand-logos'."""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def nav(active, prefix=''):
+    """The site-nav block with `active` (e.g. 'components.html') highlighted."""
+    links = ''.join(f'      <a href="{prefix}{href}"{ACTIVE if href == active else ""}>{label}</a>\n'
+                    for href, label in NAV_LINKS)
+    return f'''<nav class="site-nav">
+  <div class="nav-inner">
+    <a href="{prefix}index.html" class="nav-brand">AMI Design System</a>
+    <div class="nav-links">
+{links}    </div>
+  </div>
+</nav>
+'''
+
+
+class Layout:
+    """Chrome for pages of one section. `prefix` is the path back to the site root ('' or '../')."""
+
+    __slots__ = ('_head_open', '_head_close', 'footer')
+
+    def __init__(self, active, prefix='', head='', generated=GENERATED):
+        self._head_open = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>'''
+        self._head_close = f''' — {SITE_TITLE}</title>
+<link rel="stylesheet" href="{url('style.css', prefix)}">
+{head}</head>
+<body>
+
+{nav(active, prefix)}
+'''
+        self.footer = f'''<footer class="site-footer">
+  {SITE_TITLE} &mdash; Generated {generated} &mdash; <a href="{REPO_URL}">GitHub</a>
+</footer>
+
+</body>
+</html>
+'''
+
+    def head(self, title):
+        """Everything from the doctype through the site nav, followed by a blank line."""
+        return self._head_open + title + self._head_close
+
+    def render(self, title, body):
+        """A full page: chrome around `body`, which should end with a blank line."""
+        return ''.join((self._head_open, title, self._head_close, body, self.footer))
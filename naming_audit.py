@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""Naming-system classifier for the token paths in token_data.json.
+
+Every token path goes into a trie keyed by segment ('Font/Font size/5' ->
+'Font' -> 'Font size' -> '5'). Each trie node with leaves under it is one
+spelling of a token prefix. Its family is the stemmed words of the prefix,
+deduplicated, so 'spacing/', 'Space/' and 'Spacing/' share the family
+'spac', and 'Font/Font size/' joins 'font size/'. Within a family, prefixes
+that differ in casing convention ('lowercase', 'capitalized', 'title',
+'snake') or in word form ('space' vs. 'spacing') are separate naming systems.
+
+Composite typography styles (values like 'Font(Graphik, Regular, 13, 20)')
+are the legacy type scale rather than another spelling of the font tokens:
+styles under a platform ('Desktop/P3') form the legacy desktop system, the
+rest ('Body/Small') the legacy composite one. A style counts as using its
+underlying font, as a font family token does, so a component that pairs
+'font family/graphik' with a Graphik 'Body/Small' is not mixing anything;
+one that uses Graphik and Roboto is.
+
+The spacing, typography and corner-radius entries of "_naming_inconsistencies"
+are regenerated from that classification, with notes naming the components
+that mix systems or fonts, and the casing of each corner spelling. Other
+entries (e.g. "error_red") are left alone. An existing "system_N_<name>" key
+keeps its name and place for the system its example paths belong to, as
+tokens.html refers to them; only a system not listed yet gets a new number.
+Components are listed by their display names (see build_detail_pages.py), in
+alphabetical order.
+Per-component results are cached in .naming_index.json under a hash of the
+component's tokens, so only newly extracted or changed components are
+classified again.
+
+Usage: python naming_audit.py [--check]
+"""
+import argparse, functools, hashlib, json, os, re, sys
+
+import token_graph
+from outputs import write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(ROOT, '.naming_index.json')
+INDEX_VERSION = 2
+SECTION = '_naming_inconsistencies'
+
+# Regenerated entries: (key, first stems of the families that belong to it)
+CATEGORIES = (
+    ('spacing_systems', ('spac',)),
+    ('font_token_systems', ('font', 'line', 'letter')),
+    ('corner_radius', ('corner',)),
+)
+COMPOSITE = re.compile(r'Font\((?P<font>[^,)]+)')
+# First segments of composite styles that belong to a per-platform type scale
+PLATFORMS = ('desktop', 'tablet', 'mobile')
+
+
+@functools.lru_cache(maxsize=None)
+def _display_names():
+    import build_detail_pages, build_detail_pages_batch2
+    # 'ISI (Important Safety Information)' is listed as ISI
+    return {c['slug']: re.sub(r'\s*\(.*\)$', '', c['name'])
+            for module in (build_detail_pages, build_detail_pages_batch2) for c in module.components}
+
+
+def display_name(component):
+    """The name a component's detail page uses, or one made from its token_data.json key ('navigation-xl' ->
+    'Navigation XL')."""
+    name = _display_names().get(component)
+    return name or ' '.join(w.upper() if len(w) <= 3 else w.capitalize() for w in component.split('-'))
+
+
+def _listed(components):
+    return ', '.join(sorted(map(display_name, components)))
+
+
+def stem(word):
+    """Crude English stem, enough to fold 'spacing'/'space' and 'families'/'family' together."""
+    word = re.sub(r'[^a-z0-9]', '', word.lower())
+    for suffix, repl in (('ies', 'y'), ('ing', ''), ('s', ''), ('e', '')):
+        if word.endswith(suffix) and len(word) > len(suffix) + 2:
+            return word[:-len(suffix)] + repl
+    return word
+
+
+def casing(segment):
+    """Casing convention of one path segment."""
+    if '_' in segment:
+        return 'snake'
+    words = [w for w in segment.split() if w[:1].isalpha()]
+    if not words or all(w.islower() for w in words):
+        return 'lowercase'
+    if words[0][0].isupper() and all(w.islower() for w in words[1:]):
+        return 'capitalized'
+    if all(w[0].isupper() for w in words):
+        return 'title'
+    return 'mixed'
+
+
+def classify(path, value):
+    """{family, forms, casing, composite, font} for one token path.
+
+    `font` is the typeface a composite style or font family token names, else None.
+    """
+    segments = [s.strip() for s in path.split('/') if s.strip()]
+    prefix = segments[:-1] or segments
+    words = [w for s in prefix for w in re.split(r'[\s_]+', s) if w]
+    family = list(dict.fromkeys(stem(w) for w in words))
+    casings = {casing(s) for s in prefix}
+    composite = COMPOSITE.match(value)
+    if composite:
+        font = composite['font'].strip()
+    else:
+        font = value.strip() if family[:2] == ['font', 'family'] else None
+    return {'family': ' '.join(family),
+            'forms': {stem(w): w.lower() for w in words},
+            'casing': casings.pop() if len(casings) == 1 else 'mixed',
+            'composite': bool(composite),
+            'font': font}
+
+
+class PathTrie:
+    """Token paths by segment; each node counts the tokens under it per component."""
+
+    def __init__(self):
+        self.root = {'children': {}, 'components': {}}
+
+    def insert(self, component, path):
+        node = self.root
+        for segment in (s.strip() for s in path.split('/') if s.strip()):
+            node = node['children'].setdefault(segment, {'children': {}, 'components': {}})
+            node['components'][component] = node['components'].get(component, 0) + 1
+
+    def prefixes(self):
+        """(prefix, node) for every node with at least one leaf child, depth first."""
+        stack = [((), self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            if any(not child['children'] for child in node['children'].values()) and prefix:
+                yield '/'.join(prefix), node
+            stack.extend((prefix + (seg,), child) for seg, child in sorted(node['children'].items(), reverse=True))
+
+
+def _digest(tokens):
+    return hashlib.blake2b(json.dumps(tokens, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def classify_all(graph):
+    """{component: {path: classification}}, reusing .naming_index.json for unchanged components.
+
+    Returns (classes, classified, reused).
+    """
+    try:
+        with open(INDEX_PATH) as f:
+            cached = json.load(f)
+        cached = cached['components'] if cached.get('version') == INDEX_VERSION else {}
+    except (OSError, ValueError):
+        cached = {}
+    entries, classified, reused = {}, 0, 0
+    for component, tokens in graph.components.items():
+        digest = _digest(tokens)
+        entry = cached.get(component)
+        if entry and entry['hash'] == digest:
+            reused += 1
+        else:
+            entry = {'hash': digest, 'paths': {p: classify(p, v) for p, v in tokens.items()}}
+            classified += 1
+        entries[component] = entry
+    if entries != cached:
+        tmp = f'{INDEX_PATH}.{os.getpid()}.tmp'
+        with open(tmp, 'w') as f:
+            f.write(json.dumps({'version': INDEX_VERSION, 'components': entries}, indent=1, sort_keys=True))
+        os.replace(tmp, INDEX_PATH)
+    return {c: e['paths'] for c, e in entries.items()}, classified, reused
+
+
+def _category(cls):
+    if cls['composite']:
+        return 'font_token_systems'
+    first = cls['family'].split(' ')[0]
+    return next((key for key, stems in CATEGORIES if first in stems), None)
+
+
+def systems(graph, classes):
+    """{category: {system key: {prefix: trie node}}} over the trie's prefixes.
+
+    A system key is (casing, composite, word forms). Word forms only count
+    where one family has prefixes of the same casing spelled differently, so
+    'Space/' and 'Spacing/' are told apart while 'font size/' and
+    'font family/' are one lowercase system. Composite styles are keyed
+    ('legacy', True, (platform,)) or ('legacy', True, ()), whatever their
+    spelling.
+    """
+    trie = PathTrie()
+    for component, tokens in graph.components.items():
+        for path in tokens:
+            trie.insert(component, path)
+    leaf_class = {}
+    for component, paths in classes.items():
+        for path, cls in paths.items():
+            leaf_class.setdefault(_prefix(path), cls)
+    families, result = {}, {}
+    for prefix, node in trie.prefixes():
+        cls = leaf_class.get(prefix)
+        category = cls and _category(cls)
+        if category and cls['composite']:
+            first = prefix.split('/')[0].strip().lower()
+            key = ('legacy', True, (first,) if first in PLATFORMS else ())
+            result.setdefault(category, {}).setdefault(key, {})[prefix] = node
+        elif category:
+            families.setdefault((category, cls['family']), []).append((prefix, node, cls))
+    for (category, _), nodes in sorted(families.items()):
+        spellings = {}
+        for _, _, cls in nodes:
+            spellings.setdefault((cls['casing'], cls['composite']), set()).add(tuple(sorted(cls['forms'].values())))
+        groups = result.setdefault(category, {})
+        for prefix, node, cls in nodes:
+            style = (cls['casing'], cls['composite'])
+            forms = tuple(sorted(cls['forms'].values())) if len(spellings[style]) > 1 else ()
+            groups.setdefault(style + (forms,), {})[prefix] = node
+    return result
+
+
+def _components(group):
+    comps = {}
+    for node in group.values():
+        for c, n in node['components'].items():
+            comps[c] = comps.get(c, 0) + n
+    return sorted(comps, key=lambda c: (-comps[c], c))
+
+
+def _example(prefix, node):
+    """prefix/leaf for the leaf used by the most components."""
+    leaves = [(len(child['components']), seg) for seg, child in node['children'].items() if not child['children']]
+    return f'{prefix}/{min(leaves, key=lambda x: (-x[0], x[1]))[1]}'
+
+
+def _label(key, keys):
+    casing_, composite, forms = key
+    if composite:
+        return 'legacy_' + (forms[0] if forms else 'composite')
+    label = casing_
+    if forms and sum(1 for k in keys if k[:2] == key[:2]) > 1:
+        label += '_' + '_'.join(f.replace(' ', '_') for f in forms)
+    return label
+
+
+def _prefix(path):
+    return '/'.join(s.strip() for s in path.split('/')[:-1] if s.strip()) or path.strip()
+
+
+def _fonts(group, classes):
+    """{font: [components]} for the composite styles in `group`."""
+    fonts = {}
+    for prefix, node in group.items():
+        for c in node['components']:
+            for path, cls in classes[c].items():
+                if cls['font'] and cls['composite'] and _prefix(path) == prefix:
+                    fonts.setdefault(cls['font'], set()).add(c)
+    return dict(sorted(fonts.items()))
+
+
+def _mixing_note(groups):
+    """'Components mixing systems: ...' over the groups given, or None."""
+    used = {}
+    for _, group in sorted(groups.items(), key=lambda kv: (-len(_components(kv[1])), kv[0])):
+        prefixes = sorted(group, key=lambda p: (-len(group[p]['components']), p))
+        for c in _components(group):
+            used.setdefault(c, []).append(next(p for p in prefixes if c in group[p]['components']) + '/')
+    mixed = {display_name(c): prefixes for c, prefixes in used.items() if len(prefixes) > 1}
+    if mixed:
+        return 'Components mixing systems: ' + '; '.join(f'{c} ({", ".join(p)})' for c, p in sorted(mixed.items()))
+    return None
+
+
+def _matches(group, desc):
+    """Whether an existing entry's example paths ('Space/8, Space/16 (...)') fall under `group`'s prefixes."""
+    examples = desc.split(' (')[0].split(', ')
+    return any(e == p or e.startswith(p + '/') for e in examples for p in group)
+
+
+def system_entries(groups, classes, current):
+    """The "system_N_<convention>" entries of one category, plus a mixing note.
+
+    Systems already in `current` keep their keys and order; new ones follow,
+    most widely used first. Composite styles are listed with their fonts, and
+    left out of the note (see font_note).
+    """
+    ordered = sorted(groups.items(), key=lambda kv: (-len(_components(kv[1])), kv[0]))
+    names, taken = {}, set()
+    for name, desc in current.items():
+        if re.match(r'system_\d+_', name):
+            key = next((k for k, g in ordered if k not in taken and _matches(g, desc)), None)
+            if key:
+                names[key] = name
+                taken.add(key)
+    n = max((int(name.split('_')[1]) for name in names.values()), default=0)
+    for key, _ in ordered:
+        if key not in names:
+            n += 1
+            names[key] = f'system_{n}_{_label(key, groups)}'
+    entries = {}
+    for key, group in sorted(ordered, key=lambda kv: int(names[kv[0]].split('_')[1])):
+        prefixes = sorted(group, key=lambda p: (-len(group[p]['components']), p))
+        examples = ', '.join(_example(p, group[p]) for p in prefixes[:3])
+        entries[names[key]] = f'{examples} ({_listed(_components(group))})'
+        if key[1]:
+            entries[names[key]] += ' \u2014 composite styles in ' + '; '.join(
+                f'{font} ({_listed(c)})' for font, c in _fonts(group, classes).items())
+    note = _mixing_note({k: g for k, g in groups.items() if not k[1]})
+    if note:
+        entries['note'] = note
+    return entries
+
+
+def font_note(classes):
+    """'Components mixing fonts: ...', from font family tokens and composite styles, or None."""
+    mixed = {}
+    for c, paths in classes.items():
+        fonts = sorted({cls['font'] for cls in paths.values() if cls['font']})
+        if len(fonts) > 1:
+            mixed[display_name(c)] = fonts
+    if mixed:
+        return 'Components mixing fonts: ' + '; '.join(f'{c} ({", ".join(f)})' for c, f in sorted(mixed.items()))
+    return None
+
+
+def corner_entries(graph, groups, current):
+    """{corner token path: 'value (components)'}, as the hand-written section listed them, and the casings.
+
+    Paths already in `current` keep their order; new ones follow, sorted.
+    """
+    entries, casings = {p: None for p in current if '/' in p}, []
+    for key, group in sorted(groups.items()):
+        for prefix in sorted(group):
+            for leaf, child in sorted(group[prefix]['children'].items()):
+                if child['children']:
+                    continue
+                path = f'{prefix}/{leaf}'
+                comps = graph.lookup(path)
+                values = ' / '.join(sorted(set(comps.values())))
+                entries[path] = f'{values} ({_listed(comps)})'
+        casings.append(f'{key[0]}: {", ".join(p + "/" for p in sorted(group))} ({_listed(_components(group))})')
+    entries = {p: desc for p, desc in entries.items() if desc is not None}
+    if casings:
+        entries['casing'] = '; '.join(casings)
+    note = _mixing_note(groups)
+    if note:
+        entries['note'] = note
+    return entries
+
+
+def section(graph, classes, current):
+    """The regenerated "_naming_inconsistencies" dict; entries this script does not own are kept."""
+    found = systems(graph, classes)
+    updated = dict(current)
+    for key, _ in CATEGORIES:
+        groups = found.get(key, {})
+        previous = current.get(key, {})
+        updated[key] = (corner_entries(graph, groups, previous) if key == 'corner_radius'
+                        else system_entries(groups, classes, previous))
+    note = font_note(classes)
+    if note:
+        updated['font_token_systems']['font_note'] = note
+    return updated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help='report a stale token_data.json without writing it')
+    args = parser.parse_args(argv)
+
+    graph = token_graph.graph()
+    classes, classified, reused = classify_all(graph)
+    with open(token_graph.TOKEN_DATA) as f:
+        text = f.read()
+    data = json.loads(text)
+    data[SECTION] = section(graph, classes, data.get(SECTION, {}))
+    for key, _ in CATEGORIES:
+        print(f'{key}:')
+        for name, desc in data[SECTION][key].items():
+            print(f'  {name}: {desc}')
+    print(f'{classified} components classified, {reused} reused')
+
+    updated = json.dumps(data, indent=2, ensure_ascii=False) + '\n'
+    if args.check:
+        stale = updated != text
+        print(f'token_data.json is {"stale" if stale else "up to date"}')
+        return 1 if stale else 0
+    write_if_changed(token_graph.TOKEN_DATA, updated)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Full-depth index of every node in a Figma metadata page.
+
+Nodes are numbered in document (preorder) order, so the subtree of node i is
+the contiguous range [i, end[i]). Ancestor tests are O(1), descendant walks are
+O(subtree), and variant counts come from a prefix sum in O(1). Columns live in
+compact arrays rather than one dict per node, which keeps multi-million-node
+libraries in memory comfortably.
+
+Usage: python node_index.py <export.json> [node_id ...]
+"""
+import re, sys
+from array import array
+from itertools import accumulate
+
+# Indent and tag of an opening tag line, then its id and name attributes
+_NODE = re.compile(r'\s*<(\w+)')
+_ID = re.compile(r'\bid="([^"]*)"')
+_NAME = re.compile(r'\bname="([^"]*)"')
+
+# Figma component-set variants are emitted as <symbol> nodes
+VARIANT_TAG = 'symbol'
+
+
+class NodeIndex:
+    """Column-store tree of a page: parent, depth, tag, subtree end, id and name per node."""
+
+    __slots__ = ('parent', 'depth', 'tag', 'end', 'ids', 'names', 'tag_names',
+                 '_tag_codes', '_variant_prefix', '_by_id')
+
+    def __init__(self):
+        self.parent = array('i')
+        self.depth = array('H')
+        self.tag = bytearray()
+        self.end = array('i')
+        self.ids = []
+        self.names = []
+        self.tag_names = []
+        self._tag_codes = {}
+        self._variant_prefix = None
+        self._by_id = None
+
+    @classmethod
+    def from_lines(cls, lines):
+        """Build the index from the lines of a page (see parse_inventory.load_lines/iter_lines)."""
+        index = cls()
+        parent, depth, tag, end = index.parent, index.depth, index.tag, index.end
+        ids, names, codes = index.ids, index.names, index._tag_codes
+        interned = {}
+        stack = []
+        for line in lines:
+            m = _NODE.match(line)
+            if not m:
+                continue
+            level = (m.start(1) - 1) // 2
+            # Close every open node at this level or deeper
+            while stack and depth[stack[-1]] >= level:
+                end[stack.pop()] = len(ids)
+            tag_name = m.group(1)
+            code = codes.get(tag_name)
+            if code is None:
+                code = codes[tag_name] = len(index.tag_names)
+                index.tag_names.append(tag_name)
+            id_m = _ID.search(line, m.end())
+            name_m = _NAME.search(line, m.end())
+            name = name_m.group(1) if name_m else ''
+            node = len(ids)
+            parent.append(stack[-1] if stack else -1)
+            depth.append(level)
+            tag.append(code)
+            end.append(node + 1)
+            ids.append(id_m.group(1) if id_m else '')
+            names.append(interned.setdefault(name, name))
+            if not line.rstrip().endswith('/>'):
+                stack.append(node)
+        while stack:
+            end[stack.pop()] = len(ids)
+        return index
+
+    def __len__(self):
+        return len(self.ids)
+
+    def find(self, node_id):
+        """Return the index of the node with Figma id `node_id`, or -1."""
+        if self._by_id is None:
+            self._by_id = {nid: i for i, nid in enumerate(self.ids) if nid}
+        return self._by_id.get(node_id, -1)
+
+    def is_ancestor(self, a, b):
+        """True if node a is a proper ancestor of node b. O(1)."""
+        return a < b < self.end[a]
+
+    def ancestors(self, i):
+        """Yield the ancestors of node i, nearest first."""
+        i = self.parent[i]
+        while i >= 0:
+            yield i
+            i = self.parent[i]
+
+    def descendants(self, i):
+        """Range of all descendants of node i, in document order."""
+        return range(i + 1, self.end[i])
+
+    def children(self, i):
+        """Yield the direct children of node i, skipping over their subtrees."""
+        j, stop = i + 1, self.end[i]
+        end = self.end
+        while j < stop:
+            yield j
+            j = end[j]
+
+    def subtree_size(self, i):
+        """Number of nodes under node i, excluding i itself. O(1)."""
+        return self.end[i] - i - 1
+
+    def count(self, i, tag_name):
+        """Number of `tag_name` nodes under node i. O(subtree), run in C over the tag column."""
+        code = self._tag_codes.get(tag_name)
+        if code is None:
+            return 0
+        return self.tag.count(code, i + 1, self.end[i])
+
+    def variant_count(self, i):
+        """Number of variant (<symbol>) nodes nested anywhere under node i. O(1)."""
+        prefix = self._variant_prefix
+        if prefix is None:
+            code = self._tag_codes.get(VARIANT_TAG, -1)
+            prefix = self._variant_prefix = array('i', accumulate((t == code for t in self.tag), initial=0))
+        return prefix[self.end[i]] - prefix[i + 1]
+
+    def path(self, i):
+        """Names from the root down to node i, joined with ' / '."""
+        return ' / '.join(self.names[a] for a in reversed([i, *self.ancestors(i)]))
+
+    def memory_bytes(self):
+        """Approximate footprint of the numeric columns (excludes id/name strings)."""
+        return sum(col.itemsize * len(col) for col in (self.parent, self.depth, self.end)) + len(self.tag)
+
+
+def main(argv):
+    from parse_inventory import iter_lines
+
+    if not argv:
+        print(__doc__)
+        return 1
+    index = NodeIndex.from_lines(iter_lines(argv[0]))
+    max_depth = max(index.depth, default=0)
+    print(f'{len(index):,} nodes, max depth {max_depth}, '
+          f'{index.memory_bytes() / 1e6:.1f} MB of tree columns')
+    for node_id in argv[1:]:
+        i = index.find(node_id)
+        if i < 0:
+            print(f'  {node_id}: not found')
+            continue
+        print(f'  {node_id}  {index.path(i)}')
+        print(f'    {index.subtree_size(i):,} descendants, {index.variant_count(i):,} nested variants, '
+              f'{len(list(index.children(i)))} children')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
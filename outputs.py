@@ -0,0 +1,64 @@
+"""Write-if-changed output for the generators.
+
+A generated file is compared with the copy already on disk and replaced,
+atomically, only when its bytes differ. Unchanged files keep their mtime,
+so a deploy uploads (and the CDN purges) only the pages that really changed.
+"""
+import hashlib, os
+
+
+def file_digest(path, h=None):
+    """`h` (a new hashlib object, blake2b by default) fed the contents of `path` in 1 MB chunks.
+
+    hashlib.file_digest does the same from Python 3.11 on.
+    """
+    h = h or hashlib.blake2b()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h
+
+
+def _digest(path):
+    return file_digest(path).digest()
+
+
+def _same_file(a, b):
+    try:
+        if os.path.getsize(a) != os.path.getsize(b):
+            return False
+    except FileNotFoundError:
+        return False
+    return _digest(a) == _digest(b)
+
+
+def write_if_changed(path, text):
+    """Write `text` (str or bytes) to `path` unless it already holds exactly that. Returns True if the file was written."""
+    data = text if isinstance(text, bytes) else text.encode()
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def replace_if_changed(tmp, path):
+    """Move the finished file `tmp` over `path`, or discard it if `path` already matches. Returns True if replaced."""
+    if _same_file(tmp, path):
+        os.remove(tmp)
+        return False
+    os.replace(tmp, path)
+    return True
+
+
+def summary(changed):
+    """'3 changed, 15 unchanged' for a list of write_if_changed results."""
+    n = sum(changed)
+    return f'{n} changed, {len(changed) - n} unchanged'
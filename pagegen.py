@@ -0,0 +1,56 @@
+"""Shared render-and-write loop for the detail page generators.
+
+build_detail_pages.py, build_detail_pages_batch2.py and build_screen_pages.py
+each define a list of page dicts (with a 'slug') and a render function; this
+module writes them out, serially or across a process pool, with their
+critical CSS inlined (see critical_css.py).
+"""
+import argparse, multiprocessing, os, time
+from functools import partial
+
+import buildtrace, critical_css
+from outputs import write_if_changed
+
+
+def _write_page(render, out_dir, item):
+    with buildtrace.span('render', items=1, page=item['slug']):
+        html = critical_css.apply(render(item))
+    with buildtrace.span('write', page=item['slug']) as s:
+        changed = write_if_changed(os.path.join(out_dir, f'{item["slug"]}.html'), html)
+        s.add(items=changed, bytes=len(html.encode()) if changed else 0)
+    return len(html), changed
+
+
+def write_pages(items, render, out_dir, jobs=1):
+    """Render each item to out_dir/<slug>.html. Returns ([(size, changed), ...], seconds).
+
+    Files whose content is unchanged are left untouched (see outputs.py).
+    With jobs > 1 pages are rendered and written by worker processes. Each
+    page is its own file and results come back in input order, so the output
+    and the printed log are the same for any job count.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    work = partial(_write_page, render, out_dir)
+    t0 = time.perf_counter()
+    if jobs > 1 and len(items) > 1:
+        with multiprocessing.Pool(min(jobs, len(items))) as pool:
+            results = pool.map(work, items, chunksize=max(1, len(items) // (jobs * 4)))
+    else:
+        results = [work(item) for item in items]
+    return results, time.perf_counter() - t0
+
+
+def rate(pages, seconds, jobs):
+    """One-line throughput report, e.g. '18 pages in 0.04s (450 pages/sec, 1 job)'."""
+    return (f'{pages} pages in {seconds:.2f}s ({pages / max(seconds, 1e-9):,.0f} pages/sec, '
+            f'{jobs} job{"s" if jobs != 1 else ""})')
+
+
+def parse_args(description, argv=None):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='worker processes rendering pages (default: %(default)s)')
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    return args
@@ -1,162 +1,592 @@
 #!/usr/bin/env python3
 """Parse Figma metadata to generate component inventory."""
-import json, sys, re
-
-# Read the metadata file
-with open(sys.argv[1]) as f:
-    data = json.load(f)
-
-text = data[0]['text']
-lines = text.split('\n')
-
-# Extract top-level elements
-components = []
-for line in lines:
-    stripped = line.lstrip()
-    indent = len(line) - len(stripped)
-    if indent == 2:
-        if stripped.startswith('<frame') or stripped.startswith('<symbol'):
-            name_match = re.search(r'name="([^"]+)"', stripped)
-            id_match = re.search(r'id="([^"]+)"', stripped)
-            type_match = re.search(r'^<(\w+)', stripped)
-            if name_match and id_match:
-                components.append({
-                    'name': name_match.group(1),
-                    'id': id_match.group(1),
-                    'type': type_match.group(1),
-                    'self_closing': stripped.rstrip().endswith('/>')
-                })
-
-# Count child symbols for frames
-frame_children = {}
-current_frame = None
-count = 0
-
-for line in lines:
-    stripped = line.lstrip()
-    indent = len(line) - len(stripped)
-
-    if indent == 2:
-        if current_frame:
-            frame_children[current_frame] = count
-        if stripped.startswith('<frame') and not stripped.rstrip().endswith('/>'):
-            id_m = re.search(r'id="([^"]+)"', stripped)
-            current_frame = id_m.group(1) if id_m else None
-            count = 0
+import argparse, hashlib, io, json, multiprocessing, os, re, sys
+from functools import partial
+
+import buildtrace
+
+CHUNK_SIZE = 1 << 20
+CACHE_VERSION = 1
+
+# Top-level component tags (indent 2) and counted child tags (indent 4)
+_TOP_LEVEL_TAGS = ('  <frame', '  <symbol')
+_CHILD_TAGS = ('    <symbol', '    <instance', '    <frame')
+_TAG = re.compile(r'<(\w+)')
+_ATTR = re.compile(r'\b(id|name)="([^"]*)"')
+
+# Body of a JSON string up to its closing quote (possessive where supported, so no backtracking
+# state; the alternatives never overlap, so the plain pattern matches the same text)
+_STRING_BODY = re.compile(r'[^"\\]*+(?:\\.[^"\\]*+)*+' if sys.version_info >= (3, 11) else r'[^"\\]*(?:\\.[^"\\]*)*',
+                          re.S)
+_STRING_BODY_BYTES = re.compile(_STRING_BODY.pattern.encode(), re.S)
+
+
+def load_lines(path, page=0):
+    """Read the whole export into memory and return a page's metadata text as a list of lines."""
+    with open(path) as f:
+        data = json.load(f)
+    return data[page]['text'].split('\n')
+
+
+def _safe_escape_cut(raw):
+    """Return the length of the prefix of `raw` that can be JSON-decoded on its own.
+
+    A chunk may end in the middle of an escape (`\\`, `\\u00`) or right after the
+    high half of a surrogate pair; both are held back for the next chunk.
+    """
+    cut = len(raw)
+    while True:
+        i = raw.rfind('\\', max(0, cut - 6), cut)
+        if i < 0:
+            return cut
+        # An odd run of backslashes before i means raw[i] is itself escaped
+        j = i
+        while j > 0 and raw[j - 1] == '\\':
+            j -= 1
+        if (i - j) % 2:
+            return cut
+        tail = raw[i:cut]
+        if len(tail) < 2 or (tail[1] == 'u' and len(tail) < 6):
+            cut = i
+        elif tail[1] == 'u' and len(tail) == 6 and 0xD800 <= int(tail[2:], 16) <= 0xDBFF:
+            cut = i
         else:
-            current_frame = None
-            count = 0
-    elif indent == 4 and current_frame:
-        if stripped.startswith('<symbol') or stripped.startswith('<instance') or stripped.startswith('<frame'):
-            count += 1
+            return cut
+
+
+def locate_pages(path, chunk_size=CHUNK_SIZE):
+    """Yield (page, offset) for each page of an export that has a "text" field.
+
+    `page` is the page's position in the top-level array and `offset` the byte
+    offset just past the opening quote of its "text" value. The raw bytes are
+    scanned once; string contents are skipped without being decoded or held in
+    memory, so this is cheap even for very large exports.
+    """
+    with open(path, 'rb') as f:
+        buf = f.read(chunk_size)
+        base = pos = 0
+        depth = 0
+        page = -1
+        key = None
+        after_colon = False
+        while True:
+            if pos >= len(buf):
+                base += len(buf)
+                buf = f.read(chunk_size)
+                pos = 0
+                if not buf:
+                    return
+            ch = buf[pos]
+            if ch == 0x22:  # '"'
+                if depth == 2 and after_colon and key == b'text':
+                    yield page, base + pos + 1
+                # Skip the string, keeping only the first few bytes for key checks
+                pos += 1
+                head, size = b'', 0
+                while True:
+                    end = _STRING_BODY_BYTES.match(buf, pos).end()
+                    if len(head) < 8:
+                        head += buf[pos:min(end, pos + 8)]
+                    size += end - pos
+                    if end < len(buf) and buf[end] == 0x22:
+                        pos = end + 1
+                        break
+                    # Keep a trailing backslash so its escape pairs up with the next chunk
+                    base += end
+                    more = f.read(chunk_size)
+                    if not more:
+                        raise ValueError(f'{path}: unterminated string')
+                    buf = buf[end:] + more
+                    pos = 0
+                if not after_colon:
+                    key = head if size == len(head) else None
+                after_colon = False
+                continue
+            if ch in b'[{':
+                depth += 1
+                if depth == 2 and ch == 0x7b:  # '{'
+                    page += 1
+                after_colon = False
+            elif ch in b']}':
+                depth -= 1
+            elif ch == 0x3a:  # ':'
+                after_colon = True
+            elif ch == 0x2c:  # ','
+                key = None
+                after_colon = False
+            pos += 1
+
 
-if current_frame:
-    frame_children[current_frame] = count
+def iter_lines(path, offset=None, chunk_size=CHUNK_SIZE):
+    """Stream the metadata text of one page of an export, one line at a time.
 
-# Categorize
-def categorize(name):
-    n = name.lower()
+    `offset` comes from locate_pages(); by default the first page is read.
+    Only the current chunk and the current partial line are held in memory, so
+    peak memory stays flat regardless of export size. Yields the same lines as
+    load_lines().
+    """
+    if offset is None:
+        offset = next(locate_pages(path, chunk_size), (None, None))[1]
+        if offset is None:
+            raise ValueError(f'{path}: no page with a "text" field')
+    raw = open(path, 'rb')
+    raw.seek(offset)
+    with io.TextIOWrapper(raw, encoding='utf-8') as f:
+        buf = f.read(chunk_size)
+        pos = 0
 
+        def refill():
+            nonlocal buf, pos
+            more = f.read(chunk_size)
+            buf = buf[pos:] + more
+            pos = 0
+            return bool(more)
+
+        # Decode the string value incrementally and split it into lines
+        partial = ''
+        while True:
+            end = _STRING_BODY.match(buf, pos).end()
+            done = end < len(buf) and buf[end] == '"'
+            raw = buf[pos:end] if done else buf[pos:pos + _safe_escape_cut(buf[pos:])]
+            pos += len(raw)
+            text = partial + (json.loads(f'"{raw}"') if '\\' in raw else raw)
+            parts = text.split('\n')
+            partial = parts.pop()
+            yield from parts
+            if done:
+                yield partial
+                return
+            if not refill():
+                raise ValueError(f'{path}: unterminated "text" field')
+
+
+# Category rules in priority order: a name takes the category of the first
+# keyword (in this order) it contains.
+CATEGORY_RULES = [
     # Icons first (most specific)
-    icon_kw = ['.↪️ icon', 'icon/', 'icon ', 'direction/', 'system/', 'action/', 'objects/', 'maps/',
+    ('Icons', ['.↪️ icon', 'icon/', 'icon ', 'direction/', 'system/', 'action/', 'objects/', 'maps/',
                'preference/', 'education/', 'like/', 'calendar/', 'syringe/', 'clock/', 'team/',
                'location/', 'check /', 'remix-icons', 'arrow', 'caret', 'pencil', 'download',
-               'confetti', 'mappin', 'warningcircle', 'plus']
-    for kw in icon_kw:
-        if kw in n:
-            return 'Icons'
-
-    # Brand/Logos
-    brand_kw = ['logo', 'brand', 'product logo', 'alle ', '_primary options', '_secondary options',
-                '_seal options', '_logo options', '_logotype options', '_emblem options', '_monogram options',
-                '_brand options', '_indication options', '_default options', 'latisse']
-    for kw in brand_kw:
-        if kw in n:
-            return 'Brand / Logos'
-
-    # Navigation
-    nav_kw = ['nav', 'tab', 'link', 'menu', 'breadcrumb', 'pagination', 'header button', 'footer',
-              'sidebar', 'drawer', 'top bar', 'bottom sheet']
-    for kw in nav_kw:
-        if kw in n:
-            return 'Navigation'
-
-    # Feedback
-    fb_kw = ['alert', 'tooltip', 'snackbar', 'modal', 'dialog', 'toast', 'banner', 'annotation']
-    for kw in fb_kw:
-        if kw in n:
-            return 'Feedback'
-
-    # Form Controls
-    form_kw = ['button', 'input', 'select', 'checkbox', 'toggle', 'chip', 'accordion', 'dropdown',
-               'radio', 'counter badge', 'counter filter', 'search', 'filter', 'validate',
-               'text input', 'text button', 'header button', 'button group', 'cta']
-    for kw in form_kw:
-        if kw in n:
-            return 'Form Controls'
-
-    # Data Display
-    dd_kw = ['card', 'badge', 'tag', 'avatar', 'progress', 'medal', 'stamp', 'status',
-             'indicator', 'count', 'title']
-    for kw in dd_kw:
-        if kw in n:
-            return 'Data Display'
-
-    # Media
-    med_kw = ['image', 'video', 'placeholder', 'carousel']
-    for kw in med_kw:
-        if kw in n:
-            return 'Media'
-
-    # Layout
-    lay_kw = ['container', 'spacer', 'slot', 'view port', 'section', 'responsive', 'grid',
-              'xlarge', 'small', 'medium', 'large', 'marketing', 'isi', 'training center',
-              'training portal', 'live events']
-    for kw in lay_kw:
-        if kw in n:
-            return 'Layout'
-
-    return 'Other'
-
-# Build categorized output
-cats = {}
-for c in components:
-    cat = categorize(c['name'])
-    if cat not in cats:
-        cats[cat] = []
-    variants = frame_children.get(c['id'], 0)
-    c['variants'] = variants
-    cats[cat].append(c)
-
-# Print summary
-print("COMPONENT INVENTORY SUMMARY")
-print("=" * 60)
-total = 0
-for cat in ['Form Controls', 'Navigation', 'Data Display', 'Feedback', 'Layout', 'Media', 'Icons', 'Brand / Logos', 'Other']:
-    items = cats.get(cat, [])
-    total += len(items)
-    print(f"  {cat}: {len(items)}")
-print(f"  TOTAL: {total}")
-
-# Print key components (non-icon, non-brand, non-layout)
-print("\n\nKEY COMPONENTS (Form Controls + Navigation + Data Display + Feedback)")
-print("=" * 60)
-for cat in ['Form Controls', 'Navigation', 'Data Display', 'Feedback']:
-    items = cats.get(cat, [])
-    print(f"\n--- {cat} ({len(items)}) ---")
-    for c in items:
-        v = f" [{c['variants']}v]" if c['variants'] > 0 else ""
-        print(f"  {c['id']:>20}  {c['name']}{v}")
-
-# Output JSON for HTML generation
-output = {
-    'categories': {},
-    'totals': {}
-}
-for cat, items in cats.items():
-    output['categories'][cat] = [{'name': c['name'], 'id': c['id'], 'type': c['type'], 'variants': c['variants']} for c in items]
-    output['totals'][cat] = len(items)
-
-with open('/tmp/ami_inventory.json', 'w') as f:
-    json.dump(output, f, indent=2)
-print("\n\nJSON saved to /tmp/ami_inventory.json")
+               'confetti', 'mappin', 'warningcircle', 'plus']),
+    ('Brand / Logos', ['logo', 'brand', 'product logo', 'alle ', '_primary options', '_secondary options',
+                       '_seal options', '_logo options', '_logotype options', '_emblem options', '_monogram options',
+                       '_brand options', '_indication options', '_default options', 'latisse']),
+    ('Navigation', ['nav', 'tab', 'link', 'menu', 'breadcrumb', 'pagination', 'header button', 'footer',
+                    'sidebar', 'drawer', 'top bar', 'bottom sheet']),
+    ('Feedback', ['alert', 'tooltip', 'snackbar', 'modal', 'dialog', 'toast', 'banner', 'annotation']),
+    ('Form Controls', ['button', 'input', 'select', 'checkbox', 'toggle', 'chip', 'accordion', 'dropdown',
+                       'radio', 'counter badge', 'counter filter', 'search', 'filter', 'validate',
+                       'text input', 'text button', 'header button', 'button group', 'cta']),
+    ('Data Display', ['card', 'badge', 'tag', 'avatar', 'progress', 'medal', 'stamp', 'status',
+                      'indicator', 'count', 'title']),
+    ('Media', ['image', 'video', 'placeholder', 'carousel']),
+    ('Layout', ['container', 'spacer', 'slot', 'view port', 'section', 'responsive', 'grid',
+                'xlarge', 'small', 'medium', 'large', 'marketing', 'isi', 'training center',
+                'training portal', 'live events']),
+]
+
+
+class Categorizer:
+    """CATEGORY_RULES compiled into one Aho-Corasick automaton.
+
+    Every keyword gets a rank from its position in CATEGORY_RULES. A single
+    scan of the lowercased name finds the lowest-ranked keyword it contains,
+    which is exactly the keyword the ordered rule lists would have hit first.
+    """
+
+    def __init__(self, rules):
+        self.rules = [(cat, kw) for cat, kws in rules for kw in kws]
+        # Output rank per state; len(rules) means no keyword ends here
+        none = len(self.rules)
+        goto, fail, out = [{}], [0], [none]
+        for rank, (cat, kw) in enumerate(self.rules):
+            state = 0
+            for ch in kw:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = goto[state][ch] = len(goto)
+                    goto.append({})
+                    fail.append(0)
+                    out.append(none)
+                state = nxt
+            out[state] = min(out[state], rank)
+
+        # Breadth-first: fill failure links, inherit matches from them and
+        # flatten goto + fail into a full transition table.
+        delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = list(goto[0].values())
+        for state in queue:
+            f = fail[state]
+            out[state] = min(out[state], out[f])
+            delta[state] = {**delta[f], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[f].get(ch, 0)
+                queue.append(nxt)
+        self._delta = delta
+        self._out = out
+
+    def match(self, name):
+        """Rank of the first rule keyword contained in `name`, or None."""
+        delta, out = self._delta, self._out
+        state = 0
+        best = none = len(self.rules)
+        for ch in name.lower():
+            state = delta[state].get(ch, 0)
+            if out[state] < best:
+                best = out[state]
+                if not best:
+                    break
+        return None if best == none else best
+
+    def __call__(self, name):
+        rank = self.match(name)
+        return 'Other' if rank is None else self.rules[rank][0]
+
+    def categorize_many(self, names):
+        """Categorize an iterable of names.
+
+        Returns (categories, hits) where hits maps each (category, keyword)
+        rule to the number of names it decided, including rules that never fired.
+        """
+        hits = dict.fromkeys(self.rules, 0)
+        cats = []
+        for name in names:
+            rank = self.match(name)
+            if rank is None:
+                cats.append('Other')
+            else:
+                rule = self.rules[rank]
+                hits[rule] += 1
+                cats.append(rule[0])
+        return cats, hits
+
+
+categorize = Categorizer(CATEGORY_RULES)
+
+
+def scan_block(lines):
+    """Scan a run of page lines without resolving variant counts.
+
+    Returns (entries, frame_children): entries is a list of (category,
+    component) pairs in document order, frame_children maps frame ids to the
+    number of child symbols/instances/frames counted under them.
+    """
+    entries = []
+    frame_children = {}
+    current_frame = None
+    count = 0
+
+    for line in lines:
+        if line[2:3] == ' ':
+            # Indent 3+: only direct children of an open frame are counted
+            if current_frame and line.startswith(_CHILD_TAGS):
+                count += 1
+        elif line[:2] == '  ':
+            if current_frame:
+                frame_children[current_frame] = count
+            current_frame = None
+            count = 0
+            if line.startswith(_TOP_LEVEL_TAGS):
+                attrs = dict(reversed(_ATTR.findall(line)))
+                self_closing = line.rstrip().endswith('/>')
+                if not self_closing and line.startswith('  <frame'):
+                    current_frame = attrs.get('id') or None
+                if attrs.get('name') and attrs.get('id'):
+                    c = {
+                        'name': attrs['name'],
+                        'id': attrs['id'],
+                        'type': _TAG.match(line, 2).group(1),
+                        'self_closing': self_closing
+                    }
+                    entries.append((categorize(c['name']), c))
+
+    if current_frame:
+        frame_children[current_frame] = count
+    return entries, frame_children
+
+
+def group_blocks(blocks):
+    """Merge scan_block() results, in page order, into components grouped by category.
+
+    Each component gets a 'variants' count; a later frame with the same id
+    overrides an earlier one, as it would in a single scan.
+    """
+    cats = {}
+    components = []
+    frame_children = {}
+    for entries, children in blocks:
+        for cat, c in entries:
+            components.append(c)
+            if cat not in cats:
+                cats[cat] = []
+            cats[cat].append(c)
+        frame_children.update(children)
+    for c in components:
+        c['variants'] = frame_children.get(c['id'], 0)
+    return cats
+
+
+def scan_page(lines):
+    """Walk a page once, collecting top-level components, their child counts and categories.
+
+    Top-level elements sit at indent 2 and their direct children at indent 4;
+    exports indent with two spaces per level. Returns the components grouped
+    by category, each with a 'variants' count of child symbols/instances/frames.
+    """
+    return group_blocks([scan_block(lines)])
+
+
+def iter_blocks(lines):
+    """Split page lines into top-level subtrees, each starting at an indent-2 line.
+
+    Closing tags stay with the subtree they close. Lines before the first
+    top-level element (the page's own tag) form the first block.
+    """
+    block = []
+    for line in lines:
+        if line[:2] == '  ' and line[2:3] != ' ' and not line.startswith('  </') and block:
+            yield block
+            block = []
+        block.append(line)
+    if block:
+        yield block
+
+
+def _rules_fingerprint():
+    return hashlib.blake2b(json.dumps(CATEGORY_RULES).encode(), digest_size=8).hexdigest()
+
+
+def scan_page_cached(lines, cache_path, deep=False):
+    """scan_page() with a persistent cache keyed by a content hash of each top-level subtree.
+
+    Unchanged subtrees reuse their cached scan (and nested variant counts when
+    `deep` is set); only new or edited ones are re-scanned and re-categorized.
+    The cache is rewritten with just the subtrees seen in this run, and is
+    discarded wholesale if CATEGORY_RULES change.
+
+    Returns (cats, reused, recomputed).
+    """
+    rules = _rules_fingerprint()
+    cached = {}
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+        if data.get('version') == CACHE_VERSION and data.get('rules') == rules:
+            cached = data['blocks']
+    except (OSError, ValueError):
+        pass
+
+    seen = {}
+    blocks = []
+    nested = {}
+    reused = recomputed = 0
+    for block in iter_blocks(lines):
+        key = hashlib.blake2b('\n'.join(block).encode(), digest_size=16).hexdigest()
+        entry = seen.get(key) or cached.get(key)
+        if entry is None or (deep and 'nested' not in entry):
+            entries, children = scan_block(block)
+            entry = {'components': entries, 'children': children}
+            if deep:
+                from node_index import NodeIndex
+
+                index = NodeIndex.from_lines(block)
+                entry['nested'] = {}
+                for _, c in entries:
+                    i = index.find(c['id'])
+                    entry['nested'][c['id']] = index.variant_count(i) if i >= 0 else 0
+            recomputed += 1
+        else:
+            reused += 1
+        seen[key] = entry
+        # Copy so variant counts set while grouping don't leak into the cache
+        blocks.append(([(cat, dict(c)) for cat, c in entry['components']], entry['children']))
+        if deep:
+            nested.update(entry['nested'])
+
+    cats = group_blocks(blocks)
+    if deep:
+        for items in cats.values():
+            for c in items:
+                c['nested_variants'] = nested.get(c['id'], 0)
+
+    if recomputed or len(seen) != len(cached):
+        # json.dumps uses the C encoder; json.dump to a file does not
+        tmp = f'{cache_path}.tmp'
+        with open(tmp, 'w') as f:
+            f.write(json.dumps({'version': CACHE_VERSION, 'rules': rules, 'blocks': seen}))
+        os.replace(tmp, cache_path)
+    return cats, reused, recomputed
+
+
+def attach_nested_variants(cats, lines):
+    """Index every node of a page and record each component's nested variant count."""
+    from node_index import NodeIndex
+
+    index = NodeIndex.from_lines(lines)
+    for items in cats.values():
+        for c in items:
+            i = index.find(c['id'])
+            c['nested_variants'] = index.variant_count(i) if i >= 0 else 0
+
+
+def page_shards(exports, all_pages=False):
+    """Yield a (path, page, offset) shard for the first page, or every page, of each export."""
+    for path in exports:
+        for page, offset in locate_pages(path):
+            yield path, page, offset
+            if not all_pages:
+                break
+
+
+def scan_shard(shard, deep=False):
+    """Stream and scan one page of one export. Runs in a worker process."""
+    path, page, offset = shard
+    # Categorizing happens inside the scan, so both share one span
+    with buildtrace.span('parse+categorize', export=os.path.basename(path), page=page) as s:
+        cats = scan_page(iter_lines(path, offset))
+        s.add(items=sum(map(len, cats.values())))
+    if deep:
+        with buildtrace.span('nested variants', page=page):
+            attach_nested_variants(cats, iter_lines(path, offset))
+    return cats
+
+
+def scan_shards(shards, jobs, deep=False):
+    """Scan shards across a process pool and merge them in shard order.
+
+    Pages are merged in the order given, so output does not depend on which
+    worker finishes first. A node id already seen in an earlier shard is
+    dropped. Returns (cats, pages, duplicates).
+    """
+    merged = {}
+    seen = set()
+    pages = duplicates = 0
+    with multiprocessing.Pool(jobs) as pool:
+        for cats in pool.imap(partial(scan_shard, deep=deep), shards):
+            pages += 1
+            page_ids = set()
+            for cat, items in cats.items():
+                for c in items:
+                    if c['id'] in seen:
+                        duplicates += 1
+                        continue
+                    page_ids.add(c['id'])
+                    merged.setdefault(cat, []).append(c)
+            seen |= page_ids
+    return merged, pages, duplicates
+
+
+def print_summary(cats):
+    print("COMPONENT INVENTORY SUMMARY")
+    print("=" * 60)
+    total = 0
+    for cat in ['Form Controls', 'Navigation', 'Data Display', 'Feedback', 'Layout', 'Media', 'Icons', 'Brand / Logos', 'Other']:
+        items = cats.get(cat, [])
+        total += len(items)
+        print(f"  {cat}: {len(items)}")
+    print(f"  TOTAL: {total}")
+
+    # Print key components (non-icon, non-brand, non-layout)
+    print("\n\nKEY COMPONENTS (Form Controls + Navigation + Data Display + Feedback)")
+    print("=" * 60)
+    for cat in ['Form Controls', 'Navigation', 'Data Display', 'Feedback']:
+        items = cats.get(cat, [])
+        print(f"\n--- {cat} ({len(items)}) ---")
+        for c in items:
+            v = f" [{c['variants']}v]" if c['variants'] > 0 else ""
+            print(f"  {c['id']:>20}  {c['name']}{v}")
+
+
+def inventory_json(cats):
+    """Shape categorized components into the JSON consumed by build_components.py."""
+    output = {
+        'categories': {},
+        'totals': {}
+    }
+    for cat, items in cats.items():
+        output['categories'][cat] = [{'name': c['name'], 'id': c['id'], 'type': c['type'], 'variants': c['variants']} for c in items]
+        for entry, c in zip(output['categories'][cat], items):
+            if 'nested_variants' in c:
+                entry['nested_variants'] = c['nested_variants']
+        output['totals'][cat] = len(items)
+    return output
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('exports', nargs='+', metavar='export', help='Figma metadata export (JSON)')
+    parser.add_argument('--stream', action='store_true',
+                        help='decode the export incrementally with constant memory')
+    parser.add_argument('-o', '--output', default='/tmp/ami_inventory.json',
+                        help='inventory JSON path (default: %(default)s)')
+    parser.add_argument('--all-pages', action='store_true',
+                        help='inventory every page of each export, not just the first')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='worker processes for multi-page/multi-file runs (default: %(default)s)')
+    parser.add_argument('--deep', action='store_true',
+                        help='index every node and record nested variants per component')
+    parser.add_argument('--cache', metavar='PATH',
+                        help='reuse results for unchanged top-level frames from this cache file')
+    parser.add_argument('--db', metavar='PATH',
+                        help='also write an indexed SQLite store (query it with inventory_db.py)')
+    parser.add_argument('--rule-hits', action='store_true',
+                        help='print how many components each category keyword decided')
+    parser.add_argument('-q', '--quiet', action='store_true', help='skip the printed summary')
+    args = parser.parse_args(argv)
+    args.sharded = len(args.exports) > 1 or args.all_pages or args.jobs > 1
+    if args.sharded and args.cache:
+        parser.error('--cache only works for a single page; drop --all-pages, --jobs and extra exports')
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.sharded:
+        shards = list(page_shards(args.exports, args.all_pages))
+        cats, pages, duplicates = scan_shards(shards, args.jobs, deep=args.deep)
+    else:
+        # Read the metadata file
+        export = args.exports[0]
+        lines = iter_lines(export) if args.stream else load_lines(export)
+        with buildtrace.span('parse+categorize', export=os.path.basename(export)) as s:
+            if args.cache:
+                cats, reused, recomputed = scan_page_cached(lines, args.cache, deep=args.deep)
+            else:
+                cats = scan_page(lines)
+            s.add(items=sum(map(len, cats.values())))
+        if args.deep and not args.cache:
+            with buildtrace.span('nested variants'):
+                attach_nested_variants(cats, iter_lines(export) if args.stream else lines)
+
+    if not args.quiet:
+        print_summary(cats)
+
+    if args.rule_hits:
+        _, hits = categorize.categorize_many(c['name'] for items in cats.values() for c in items)
+        print("\n\nCATEGORY RULE HITS")
+        print("=" * 60)
+        for (cat, kw), n in hits.items():
+            print(f"  {n:>8}  {cat:<14} {kw!r}")
+
+    with buildtrace.span('write', items=sum(map(len, cats.values()))) as s:
+        with open(args.output, 'w') as f:
+            json.dump(inventory_json(cats), f, indent=2)
+        s.add(bytes=os.path.getsize(args.output))
+    print(f"\n\nJSON saved to {args.output}")
+    if args.db:
+        import inventory_db
+
+        with buildtrace.span('write db') as s:
+            inventory_db.write(cats, args.db)
+            s.add(bytes=os.path.getsize(args.db))
+        print(f"SQLite store saved to {args.db}")
+    if args.sharded:
+        print(f"Scanned {pages} pages from {len(args.exports)} files with {args.jobs} workers; "
+              f"{duplicates} duplicate node IDs dropped")
+    if args.cache:
+        print(f"Cache: {reused} frames reused, {recomputed} recomputed ({args.cache})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+/* Search box over the trigram index written by search_index.py.
+ *
+ * Nothing is fetched until the first keystroke. A query then loads the gram
+ * shards of its own trigrams, intersects their posting lists, loads the doc
+ * shards of the candidates and keeps the documents that really contain every
+ * query word. Shard counts and the gram hash must match search_index.py.
+ * Shards are fetched with the ?v= from version.json, loaded once per page,
+ * so a page never mixes shards of two builds.
+ */
+(function () {
+  'use strict';
+
+  var GRAM_SHARDS = 8, DOC_SHARDS = 4, MIN_TERM = 3, MAX_RESULTS = 12;
+  var shards = {}, versions = {};
+
+  // As search_index.normalize
+  function normalize(text) {
+    return text.toLowerCase().split(/\s+/).filter(Boolean).join(' ');
+  }
+
+  // As search_index.gram_shard
+  function gramShard(gram) {
+    var h = 0, cps = Array.from(gram);
+    for (var i = 0; i < cps.length; i++) h = (Math.imul(h, 31) + cps[i].codePointAt(0)) >>> 0;
+    return h % GRAM_SHARDS;
+  }
+
+  function trigrams(term) {
+    var cps = Array.from(term), grams = [];
+    for (var i = 0; i + 3 <= cps.length; i++) grams.push(cps.slice(i, i + 3).join(''));
+    return grams;
+  }
+
+  function fetchJSON(url) {
+    return fetch(url).then(function (r) {
+      if (!r.ok) throw new Error(url + ': ' + r.status);
+      return r.json();
+    });
+  }
+
+  function version(base) {
+    if (!versions[base]) {
+      versions[base] = fetchJSON(base + 'version.json').then(function (d) { return d.v; });
+      versions[base].catch(function () { delete versions[base]; });
+    }
+    return versions[base];
+  }
+
+  function load(base, name) {
+    if (!shards[name]) {
+      shards[name] = version(base).then(function (v) { return fetchJSON(base + name + '.json?v=' + v); });
+      shards[name].catch(function () { delete shards[name]; });
+    }
+    return shards[name];
+  }
+
+  function decode(deltas) {
+    var ids = [], id = 0;
+    for (var i = 0; i < deltas.length; i++) ids.push(id += deltas[i]);
+    return ids;
+  }
+
+  function intersect(a, b) {
+    var out = [], i = 0, j = 0;
+    while (i < a.length && j < b.length) {
+      if (a[i] < b[j]) i++;
+      else if (a[i] > b[j]) j++;
+      else { out.push(a[i]); i++; j++; }
+    }
+    return out;
+  }
+
+  // Resolves to [[title, subtitle, url], ...], best first
+  function search(base, query) {
+    var terms = normalize(query).split(' '), grams = {};
+    terms.forEach(function (t) {
+      if (t.length >= MIN_TERM) trigrams(t).forEach(function (g) { grams[g] = true; });
+    });
+    grams = Object.keys(grams);
+    if (!grams.length) return Promise.resolve([]);
+    return Promise.all(grams.map(function (g) { return load(base, 'g-' + gramShard(g)); })).then(function (gs) {
+      var postings = gs.map(function (shard, k) { return shard[grams[k]] || []; });
+      postings.sort(function (a, b) { return a.length - b.length; });
+      return postings.reduce(function (ids, p) { return ids.length ? intersect(ids, decode(p)) : ids; },
+                             decode(postings[0]));
+    }).then(function (ids) {
+      return Promise.all(ids.map(function (id) {
+        return load(base, 'd-' + id % DOC_SHARDS).then(function (docs) { return docs[Math.floor(id / DOC_SHARDS)]; });
+      }));
+    }).then(function (docs) {
+      var q = normalize(query), hits = [];
+      docs.forEach(function (doc, order) {
+        if (!doc) return;
+        var text = normalize(doc[0] + ' ' + doc[1]);
+        if (!terms.every(function (t) { return text.indexOf(t) >= 0; })) return;
+        var title = normalize(doc[0]);
+        hits.push([title.indexOf(q) === 0 ? 0 : title.indexOf(q) >= 0 ? 1 : 2, order, doc]);
+      });
+      hits.sort(function (a, b) { return a[0] - b[0] || a[1] - b[1]; });
+      return hits.slice(0, MAX_RESULTS).map(function (h) { return h[2]; });
+    });
+  }
+
+  function SearchBox(el) {
+    var root = el.dataset.root || '', base = root + 'search/';
+    var input = el.querySelector('input'), list = el.querySelector('.search-results');
+    var seq = 0, active = -1;
+
+    function links() { return list.querySelectorAll('a'); }
+
+    function highlight(i) {
+      var as = links();
+      if (!as.length) return;
+      active = (i + as.length) % as.length;
+      for (var k = 0; k < as.length; k++) as[k].className = k === active ? 'active' : '';
+    }
+
+    function show(docs, query) {
+      list.textContent = '';
+      active = -1;
+      docs.forEach(function (doc) {
+        var a = document.createElement('a'), title = document.createElement('div'), detail = document.createElement('div');
+        a.href = root + doc[2];
+        title.className = 'title';
+        title.textContent = doc[0];
+        detail.className = 'detail';
+        detail.textContent = doc[1];
+        a.appendChild(title);
+        a.appendChild(detail);
+        list.appendChild(a);
+      });
+      if (!docs.length) {
+        var empty = document.createElement('div');
+        empty.className = 'empty';
+        empty.textContent = 'No matches for “' + query + '”';
+        list.appendChild(empty);
+      }
+      list.hidden = false;
+    }
+
+    input.addEventListener('input', function () {
+      var query = input.value, mine = ++seq;
+      if (normalize(query).length < MIN_TERM) { list.hidden = true; return; }
+      search(base, query).then(function (docs) {
+        if (mine === seq) show(docs, query);
+      }, function () {
+        if (mine === seq) list.hidden = true;
+      });
+    });
+
+    input.addEventListener('keydown', function (e) {
+      if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+        e.preventDefault();
+        highlight(active + (e.key === 'ArrowDown' ? 1 : -1));
+      } else if (e.key === 'Enter') {
+        var as = links();
+        if (as.length) window.location.href = as[Math.max(active, 0)].href;
+      } else if (e.key === 'Escape') {
+        input.value = '';
+        seq++;
+        list.hidden = true;
+      }
+    });
+
+    document.addEventListener('click', function (e) {
+      if (!el.contains(e.target)) list.hidden = true;
+    });
+  }
+
+  function init() {
+    var els = document.querySelectorAll('.site-search');
+    for (var i = 0; i < els.length; i++) new SearchBox(els[i]);
+  }
+
+  if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', init);
+  else init();
+})();
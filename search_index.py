@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Prebuilt trigram index for the site search box (search.js).
+
+Documents are component names with their node IDs and categories (the
+documented components, plus every inventory element when the inventory JSON
+is there), the token paths in token_data.json and the token names listed on
+tokens.html. Each is a [title, subtitle, url] triple; its search text is
+title and subtitle, lower-cased with whitespace collapsed. Documented
+components link to their detail page; other inventory elements to their
+category on inventory.html, which build_components.py writes from the same
+inventory, with a text directive for the row where the table is inline.
+
+The index maps every trigram of that text to the ids of the documents that
+contain it, delta-encoded. Grams are split across GRAM_SHARDS files by a
+31-multiplier string hash and documents across DOC_SHARDS files by id, so a
+query fetches only the shards its own trigrams and candidates fall in. Files
+go to search/g-<n>.json and search/d-<n>.json; search.js hard-codes both
+shard counts and the hash, so change them together.
+
+search/version.json holds a hash of all the shards. search.js fetches it
+first (it is revalidated on every visit) and then every shard with that
+?v=, so shards are cached as immutable and never mixed across deploys:
+posting lists only make sense with the doc shards they were built with.
+
+Usage: python search_index.py [--inventory /tmp/ami_inventory.json]
+"""
+import argparse, hashlib, html, json, os, re, sys
+from urllib.parse import quote
+
+import buildtrace, token_graph
+from fingerprint import HASH_LEN
+from layout import anchor
+from outputs import write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(ROOT, 'search')
+TOKENS_HTML = os.path.join(ROOT, 'tokens.html')
+VERSION_PATH = os.path.join(OUT_DIR, 'version.json')
+GRAM_SHARDS = 8
+DOC_SHARDS = 4
+
+_SECTION = re.compile(r'<div class="section" id="([^"]+)">')
+_SECTION_TITLE = re.compile(r'<h2 class="section-title">([^<]+)')
+# (name, value) pairs as tokens.html lays them out
+_TOKEN_ROWS = (
+    re.compile(r'<div class="color-name">(?P<name>[^<]+)</div><div class="color-value">(?P<value>[^<]+)<'),
+    re.compile(r'<div class="spacing-value">(?P<value>[^<]+)</div><div class="spacing-token">(?P<name>[^<]+)<'),
+    re.compile(r'<div class="legacy-token"><span class="name">(?P<name>[^<]+)</span><span class="val">(?P<value>[^<]+)<'),
+    re.compile(r'<span class="token-name">(?P<name>[^<]+)<'),
+)
+
+
+def normalize(text):
+    """Search text as search.js compares it: lower-cased, whitespace collapsed."""
+    return ' '.join(text.lower().split())
+
+
+def trigrams(text):
+    """Distinct trigrams of normalized `text`."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def gram_shard(gram):
+    """Shard of a trigram; search.js computes the same hash with Math.imul."""
+    h = 0
+    for ch in gram:
+        h = (h * 31 + ord(ch)) & 0xffffffff
+    return h % GRAM_SHARDS
+
+
+def text_fragment(text):
+    """`text` for a #:~:text= directive, with its reserved '-', '&' and ',' escaped."""
+    return quote(text, safe='').replace('-', '%2D')
+
+
+def documented_components():
+    """The components with detail pages: {node id: (name, slug, category)}."""
+    import build_detail_pages, build_detail_pages_batch2
+    return {c['node_id']: (c['name'], c['slug'], c['category'])
+            for module in (build_detail_pages, build_detail_pages_batch2) for c in module.components}
+
+
+def component_docs(inventory):
+    """One document per component: detail-page components first, then the rest of the inventory."""
+    documented = documented_components()
+    for nid, (name, slug, category) in documented.items():
+        yield [name, f'{nid} · {category}', f'components/{slug}.html']
+    if not inventory:
+        return
+    for category, items in inventory['categories'].items():
+        for item in items:
+            if item['id'] not in documented:
+                yield [item['name'], f'{item["id"]} · {category} · {item["type"]}',
+                       f'inventory.html#{anchor(category)}:~:text={text_fragment(item["id"])}']
+
+
+def token_path_docs(graph):
+    """One document per token path, linked to the detail page of a component that uses it."""
+    pages = {slug for _, slug, _ in documented_components().values()}
+    for path, comps in sorted(graph.paths.items()):
+        values = sorted({token_graph.display(v) for v in comps.values()})
+        linked = [c for c in sorted(comps) if c in pages]
+        url = (f'components/{linked[0]}.html#:~:text={text_fragment(path)}' if linked
+               else f'tokens.html#:~:text={text_fragment(path)}')
+        yield [path, f'{" / ".join(values)} · {", ".join(sorted(comps))}', url]
+
+
+def token_table_docs(text):
+    """One document per token name on tokens.html (and section), linked to its row."""
+    section = title = None
+    seen = set()
+    for line in text.splitlines():
+        m = _SECTION.search(line)
+        if m:
+            section, title = m[1], m[1]
+        m = _SECTION_TITLE.search(line)
+        if m:
+            title = html.unescape(m[1]).strip()
+        if section is None:
+            continue
+        for pattern in _TOKEN_ROWS:
+            for m in pattern.finditer(line):
+                name = html.unescape(m['name']).strip()
+                if (name, section) in seen:
+                    continue
+                seen.add((name, section))
+                value = m.groupdict().get('value')
+                subtitle = f'{title} · {html.unescape(value).strip()}' if value else title
+                yield [name, subtitle, f'tokens.html#{section}:~:text={text_fragment(name)}']
+
+
+def build_index(docs):
+    """(gram shards, doc shards): [{gram: delta-encoded doc ids}], [[doc, ...]]."""
+    postings = {}
+    for i, (title, subtitle, _) in enumerate(docs):
+        for gram in trigrams(normalize(f'{title} {subtitle}')):
+            postings.setdefault(gram, []).append(i)
+    grams = [{} for _ in range(GRAM_SHARDS)]
+    for gram, ids in sorted(postings.items()):
+        grams[gram_shard(gram)][gram] = [b - a for a, b in zip([0] + ids, ids)]
+    return grams, [docs[k::DOC_SHARDS] for k in range(DOC_SHARDS)]
+
+
+def write(grams, doc_shards):
+    """Write every shard, then version.json. Returns the total size in bytes and how many files changed."""
+    os.makedirs(OUT_DIR, exist_ok=True)
+    size = changed = 0
+    h = hashlib.blake2b(digest_size=16)
+    for prefix, shards in (('g', grams), ('d', doc_shards)):
+        for n, shard in enumerate(shards):
+            text = json.dumps(shard, ensure_ascii=False, separators=(',', ':'))
+            changed += write_if_changed(os.path.join(OUT_DIR, f'{prefix}-{n}.json'), text)
+            size += len(text.encode())
+            h.update(text.encode())
+    changed += write_if_changed(VERSION_PATH, json.dumps({'v': h.hexdigest()[:HASH_LEN]}) + '\n')
+    return size, changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--inventory', default='/tmp/ami_inventory.json',
+                        help='inventory JSON; documented components only if missing (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.inventory) as f:
+            inventory = json.load(f)
+    except FileNotFoundError:
+        print(f'{args.inventory} not found, indexing documented components only')
+        inventory = None
+    with open(TOKENS_HTML) as f:
+        tokens_html = f.read()
+
+    with buildtrace.span('collect') as s:
+        parts = (('components', list(component_docs(inventory))),
+                 ('token paths', list(token_path_docs(token_graph.graph()))),
+                 ('tokens.html names', list(token_table_docs(tokens_html))))
+        docs = [doc for _, part in parts for doc in part]
+        s.add(items=len(docs))
+    with buildtrace.span('index', items=len(docs)):
+        grams, doc_shards = build_index(docs)
+    with buildtrace.span('write') as s:
+        size, changed = write(grams, doc_shards)
+        s.add(items=changed, bytes=size)
+    print(', '.join(f'{len(part)} {label}' for label, part in parts))
+    print(f'{len(docs)} documents, {sum(map(len, grams))} trigrams in {GRAM_SHARDS} + {DOC_SHARDS} shards, '
+          f'{size / 1e3:.1f} KB ({changed} files changed)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+/* Deep-zoom viewer for the tile pyramids written by tiles.py.
+ *
+ * Each .tile-viewer element is a scrollable box. Only the tiles that intersect
+ * the visible area at the current zoom are requested; the coarsest level is
+ * kept underneath as a placeholder while finer tiles load.
+ */
+(function () {
+  'use strict';
+
+  // Coarsest level with at least one image pixel per device pixel at CSS zoom `scale` (see tiles.pick_level)
+  function pickLevel(scale, levels) {
+    var px = scale * (window.devicePixelRatio || 1), level = 0;
+    while (level < levels - 1 && px * Math.pow(2, level + 1) <= 1) level++;
+    return level;
+  }
+
+  function Viewer(el) {
+    var d = el.dataset;
+    this.el = el;
+    this.base = d.base;
+    this.width = +d.width;
+    this.height = +d.height;
+    this.tile = +d.tile;
+    this.levels = +d.levels;
+    this.format = d.format;
+    this.layers = {};
+    this.pending = false;
+
+    el.textContent = '';
+    this.canvas = document.createElement('div');
+    this.canvas.className = 'tile-canvas';
+    el.appendChild(this.canvas);
+    this.controls(el);
+    this.fit = el.clientWidth / this.width;
+    this.scale = Math.min(1, this.fit);
+    this.layout();
+    this.render();
+
+    var self = this;
+    el.addEventListener('scroll', function () { self.schedule(); }, { passive: true });
+    window.addEventListener('resize', function () {
+      self.fit = el.clientWidth / self.width;
+      self.schedule();
+    });
+    el.addEventListener('wheel', function (e) {
+      if (!e.ctrlKey && !e.metaKey) return;
+      e.preventDefault();
+      // offsetX/Y would be relative to the tile under the cursor, not the viewport
+      var r = el.getBoundingClientRect();
+      self.zoom(e.deltaY < 0 ? 1.25 : 0.8, e.clientX - r.left, e.clientY - r.top);
+    }, { passive: false });
+  }
+
+  Viewer.prototype.controls = function (el) {
+    var self = this, bar = document.createElement('div');
+    bar.className = 'tile-controls';
+    [['+', 2], ['−', 0.5], ['Fit', 0]].forEach(function (c) {
+      var b = document.createElement('button');
+      b.type = 'button';
+      b.textContent = c[0];
+      b.addEventListener('click', function () {
+        if (c[1]) self.zoom(c[1]);
+        else { self.scale = Math.min(1, self.fit); self.layout(); self.render(); }
+      });
+      bar.appendChild(b);
+    });
+    el.parentNode.insertBefore(bar, el);
+  };
+
+  // Zoom by `factor`, keeping the point under (x, y) in the viewport fixed
+  Viewer.prototype.zoom = function (factor, x, y) {
+    var el = this.el;
+    if (x === undefined) { x = el.clientWidth / 2; y = el.clientHeight / 2; }
+    var next = Math.max(Math.min(1, this.fit) / 2, Math.min(4, this.scale * factor));
+    var ix = (el.scrollLeft + x) / this.scale, iy = (el.scrollTop + y) / this.scale;
+    this.scale = next;
+    this.layout();
+    el.scrollLeft = ix * next - x;
+    el.scrollTop = iy * next - y;
+    this.render();
+  };
+
+  // Size the canvas and reposition loaded tiles for the current scale
+  Viewer.prototype.layout = function () {
+    this.canvas.style.width = Math.round(this.width * this.scale) + 'px';
+    this.canvas.style.height = Math.round(this.height * this.scale) + 'px';
+    for (var level in this.layers) {
+      var imgs = this.layers[level].children;
+      for (var i = 0; i < imgs.length; i++) this.place(imgs[i], +level);
+    }
+  };
+
+  Viewer.prototype.schedule = function () {
+    if (this.pending) return;
+    this.pending = true;
+    var self = this;
+    requestAnimationFrame(function () { self.pending = false; self.render(); });
+  };
+
+  Viewer.prototype.layer = function (level) {
+    var layer = this.layers[level];
+    if (!layer) {
+      layer = this.layers[level] = document.createElement('div');
+      layer.className = 'tile-layer';
+      layer.style.zIndex = this.levels - level;
+      this.canvas.appendChild(layer);
+    }
+    return layer;
+  };
+
+  Viewer.prototype.place = function (img, level) {
+    var s = Math.pow(2, level) * this.scale, t = this.tile;
+    var col = +img.dataset.col, row = +img.dataset.row;
+    var w = Math.min(t, Math.ceil(this.width / Math.pow(2, level)) - col * t);
+    var h = Math.min(t, Math.ceil(this.height / Math.pow(2, level)) - row * t);
+    img.style.left = col * t * s + 'px';
+    img.style.top = row * t * s + 'px';
+    img.style.width = w * s + 'px';
+    img.style.height = h * s + 'px';
+  };
+
+  // Request the tiles of `level` that intersect the visible area
+  Viewer.prototype.load = function (level) {
+    var el = this.el, s = Math.pow(2, level) * this.scale, span = this.tile * s;
+    var cols = Math.ceil(this.width / Math.pow(2, level) / this.tile);
+    var rows = Math.ceil(this.height / Math.pow(2, level) / this.tile);
+    var c0 = Math.max(0, Math.floor(el.scrollLeft / span));
+    var c1 = Math.min(cols - 1, Math.floor((el.scrollLeft + el.clientWidth) / span));
+    var r0 = Math.max(0, Math.floor(el.scrollTop / span));
+    var r1 = Math.min(rows - 1, Math.floor((el.scrollTop + el.clientHeight) / span));
+    var layer = this.layer(level);
+    for (var r = r0; r <= r1; r++) {
+      for (var c = c0; c <= c1; c++) {
+        var key = 't' + c + '_' + r;
+        if (layer.querySelector('.' + key)) continue;
+        var img = document.createElement('img');
+        img.className = key;
+        img.alt = '';
+        img.decoding = 'async';
+        img.dataset.col = c;
+        img.dataset.row = r;
+        this.place(img, level);
+        img.src = this.base + level + '/' + c + '_' + r + '.' + this.format;
+        layer.appendChild(img);
+      }
+    }
+  };
+
+  Viewer.prototype.render = function () {
+    var level = pickLevel(this.scale, this.levels);
+    this.load(this.levels - 1);
+    if (level !== this.levels - 1) this.load(level);
+    for (var l in this.layers) {
+      l = +l;
+      this.layers[l].hidden = l !== level && l !== this.levels - 1;
+    }
+  };
+
+  function init() {
+    var els = document.querySelectorAll('.tile-viewer');
+    for (var i = 0; i < els.length; i++) new Viewer(els[i]);
+  }
+
+  if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', init);
+  else init();
+})();
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Deep-zoom tile pyramids for the full-page screen screenshots.
+
+Each PNG in img/screens is cut into TILE x TILE tiles at full resolution
+(level 0) and at every halving after that (level n is 1/2**n scale), down to
+the level that fits in a single tile. Tiles go to
+img/tiles/<name>-<hash>-t<tile>q<quality>/<level>/<col>_<row>.<fmt>; the hash
+is the source's, so an unchanged screenshot is never re-cut. Pyramids are
+keyed by the canonical copy of a source (see asset_index.canonical), so a
+byte-identical duplicate shares its original's tiles instead of repeating them.
+img/tiles/manifest.json lists each pyramid and viewer() turns it into the
+markup tiles.js picks up, which fetches only the tiles in view at the current
+zoom.
+
+Cutting needs Pillow; the generators do not. As with images.py, the
+pyramids are committed with the screen pages that show them, since the deploy
+does not cut tiles.
+
+Usage: python tiles.py [--tile 512] [--quality 80]
+"""
+import argparse, hashlib, json, os, shutil, sys
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = features = None
+
+import asset_index, buildtrace
+from outputs import file_digest, write_if_changed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = 'img/screens'
+OUT_DIR = 'img/tiles'
+MANIFEST = os.path.join(ROOT, OUT_DIR, 'manifest.json')
+TILE = 512
+
+_manifest = None
+
+
+def manifest():
+    """The pyramid manifest, {source: {hash, quality, width, height, tile, levels, format, dir}}."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST) as f:
+                _manifest = json.load(f)
+        except FileNotFoundError:
+            _manifest = {}
+    return _manifest
+
+
+def level_count(width, height, tile):
+    """Levels from full size down to the first that fits in one tile."""
+    levels = 1
+    while max(width, height) > tile:
+        width, height = (width + 1) // 2, (height + 1) // 2
+        levels += 1
+    return levels
+
+
+def viewer(src, alt, prefix='', fallback=''):
+    """Tile viewer markup for `src` (e.g. 'img/screens/faqs.png'), or '' if it has no pyramid.
+
+    `fallback` is shown when scripts are off. The page must also load tiles.js.
+    """
+    entry = manifest().get(asset_index.canonical(src))
+    if not entry:
+        return ''
+    return (f'<div class="tile-viewer" role="img" aria-label="{alt}" data-base="{prefix}{entry["dir"]}/" '
+            f'data-width="{entry["width"]}" data-height="{entry["height"]}" data-tile="{entry["tile"]}" '
+            f'data-levels="{entry["levels"]}" data-format="{entry["format"]}">'
+            f'<noscript>{fallback}</noscript></div>')
+
+
+def _digest(path):
+    return file_digest(path, hashlib.blake2b(digest_size=8)).hexdigest()
+
+
+def cut(im, out, tile, fmt, quality):
+    """Write every level of `im` under directory `out`. Returns the number of levels."""
+    levels = level_count(*im.size, tile)
+    level_im = im
+    for level in range(levels):
+        if level:
+            w, h = level_im.size
+            level_im = level_im.resize(((w + 1) // 2, (h + 1) // 2), Image.LANCZOS)
+        os.makedirs(os.path.join(out, str(level)), exist_ok=True)
+        w, h = level_im.size
+        for row in range((h + tile - 1) // tile):
+            for col in range((w + tile - 1) // tile):
+                box = (col * tile, row * tile, min(w, (col + 1) * tile), min(h, (row + 1) * tile))
+                path = os.path.join(out, str(level), f'{col}_{row}.{fmt}')
+                if fmt == 'webp':
+                    level_im.crop(box).save(path, 'WEBP', quality=quality, method=6)
+                else:
+                    level_im.crop(box).save(path, 'PNG', optimize=True)
+    return levels
+
+
+def build(tile=TILE, quality=80):
+    """Cut pyramids for new or changed screenshots and rewrite the manifest. Returns (cut, reused)."""
+    if Image is None:
+        sys.exit('tiles.py needs Pillow to cut tiles: pip install Pillow')
+    fmt = 'webp' if features.check('webp') else 'png'
+    os.makedirs(os.path.join(ROOT, OUT_DIR), exist_ok=True)
+    old, new = manifest(), {}
+    made = reused = 0
+    for name in sorted(os.listdir(os.path.join(ROOT, SOURCE_DIR))):
+        if not name.endswith('.png'):
+            continue
+        src = asset_index.canonical(f'{SOURCE_DIR}/{name}')
+        if src in new:
+            continue
+        digest = _digest(os.path.join(ROOT, src))
+        entry = old.get(src)
+        if (entry and entry['hash'] == digest and entry['tile'] == tile and entry['format'] == fmt
+                and entry.get('quality') == quality
+                and os.path.isdir(os.path.join(ROOT, entry['dir']))):
+            new[src] = entry
+            reused += 1
+            continue
+        # Settings in the name too: a tile URL never changes content (see fingerprint.py)
+        out = f'{OUT_DIR}/{os.path.basename(src)[:-4]}-{digest}-t{tile}q{quality}'
+        shutil.rmtree(os.path.join(ROOT, out), ignore_errors=True)
+        with buildtrace.span('cut', source=src) as s, Image.open(os.path.join(ROOT, src)) as im:
+            im.load()
+            levels = cut(im, os.path.join(ROOT, out), tile, fmt, quality)
+            for d, _, files in os.walk(os.path.join(ROOT, out)):
+                s.add(items=len(files), bytes=sum(os.path.getsize(os.path.join(d, f)) for f in files))
+            new[src] = {'hash': digest, 'quality': quality, 'width': im.width, 'height': im.height, 'tile': tile,
+                        'levels': levels, 'format': fmt, 'dir': out}
+        made += 1
+        print(f'  {src} ({im.width}x{im.height}, {levels} levels)')
+
+    # Pyramids of screenshots that changed or were removed
+    keep = {os.path.basename(e['dir']) for e in new.values()}
+    for name in os.listdir(os.path.join(ROOT, OUT_DIR)):
+        if name not in keep and os.path.isdir(os.path.join(ROOT, OUT_DIR, name)):
+            shutil.rmtree(os.path.join(ROOT, OUT_DIR, name))
+    write_if_changed(MANIFEST, json.dumps(new, indent=1, sort_keys=True) + '\n')
+    global _manifest
+    _manifest = new
+    return made, reused
+
+
+def pick_level(scale, levels, dpr=1):
+    """Coarsest level that still has at least one image pixel per device pixel (as tiles.js does)."""
+    level = 0
+    while level < levels - 1 and scale * dpr * 2 ** (level + 1) <= 1:
+        level += 1
+    return level
+
+
+def first_paint_report(entries, viewport=(960, 900)):
+    """Bytes of the tiles a fit-to-width viewer loads first, vs. the full PNG, per screen."""
+    for src, e in sorted(entries.items()):
+        scale = min(1, viewport[0] / e['width'])
+        level = pick_level(scale, e['levels'])
+        s = 2 ** level
+        # Visible area in level pixels
+        vis_w = min(-(-e['width'] // s), viewport[0] / (scale * s))
+        vis_h = min(-(-e['height'] // s), viewport[1] / (scale * s))
+        base = os.path.join(ROOT, e['dir'], str(level))
+        first = sum(os.path.getsize(os.path.join(base, f'{c}_{r}.{e["format"]}'))
+                    for c in range(-int(-vis_w // e['tile'])) for r in range(-int(-vis_h // e['tile'])))
+        print(f'  {src}: {first / 1e3:,.0f} KB of tiles at level {level} '
+              f'vs {os.path.getsize(os.path.join(ROOT, src)) / 1e3:,.0f} KB PNG')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tile', type=int, default=TILE, help='tile edge in px (default: %(default)s)')
+    parser.add_argument('--quality', type=int, default=80, help='WebP quality (default: %(default)s)')
+    args = parser.parse_args(argv)
+    made, reused = build(args.tile, args.quality)
+    print(f'{made} cut, {reused} reused')
+    first_paint_report(manifest())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Indexed view of token_data.json, loaded once per process.
+
+token_data.json maps each component to its token sets ("tokens",
+"legacy_tokens", "alt_tokens"), each {token path: raw value}. TokenGraph
+indexes that three ways:
+
+  by component   component -> {path: value}, the adjacency list
+  by path        path -> {component: value}; a path can resolve differently per
+                 component (see "_naming_inconsistencies"), so there is no
+                 single global value
+  by value       normalized value -> sorted paths that resolve to it
+
+All lookups are dict hits. rows() turns a detail page's (property, path)
+pairs into token table rows, formatting raw values with display().
+
+Usage: python token_graph.py [path-or-value ...]   (summary, or look values up)
+"""
+import json, os, re, sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TOKEN_DATA = os.path.join(ROOT, 'token_data.json')
+TOKEN_SETS = ('tokens', 'legacy_tokens', 'alt_tokens')
+
+_FONT = re.compile(r'Font\((?P<family>[^,]+), (?P<weight>[^,]+), (?P<size>[^,]+), (?P<line>[^,)]+)[^)]*\)')
+
+_graph = None
+
+
+def normalize(value):
+    """Key for the value index: hex colors lower-cased, with an opaque alpha dropped."""
+    value = value.strip()
+    if value.startswith('#'):
+        value = value.lower()
+        if len(value) == 9 and value.endswith('ff'):
+            value = value[:7]
+    return value
+
+
+def display(value):
+    """A raw token value as the detail pages show it: '8' -> '8px', '#ffffff00' -> 'transparent', Font(...) -> 'Graphik Medium 16/24'."""
+    if value.isdigit():
+        return f'{value}px'
+    if value.startswith('#') and len(value) == 9 and value.endswith('00'):
+        return 'transparent'
+    m = _FONT.fullmatch(value)
+    if m:
+        return f'{m["family"]} {m["weight"]} {m["size"]}/{m["line"]}'
+    return value
+
+
+class TokenGraph:
+    def __init__(self, data):
+        self.components = {}
+        self.paths = {}
+        self.values = {}
+        for component, entry in data.items():
+            if component.startswith('_'):
+                continue
+            tokens = self.components[component] = {}
+            for key in TOKEN_SETS:
+                tokens.update(entry.get(key, {}))
+            for path, value in tokens.items():
+                self.paths.setdefault(path, {})[component] = value
+                self.values.setdefault(normalize(value), set()).add(path)
+        self.values = {v: sorted(paths) for v, paths in self.values.items()}
+
+    def value(self, component, path):
+        """Raw value of `path` on `component`, or None."""
+        return self.components.get(component, {}).get(path)
+
+    def lookup(self, path):
+        """{component: raw value} for every component bound to `path`."""
+        return self.paths.get(path, {})
+
+    def paths_for(self, value):
+        """Token paths that resolve to `value` on some component."""
+        return self.values.get(normalize(value), [])
+
+    def rows(self, component, bindings):
+        """(property, path, display value) rows for a token table.
+
+        `bindings` are (property, path) pairs resolved against `component`;
+        a (property, path, value) triple keeps its hand-written value, for
+        descriptions the raw data cannot produce (e.g. '4-layer drop shadow')
+        and for paths that are not single tokens. A pair whose path is not
+        bound to `component` raises KeyError.
+        """
+        for binding in bindings:
+            if len(binding) == 3:
+                yield binding
+                continue
+            prop, path = binding
+            value = self.value(component, path)
+            if value is None:
+                raise KeyError(f'{component} has no token {path!r}')
+            yield prop, path, display(value)
+
+
+def graph():
+    """The TokenGraph for token_data.json."""
+    global _graph
+    if _graph is None:
+        with open(TOKEN_DATA) as f:
+            _graph = TokenGraph(json.load(f))
+    return _graph
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    g = graph()
+    if not args:
+        shared = sum(1 for comps in g.paths.values() if len(comps) > 1)
+        split = sum(1 for comps in g.paths.values() if len({normalize(v) for v in comps.values()}) > 1)
+        print(f'{len(g.components)} components, {len(g.paths)} token paths ({shared} shared, '
+              f'{split} resolving differently per component), {len(g.values)} distinct values')
+        return 0
+    for arg in args:
+        if arg in g.paths:
+            for component, value in sorted(g.lookup(arg).items()):
+                print(f'  {arg}  {component}: {value}')
+        else:
+            print(f'  {arg}: ' + (', '.join(g.paths_for(arg)) or 'no tokens'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())